@@ -86,6 +86,10 @@ class AbstractFunction(AbstractOcgisObject):
     #: units attribute value. The string flag is used to allow ``None`` units to be applied.
     units = '_input_'
 
+    #: If ``True``, the function implements :meth:`calculate_segmented` and all temporal groups are reduced in a single
+    #: pass over a time-sorted array as opposed to calling :meth:`calculate` for each group.
+    segmented = False
+
     # standard empty dictionary to use for calculation outputs when the operation is file only
     _empty_fill = {'fill': None, 'sample_size': None}
 
@@ -150,6 +154,21 @@ class AbstractFunction(AbstractOcgisObject):
 
         pass
 
+    def calculate_segmented(self, values, starts, **kwargs):
+        """
+        Optional method to overload for segmented temporal reductions. This is only called if :attr:`segmented` is
+        ``True``. Use :func:`~ocgis.calc.base.get_segmented_reduction` for common reductions.
+
+        :param values: The input five-dimensional array with time values sorted by temporal group.
+        :type values: :class:`numpy.ma.core.MaskedArray`
+        :param starts: Index of each temporal group's first member along the time axis of ``values``.
+        :type starts: :class:`numpy.core.multiarray.ndarray`
+        :returns: A five-dimensional array with the time axis reduced to the number of temporal groups.
+        :rtype: :class:`numpy.ma.core.MaskedArray`
+        """
+
+        raise NotImplementedError
+
     def execute(self):
         """
         Execute the computation over the input field.
@@ -476,6 +495,12 @@ class AbstractFunction(AbstractOcgisObject):
             else:
                 arr_fill_sample_size = None
 
+            # Determine if the temporal groups may be reduced as segments.
+            if self.segmented and f == self.calculate and not self.spatial_aggregation:
+                segments = get_temporal_group_segments(self.tgd.dgroups, variable.shape[time_axis])
+            else:
+                segments = None
+
             # Extra dimensions are not standard field dimensions.
             for yld in self._iter_conformed_arrays_(crosswalk, variable.shape, arr, arr_fill, arr_fill_sample_size):
                 if not self.calc_sample_size:
@@ -487,6 +512,21 @@ class AbstractFunction(AbstractOcgisObject):
                 # Some variables need access to the entire 5d conformed array.
                 self._current_conformed_array = carr
 
+                if segments is not None:
+                    # Reduce all temporal groups in a single pass over the time-sorted array.
+                    order, starts = segments
+                    if order is not None:
+                        carr = carr[:, order, :, :, :]
+                    res = self.calculate_segmented(carr, starts, **parms)
+                    carr_fill.data[:] = res.data
+                    carr_fill.mask[:] = res.mask
+                    if self.calc_sample_size:
+                        carr_mask = np.ma.getmaskarray(carr)
+                        ss = np.add.reduceat(np.invert(carr_mask), starts, axis=1, dtype=int)
+                        carr_fill_sample_size.data[:] = ss
+                        carr_fill_sample_size.mask[:] = carr_mask[:, starts, :, :, :]
+                    continue
+
                 # Standard field dimension iterators.
                 standard_itrs = [list(range(carr.shape[ii])) for ii in [0, 2]]
                 standard_itrs.append(list(range(self.tgd.shape[0])))
@@ -929,3 +969,71 @@ class AbstractKeyedOutputFunction(AbstractOcgisObject):
     @abc.abstractproperty
     def structure_dtype(self):
         dict
+
+
+def get_segmented_reduction(values, starts, operation):
+    """
+    Reduce contiguous segments along the time axis of a five-dimensional array. Masked values are excluded from the
+    reduction. Segments containing only masked values are masked in the output.
+
+    :param values: The input five-dimensional array.
+    :type values: :class:`numpy.ma.core.MaskedArray`
+    :param starts: Index of each segment's first member along the time axis.
+    :type starts: :class:`numpy.core.multiarray.ndarray`
+    :param str operation: One of ``'sum'``, ``'mean'``, ``'max'``, ``'min'``, or ``'std'``.
+    :rtype: :class:`numpy.ma.core.MaskedArray`
+    """
+
+    axis = 1
+    mask = np.ma.getmaskarray(values)
+    data = np.ma.getdata(values)
+    counts = np.add.reduceat(np.invert(mask), starts, axis=axis, dtype=int)
+    empty = counts == 0
+
+    if operation in ('sum', 'mean', 'std'):
+        ret = np.add.reduceat(np.where(mask, 0, data), starts, axis=axis)
+        if operation in ('mean', 'std'):
+            with np.errstate(divide='ignore', invalid='ignore'):
+                ret = ret / counts
+                if operation == 'std':
+                    lengths = np.diff(np.append(starts, data.shape[axis]))
+                    anomaly = np.where(mask, 0, data - np.repeat(ret, lengths, axis=axis))
+                    ret = np.sqrt(np.add.reduceat(anomaly ** 2, starts, axis=axis) / counts)
+    elif operation in ('max', 'min'):
+        if np.issubdtype(data.dtype, np.integer):
+            limits = np.iinfo(data.dtype)
+            limits = (limits.min, limits.max)
+        else:
+            limits = (-np.inf, np.inf)
+        if operation == 'max':
+            ret = np.maximum.reduceat(np.where(mask, limits[0], data), starts, axis=axis)
+        else:
+            ret = np.minimum.reduceat(np.where(mask, limits[1], data), starts, axis=axis)
+    else:
+        raise NotImplementedError(operation)
+
+    ret[empty] = 0
+    return np.ma.array(ret, mask=empty)
+
+
+def get_temporal_group_segments(dgroups, size):
+    """
+    Get the time ordering and segment start indices used for segmented temporal reductions.
+
+    :param dgroups: Sequence of boolean arrays or slices selecting the members of each temporal group.
+    :param int size: The length of the time dimension.
+    :returns: A tuple ``(order, starts)``. ``order`` is ``None`` if the time values are already sorted by group.
+     ``None`` is returned if any temporal group is empty.
+    :rtype: tuple
+    """
+
+    indices = np.arange(size)
+    members = [indices[dgroup] for dgroup in dgroups]
+    lengths = np.array([m.size for m in members], dtype=int)
+    if len(members) == 0 or np.any(lengths == 0):
+        return None
+    order = np.concatenate(members)
+    starts = np.append(0, np.cumsum(lengths)[:-1])
+    if order.size == size and np.all(order == indices):
+        order = None
+    return order, starts
@@ -379,9 +379,14 @@ class Max(base.AbstractUnivariateSetFunction):
     standard_name = 'max'
     long_name = 'max'
 
+    segmented = True
+
     def calculate(self, values):
         return np.ma.max(values, axis=0)
 
+    def calculate_segmented(self, values, starts):
+        return base.get_segmented_reduction(values, starts, 'max')
+
 
 class Min(base.AbstractUnivariateSetFunction):
     description = 'Min value for the series.'
@@ -390,9 +395,14 @@ class Min(base.AbstractUnivariateSetFunction):
     standard_name = 'min'
     long_name = 'Min'
 
+    segmented = True
+
     def calculate(self, values):
         return np.ma.min(values, axis=0)
 
+    def calculate_segmented(self, values, starts):
+        return base.get_segmented_reduction(values, starts, 'min')
+
 
 class Mean(base.AbstractUnivariateSetFunction):
     description = 'Compute mean value of the set.'
@@ -400,9 +410,14 @@ class Mean(base.AbstractUnivariateSetFunction):
     standard_name = 'mean'
     long_name = 'Mean'
 
+    segmented = True
+
     def calculate(self, values):
         return np.ma.mean(values, axis=0)
 
+    def calculate_segmented(self, values, starts):
+        return base.get_segmented_reduction(values, starts, 'mean')
+
 
 class Median(base.AbstractUnivariateSetFunction):
     description = 'Compute median value of the set.'
@@ -422,5 +437,10 @@ class StandardDeviation(base.AbstractUnivariateSetFunction):
     standard_name = 'standard_deviation'
     long_name = 'Standard Deviation'
 
+    segmented = True
+
     def calculate(self, values):
         return np.ma.std(values, axis=0)
+
+    def calculate_segmented(self, values, starts):
+        return base.get_segmented_reduction(values, starts, 'std')
@@ -32,6 +32,7 @@ class Threshold(base.AbstractUnivariateSetFunction, base.AbstractParameterizedFu
     standard_name = 'threshold'
     long_name = 'threshold'
     parms_required = ('threshold', 'operation')
+    segmented = True
 
     def calculate(self, values, threshold=None, operation=None):
         """
@@ -41,6 +42,16 @@ class Threshold(base.AbstractUnivariateSetFunction, base.AbstractParameterizedFu
         :type operation: str
         """
 
+        idx = self._get_logical_(values, threshold, operation)
+        ret = np.ma.sum(idx, axis=0)
+        return ret
+
+    def calculate_segmented(self, values, starts, threshold=None, operation=None):
+        idx = self._get_logical_(values, threshold, operation)
+        return base.get_segmented_reduction(idx.astype(int), starts, 'sum')
+
+    @staticmethod
+    def _get_logical_(values, threshold, operation):
         # perform requested logical operation
         if operation == 'gt':
             idx = values > threshold
@@ -52,9 +63,7 @@ class Threshold(base.AbstractUnivariateSetFunction, base.AbstractParameterizedFu
             idx = values <= threshold
         else:
             raise NotImplementedError
-
-        ret = np.ma.sum(idx, axis=0)
-        return ret
+        return idx
 
     def _aggregate_spatial_(self, values, weights):
         return np.ma.sum(values)
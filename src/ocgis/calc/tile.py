@@ -2,6 +2,10 @@ import itertools
 
 import numpy as np
 
+from ocgis import env
+from ocgis.constants import SourceIndexType
+from ocgis.util.helpers import get_iter, get_group
+
 
 def get_tile_schema(nrow, ncol, tdim, origin=0):
     ret = {}
@@ -30,3 +34,157 @@ def get_slices(arr):
         except IndexError:
             break
     return (ret)
+
+
+def get_chunk_schema(field, chunking):
+    """
+    Get the dimension index bounds for each chunk of a field. Chunks are created along the field's spatial dimensions
+    and, optionally, its time dimension. If :attr:`ocgis.env.USE_CHUNK_ALIGNMENT` is ``True``, chunk sizes are rounded
+    down to multiples of the source chunk sizes (see :func:`~ocgis.calc.tile.get_source_chunk_sizes`) and chunk
+    boundaries are aligned to source chunk boundaries.
+
+    :param field: The field to chunk.
+    :type field: :class:`~ocgis.Field`
+    :param dict chunking: The chunking definition. See :class:`~ocgis.ops.parms.definition.Chunking`.
+    :returns: A sequence of dictionaries mapping dimension names to ``(start, stop)`` index tuples.
+    :rtype: list
+    """
+
+    # Dimensions to chunk along with their chunk sizes.
+    to_chunk = []
+
+    time_size = None
+    if chunking.get('time') is not None and field.time is not None:
+        time_dimension = field.time.dimensions[0]
+        time_size = min(chunking['time'], len(time_dimension))
+        to_chunk.append((time_dimension, time_size))
+
+    if field.grid is not None:
+        spatial_dimensions = field.grid.dimensions
+    elif field.geom is not None:
+        spatial_dimensions = field.geom.dimensions
+    else:
+        spatial_dimensions = []
+
+    if len(spatial_dimensions) > 0:
+        spatial = chunking.get('spatial')
+        if spatial is None and chunking.get('memory') is not None:
+            spatial = get_chunk_size_from_memory(field, spatial_dimensions, chunking['memory'], time_size=time_size)
+        if spatial is not None:
+            spatial = list(get_iter(spatial))
+            if len(spatial) == 1:
+                spatial = spatial * len(spatial_dimensions)
+            if len(spatial) != len(spatial_dimensions):
+                msg = 'Spatial chunk sizes {} do not match the number of spatial dimensions ({}).'
+                raise ValueError(msg.format(spatial, len(spatial_dimensions)))
+            to_chunk += list(zip(spatial_dimensions, spatial))
+
+    if env.USE_CHUNK_ALIGNMENT:
+        source_chunk_sizes = get_source_chunk_sizes(field)
+    else:
+        source_chunk_sizes = {}
+
+    bounds = []
+    for dimension, size in to_chunk:
+        length = len(dimension)
+        starts = [0]
+        source_chunk_size = source_chunk_sizes.get(dimension.name)
+        if source_chunk_size is not None and size >= source_chunk_size:
+            size = size // source_chunk_size * source_chunk_size
+            # The first chunk ends on the first source chunk boundary following the dimension's source offset.
+            first = (size - dimension._src_idx[0] % size) % size
+            starts += list(range(first or size, length, size))
+        else:
+            starts += list(range(size, length, size))
+        stops = starts[1:] + [length]
+        bounds.append([(dimension.name, (int(start), int(stop))) for start, stop in zip(starts, stops)])
+
+    ret = [dict(chunk) for chunk in itertools.product(*bounds)]
+    return ret
+
+
+def get_chunk_size_from_memory(field, spatial_dimensions, memory, time_size=None):
+    """
+    Get the spatial chunk size limiting a chunk's data variable values to a memory budget.
+
+    :param field: The field to chunk.
+    :type field: :class:`~ocgis.Field`
+    :param spatial_dimensions: The field's spatial dimensions.
+    :type spatial_dimensions: sequence of :class:`~ocgis.Dimension`
+    :param int memory: The memory budget in bytes.
+    :param int time_size: The time chunk size if the field is also chunked along time.
+    :returns: The chunk size to use for each spatial dimension.
+    :rtype: int
+    """
+
+    spatial_names = [d.name for d in spatial_dimensions]
+    if time_size is not None:
+        time_name = field.time.dimensions[0].name
+    else:
+        time_name = None
+
+    # Bytes required to hold data variable values for a single spatial element.
+    element_bytes = 0
+    for variable in field.data_variables:
+        nelements = 1
+        for dimension in variable.dimensions:
+            if dimension.name in spatial_names:
+                continue
+            elif dimension.name == time_name:
+                nelements *= time_size
+            else:
+                nelements *= len(dimension)
+        element_bytes += nelements * np.dtype(variable.dtype).itemsize
+
+    nspatial = max(1, memory // max(1, element_bytes))
+    ret = max(1, int(nspatial ** (1.0 / len(spatial_dimensions))))
+    return ret
+
+
+def get_source_chunk_sizes(field):
+    """
+    Get the source chunk sizes of a field's dimensions from the request dataset drivers of its data variables (see
+    :meth:`~ocgis.driver.base.AbstractDriver.get_dimension_chunk_sizes`). Only dimensions with contiguous source
+    indices are included.
+
+    :param field: The target field.
+    :type field: :class:`~ocgis.Field`
+    :returns: Dictionary mapping dimension names to source chunk sizes.
+    :rtype: dict
+    """
+
+    ret = {}
+    for variable in field.data_variables:
+        rd = getattr(variable, '_request_dataset', None)
+        if rd is None or rd.uri is None:
+            continue
+        group_metadata = get_group(rd.metadata, variable.group, has_root=False)
+        chunk_sizes = rd.driver.get_dimension_chunk_sizes(group_metadata)
+        for dimension in variable.dimensions:
+            if dimension._src_idx_type != SourceIndexType.BOUNDS:
+                continue
+            chunk_size = chunk_sizes.get(dimension.source_name)
+            if chunk_size is not None:
+                ret.setdefault(dimension.name, chunk_size)
+    return ret
+
+
+def get_field_chunk(field, chunk):
+    """
+    Slice a field using a chunk returned by :func:`~ocgis.calc.tile.get_chunk_schema`. The local bounds of the sliced
+    dimensions are set to the chunk's position in the original field allowing the chunk to be written in place.
+
+    :param field: The field to slice.
+    :type field: :class:`~ocgis.Field`
+    :param dict chunk: Dictionary mapping dimension names to ``(start, stop)`` index tuples.
+    :rtype: :class:`~ocgis.Field`
+    """
+
+    ret = field[{name: slice(*bounds) for name, bounds in chunk.items()}]
+    for name, (start, stop) in chunk.items():
+        source = field.dimensions[name]
+        target = ret.dimensions[name]
+        offset = source.bounds_local[0]
+        target.bounds_global = source.bounds_global
+        target.bounds_local = (offset + start, offset + stop)
+    return ret
@@ -86,13 +86,48 @@ class OutputFormatName(object):
     OCGIS = 'ocgis'
 
 
+class ExecutorName(object):
+    SERIAL = 'serial'
+    PROCESS = 'process'
+
+
 #: These output formats are considered vector output formats affected by operations manipulation vector GIS data. For
 #: example, vector GIS outputs are always wrapped to -180 to 180 if there is a spherical coordinate system.
 VECTOR_OUTPUT_FORMATS = [OutputFormatName.GEOJSON, OutputFormatName.SHAPEFILE, OutputFormatName.CSV_SHAPEFILE]
 
+#: The number of records formatted in each block when writing tabular files.
+TABULAR_WRITE_BLOCK_SIZE = 50000
+
+#: The number of coordinates transformed at once when transforming coordinate arrays.
+COORDINATE_TRANSFORM_BLOCK_SIZE = 65536
+
+#: The maximum number of spatial references, coordinate transformations, and coordinate system comparisons cached for
+#: reuse by coordinate systems.
+SPATIAL_REFERENCE_CACHE_SIZE = 512
+
+#: Neighboring stations are read in a single window if the window contains at most this many elements per station.
+STATION_WINDOW_ELEMENTS_PER_STATION = 16
+
+#: File formats that may be written in parallel with netCDF4-python's MPI capability.
+NETCDF4_MPI_FORMATS = ('NETCDF4', 'NETCDF4_CLASSIC')
+
+#: The default maximum fraction of unrequested elements read when coalescing fancy source indices into blocks.
+COALESCED_READ_WASTE_THRESHOLD = 0.5
+
 # Download URL for test datasets.
 TEST_DATA_DOWNLOAD_PREFIX = None
 
+#: Weight file global attribute identifying the inputs used to generate regridding weights.
+REGRID_WEIGHT_KEY_ATTR = 'ocgis_regrid_weight_key'
+#: Weight file global attribute identifying the regrid engine that wrote the weights. See
+#: :class:`~ocgis.constants.RegridEngine`.
+REGRID_WEIGHT_ENGINE_ATTR = 'ocgis_regrid_weight_engine'
+
+#: The number of non-grid elements (i.e. time steps) regridded at once when applying sparse weights.
+SPARSE_REGRID_BLOCK_SIZE = 256
+#: The maximum number of weight files held in memory for sparse regridding.
+SPARSE_WEIGHTS_CACHE_SIZE = 4
+
 #: The day value to use for month centroids.
 CALC_MONTH_CENTROID = 16
 #: The month value to use for year centroids.
@@ -123,6 +158,8 @@ DEFAULT_GEOMETRY_KEY = 'geom'
 
 # The default string width for Fiona output.
 FIONA_STRING_LENGTH = 50
+#: The number of records written to Fiona collections per call.
+FIONA_WRITE_BATCH_SIZE = 10000
 
 # Attributes to remove when a value is changed if they are present in the attributes dictionary. These attributes are
 # tuned to specific value ranges and will not apply when a value is changed.
@@ -161,6 +198,7 @@ class AttributeName(object):
 class DimensionName(object):
     UGRID_MAX_ELEMENT_COORDS = 'ocgis_max_element_coords'
     GEOMETRY_DIMENSION = 'ocgis_ngeom'
+    STATION = 'station'
     TEMPORAL = 'time'
     UNIONED_GEOMETRY = 'ocgis_geom_union'
 
@@ -207,6 +245,7 @@ class WrapAction(IntEnum):
 class DimensionMapKey(object):
     ATTRIBUTE_HOST = 'attribute_host'
     ATTRS = 'attrs'
+    BLOCK_SIZE = 'block_size'
     BOUNDS = 'bounds'
     CRS = 'crs'
     DIMENSION = 'dimension'
@@ -499,6 +538,11 @@ class GridSplitterConstants(object):
         ESMF_ROLE_SRC_BOUNDS_Y = 'src_y_split_bounds'
 
 
+class RegridEngine(object):
+    ESMF = 'esmf'
+    SPARSE = 'sparse'
+
+
 class RegriddingRole(Enum):
     SOURCE = 'src'
     DESTINATION = 'dst'
@@ -5,6 +5,7 @@ import os.path
 from pprint import pformat
 
 import fiona
+import numpy as np
 import six
 
 from ocgis import constants, vm
@@ -12,10 +13,11 @@ from ocgis import env
 from ocgis import messages
 from ocgis.base import AbstractOcgisObject
 from ocgis.collection.spatial import SpatialCollection
-from ocgis.constants import TagName, MPIWriteMode, KeywordArgument, SubcommName
+from ocgis.constants import TagName, MPIWriteMode, KeywordArgument, SubcommName, HeaderName
 from ocgis.driver.vector import DriverVector
 from ocgis.util.helpers import get_iter, get_tuple
 from ocgis.util.logging_ocgis import ocgis_lh
+from ocgis.variable.base import Variable
 from ocgis.vmachine.mpi import MPI_RANK
 
 FIONA_FIELD_TYPES_REVERSED = {v: k for k, v in fiona.FIELD_TYPES_MAP.items()}
@@ -123,6 +125,10 @@ class AbstractCollectionConverter(AbstractFileConverter):
                 continue
             yield coll
 
+    @property
+    def _is_chunked(self):
+        return self.ops is not None and self.ops.chunking is not None
+
     @property
     def geom_uid(self):
         none_target = self.ops
@@ -142,6 +148,30 @@ class AbstractCollectionConverter(AbstractFileConverter):
         Remove previous output file from :attr:`ocgis.conv.base.AbstractFileConverter`.
         """
 
+    def _create_ugid_(self, geom, name=HeaderName.ID_GEOMETRY, start=1):
+        """
+        Create a unique identifier for the geometry variable. For chunked operations, identifiers are computed from the
+        chunk's position in the global dimensions so they are unique across chunks.
+
+        :param geom: The target geometry variable.
+        :type geom: :class:`~ocgis.GeometryVariable`
+        :param str name: Name for the unique identifier variable.
+        :param int start: Starting value for the unique identifier.
+        :rtype: :class:`~ocgis.Variable`
+        """
+
+        if not self._is_chunked:
+            return geom.create_ugid_global(name, start=start)
+
+        dimensions = geom.dimensions
+        local_index = np.indices([len(d) for d in dimensions])
+        global_index = [local_index[idx] + d.bounds_local[0] - d.bounds_global[0] for idx, d in enumerate(dimensions)]
+        global_shape = [d.bounds_global[1] - d.bounds_global[0] for d in dimensions]
+        value = np.ravel_multi_index(global_index, global_shape) + start
+        ret = Variable(name=name, value=value, dimensions=dimensions)
+        geom.set_ugid(ret)
+        return ret
+
     def _get_return_(self):
         return self.path
 
@@ -163,6 +193,8 @@ class AbstractCollectionConverter(AbstractFileConverter):
 
         # Indicates if user geometries should be written to file.
         write_ugeom = False
+        # Chunks share user geometries. Track those already written.
+        written_ugids = set()
 
         # Path to the output object.
         f = {KeywordArgument.PATH: self.path}
@@ -201,7 +233,11 @@ class AbstractCollectionConverter(AbstractFileConverter):
             if write_ugeom:
                 with vm.scoped(SubcommName.UGEOM_WRITE, [0]):
                     if not vm.is_null:
-                        for subset_field in list(coll.children.values()):
+                        for ugid, subset_field in list(coll.children.items()):
+                            if self._is_chunked:
+                                if ugid in written_ugids:
+                                    continue
+                                written_ugids.add(ugid)
                             subset_field.write(ugeom_fiona_path, write_mode=write_mode, driver=DriverVector)
 
         # The metadata and dataset descriptor files may only be written if OCGIS operations are present.
@@ -31,7 +31,7 @@ class CsvConverter(AbstractTabularConverter):
                 repeater = None
 
             if add_geom_uid and field.geom is not None and field.geom.ugid is None:
-                global_ugid = field.geom.create_ugid_global(HeaderName.ID_GEOMETRY)
+                global_ugid = self._create_ugid_(field.geom)
                 if field.grid is not None:
                     archetype = field.grid.archetype
                     if hasattr(archetype, '_request_dataset'):
@@ -65,7 +65,9 @@ class CsvShapefileConverter(CsvConverter):
 
         # Load the geometries. The geometry identifier is needed for the data write.
         for field, container in coll.iter_fields(yield_container=True):
-            field.set_abstraction_geom(create_ugid=True)
+            field.set_abstraction_geom()
+            if field.geom.ugid is None:
+                self._create_ugid_(field.geom)
 
         # Write the output CSV file.
         ocgis_lh(msg='before CsvShapefileConverter super call in {}'.format(self.__class__), logger='csv-shp.converter',
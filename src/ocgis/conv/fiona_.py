@@ -4,7 +4,7 @@ from abc import abstractproperty
 
 import six
 
-from ocgis.constants import KeywordArgument, HeaderName
+from ocgis.constants import KeywordArgument
 from ocgis.conv.base import AbstractTabularConverter
 from ocgis.driver.vector import DriverVector
 from ocgis.exc import DefinitionValidationError
@@ -43,13 +43,14 @@ class AbstractFionaConverter(AbstractTabularConverter):
             if len(field.data_variables) == 0:
                 set_ugid_as_data = True
 
-            field.set_abstraction_geom(create_ugid=True, set_ugid_as_data=set_ugid_as_data)
+            field.set_abstraction_geom()
+            if field.geom.ugid is None:
+                self._create_ugid_(field.geom)
+            if set_ugid_as_data:
+                field.add_variable(field.geom.ugid, force=True, is_data=True)
 
             ocgis_lh(msg='after field.set_abstraction_geom in {}'.format(self.__class__), level=logging.DEBUG)
 
-            if add_geom_uid and field.geom is not None and field.geom.ugid is None:
-                field.geom.create_ugid_global(HeaderName.ID_GEOMETRY)
-
             if container.geom is not None:
                 repeater = [(self.geom_uid, container.geom.ugid.get_value().tolist()[0])]
             else:
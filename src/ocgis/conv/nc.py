@@ -11,7 +11,7 @@ from ocgis.calc.engine import CalculationEngine
 from ocgis.calc.eval_function import MultivariateEvalFunction
 from ocgis.constants import DimensionName
 from ocgis.constants import HeaderName, VariableName
-from ocgis.constants import KeywordArgument
+from ocgis.constants import KeywordArgument, MPIWriteMode
 from ocgis.conv.base import AbstractCollectionConverter
 from ocgis.driver.nc import DriverNetcdf
 from ocgis.environment import get_dtype
@@ -107,7 +107,9 @@ class NcConverter(AbstractCollectionConverter):
             msg = 'If aggregate is True than a geometry must be provided for netCDF output. '
             _raise_(msg, OutputFormat)
 
-        if not ops.aggregate and not ops.agg_selection and ops.geom and len(ops.geom) > 1:
+        # Stations are written along a station dimension.
+        if (not ops.aggregate and not ops.agg_selection and not ops.extract_stations and ops.geom and
+                len(ops.geom) > 1):
             msg = 'Multiple geometries must either be unioned (agg_selection=True) ' \
                   'or aggregated (aggregate=True).'
             _raise_(msg, OutputFormat)
@@ -284,6 +286,18 @@ class NcConverter(AbstractCollectionConverter):
         # This is the output path. The driver handles MPI writing.
         path = write_kwargs.get(KeywordArgument.PATH)
 
+        # Chunks are written in place. Create the file from the global dimensions of the first chunk before filling.
+        # Later chunks fill the existing file. Appending would recreate it.
+        if self._is_chunked:
+            write_mode = write_kwargs.get(KeywordArgument.WRITE_MODE)
+            if write_mode is None:
+                template_kwargs = write_kwargs.copy()
+                template_kwargs[KeywordArgument.WRITE_MODE] = MPIWriteMode.TEMPLATE
+                arch.write(path, **template_kwargs)
+                write_kwargs[KeywordArgument.WRITE_MODE] = MPIWriteMode.FILL
+            elif write_mode == MPIWriteMode.APPEND:
+                write_kwargs[KeywordArgument.WRITE_MODE] = MPIWriteMode.FILL
+
         # Write the field.
         arch.write(path, **write_kwargs)
 
@@ -1,4 +1,5 @@
 import abc
+import hashlib
 import json
 from abc import ABCMeta
 from contextlib import contextmanager
@@ -8,12 +9,14 @@ from warnings import warn
 import six
 
 from ocgis import constants, GridUnstruct
+from ocgis import env
 from ocgis import vm
 from ocgis.base import AbstractOcgisObject, raise_if_empty
 from ocgis.base import get_variable_names
 from ocgis.collection.field import Field
 from ocgis.constants import MPIWriteMode, TagName, KeywordArgument, OcgisConvention
 from ocgis.driver.dimension_map import DimensionMap
+from ocgis.driver.metadata_cache import get_metadata_cache
 from ocgis.exc import DefinitionValidationError, NoDataVariablesFound, DimensionMapError, VariableMissingMetadataError, \
     GridDeficientError
 from ocgis.util.helpers import get_group
@@ -68,13 +71,44 @@ class AbstractDriver(AbstractOcgisObject):
     @property
     def dimension_map_raw(self):
         if self._dimension_map_raw is None:
-            self._dimension_map_raw = create_dimension_map_raw(self, self.metadata_raw)
+            cache, key = self._get_metadata_cache_and_key_()
+            if key is None:
+                name = None
+                ret = None
+            else:
+                # The raw dimension map depends on the request dataset's coordinate system options.
+                if self.rd._has_assigned_coordinate_system:
+                    crs = repr(self.rd._crs)
+                else:
+                    crs = None
+                name = self._get_metadata_cache_name_('dimension_map', self.rd._has_assigned_coordinate_system, crs,
+                                                      self.rd.rotated_pole_priority)
+                ret = cache.get(key, name)
+            if ret is None:
+                ret = create_dimension_map_raw(self, self.metadata_raw)
+                if key is not None:
+                    cache.set(key, name, ret)
+            self._dimension_map_raw = ret
         return self._dimension_map_raw
 
     @property
     def dist(self):
         if self._dist is None:
-            self._dist = self.create_dist()
+            cache, key = self._get_metadata_cache_and_key_()
+            if key is None:
+                name = None
+                ret = None
+            else:
+                # Distributions depend on the request dataset's dimension map, the virtual machine, and chunk
+                # alignment.
+                name = self._get_metadata_cache_name_('dist', vm.size, list(vm.ranks), self.rd.dimension_map.as_dict(),
+                                                      env.USE_CHUNK_ALIGNMENT)
+                ret = cache.get(key, name)
+            if ret is None:
+                ret = self.create_dist()
+                if key is not None:
+                    cache.set(key, name, ret)
+            self._dist = ret
         return self._dist
 
     @abc.abstractproperty
@@ -207,6 +241,8 @@ class AbstractDriver(AbstractOcgisObject):
                         distributed_dimension = ompi.get_dimension(distributed_dimension_name, group=group_index,
                                                                    rank=target_rank)
                         distributed_dimension.dist = True
+                    if env.USE_CHUNK_ALIGNMENT:
+                        ompi.set_chunk_sizes(self.get_dimension_chunk_sizes(group_meta), group=group_index)
 
         ompi.update_dimension_bounds()
         return ompi
@@ -360,6 +396,14 @@ class AbstractDriver(AbstractOcgisObject):
         """
         return tuple(group_metadata['variables'].keys())
 
+    @staticmethod
+    def get_dimension_chunk_sizes(group_metadata):
+        """
+        Return a dictionary mapping dimension names to their source chunk sizes. Dimensions without a known chunk size
+        are not included.
+        """
+        return {}
+
     def get_distributed_dimension_name(self, dimension_map, dimensions_metadata):
         """Return the preferred distributed dimension name."""
         return None
@@ -403,7 +447,12 @@ class AbstractDriver(AbstractOcgisObject):
         :rtype: dict
         """
 
-        metadata_subclass = self._get_metadata_main_()
+        cache, key = self._get_metadata_cache_and_key_()
+        metadata_subclass = None if key is None else cache.get(key, 'metadata')
+        if metadata_subclass is None:
+            metadata_subclass = self._get_metadata_main_()
+            if key is not None:
+                cache.set(key, 'metadata', metadata_subclass)
 
         # Use the predicate (filter) if present on the request dataset.
         # TODO: Should handle groups?
@@ -667,6 +716,36 @@ class AbstractDriver(AbstractOcgisObject):
         :rtype: dict
         """
 
+    def _get_metadata_cache_and_key_(self):
+        """
+        :return: The metadata cache and the request dataset's cache key. The key is ``None`` if caching is disabled or
+         the request dataset is not sourced from local files.
+        :rtype: tuple
+        """
+
+        cache = get_metadata_cache()
+        if cache is None or self.rd._uri is None or self.rd.opened is not None:
+            key = None
+        else:
+            driver_kwargs = self.rd.driver_kwargs
+            if driver_kwargs is not None:
+                driver_kwargs = sorted(driver_kwargs.items())
+            key = cache.get_key(self.rd.uri, self.key, repr(driver_kwargs))
+        return cache, key
+
+    def _get_metadata_cache_name_(self, prefix, *args):
+        """
+        :param str prefix: The prefix for the cached object's name.
+        :param args: Request dataset options and other inputs the cached object depends on.
+        :return: The name of an object derived from the request dataset's metadata. The name also depends on the
+         variables remaining after the request dataset predicate is applied.
+        :rtype: str
+        """
+
+        variable_names = sorted(self.metadata_raw.get('variables', {}).keys())
+        sha = hashlib.sha1(repr((variable_names,) + args).encode())
+        return '{}-{}'.format(prefix, sha.hexdigest())
+
     @classmethod
     def _get_field_write_target_(cls, field):
         return field
@@ -3,6 +3,7 @@ from collections import OrderedDict
 
 import six
 
+from ocgis import constants
 from ocgis import vm
 from ocgis.base import raise_if_empty
 from ocgis.constants import MPIWriteMode, KeywordArgument, DriverKey
@@ -59,22 +60,45 @@ class DriverCSV(AbstractTabularDriver):
     def _write_variable_collection_main_(cls, vc, opened_or_path, write_mode, **kwargs):
         raise_if_empty(vc)
 
-        iter_kwargs = kwargs.pop(KeywordArgument.ITER_KWARGS, {})
+        # Records are formatted and written in blocks of columns.
+        iter_kwargs = kwargs.pop(KeywordArgument.ITER_KWARGS, {}).copy()
+        if iter_kwargs.get(KeywordArgument.BLOCK_SIZE) is None:
+            iter_kwargs[KeywordArgument.BLOCK_SIZE] = constants.TABULAR_WRITE_BLOCK_SIZE
 
         fieldnames = list(six.next(vc.iter(**iter_kwargs))[1].keys())
 
         if vm.rank == 0 and write_mode != MPIWriteMode.FILL:
             with driver_scope(cls, opened_or_path, mode='w') as opened:
-                writer = csv.DictWriter(opened, fieldnames)
-                writer.writeheader()
+                writer = csv.writer(opened)
+                writer.writerow(fieldnames)
         if write_mode != MPIWriteMode.TEMPLATE:
             for current_rank_write in vm.ranks:
                 if vm.rank == current_rank_write:
                     with driver_scope(cls, opened_or_path, mode='a') as opened:
-                        writer = csv.DictWriter(opened, fieldnames)
-                        for _, record in vc.iter(**iter_kwargs):
-                            writer.writerow(record)
+                        writer = csv.writer(opened)
+                        for _, block in vc.iter(**iter_kwargs):
+                            writer.writerows(get_block_rows(block, fieldnames))
                 vm.barrier()
 
     def _init_variable_from_source_main_(self, *args, **kwargs):
         pass
+
+
+def get_block_rows(block, fieldnames):
+    """
+    Convert a block of record columns to rows ordered by ``fieldnames``. Keys missing from the block are written as
+    empty values.
+
+    :param block: Record columns from :meth:`~ocgis.variable.iterator.Iterator.iter_blocks`.
+    :type block: :class:`collections.OrderedDict`
+    :param sequence fieldnames: The CSV header.
+    :rtype: list
+    :raises: ValueError
+    """
+
+    extra = [k for k in block if k not in fieldnames]
+    if len(extra) > 0:
+        raise ValueError('Record keys are not in the CSV header: {}'.format(extra))
+    nrecords = len(next(iter(block.values())))
+    columns = [block.get(k, [None] * nrecords) for k in fieldnames]
+    return list(zip(*columns))
@@ -0,0 +1,156 @@
+import numpy as np
+
+from ocgis.base import AbstractOcgisObject
+
+
+class ReadStatistics(AbstractOcgisObject):
+    """
+    Counts source reads and the bytes they return. Use :func:`~ocgis.driver.hyperslab.get_read_statistics` to access
+    the statistics for netCDF variable value reads.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.nbytes = 0
+
+    def add(self, value):
+        """
+        Record a single read.
+
+        :param value: The value returned by the read.
+        :type value: :class:`numpy.ndarray`
+        """
+
+        self.count += 1
+        self.nbytes += getattr(value, 'nbytes', 0)
+
+    def reset(self):
+        """Set the read count and byte total to zero."""
+
+        self.count = 0
+        self.nbytes = 0
+
+
+#: Process-wide statistics for netCDF variable value reads.
+_READ_STATISTICS = ReadStatistics()
+
+
+def get_read_statistics():
+    """
+    :return: The process-wide statistics for netCDF variable value reads.
+    :rtype: :class:`~ocgis.driver.hyperslab.ReadStatistics`
+    """
+
+    return _READ_STATISTICS
+
+
+def get_coalesced_blocks(index, waste_threshold, chunk_size=None):
+    """
+    Group source indices into contiguous blocks. Runs of consecutive indices are merged while the fraction of
+    unrequested elements in the merged block does not exceed ``waste_threshold``. A threshold of ``0`` reads only
+    requested elements. A threshold of ``1`` always reads the bounding block.
+
+    :param index: One-dimensional integer source indices. They may be unsorted and contain duplicates.
+    :type index: :class:`numpy.ndarray`
+    :param float waste_threshold: The maximum fraction of unrequested elements in a block.
+    :param int chunk_size: The source chunk size. Runs starting in the source chunk containing the end of a block are
+     always merged as the chunk is read whole regardless.
+    :return: A list of ``(<start>, <stop>)`` tuples in ascending order.
+    :rtype: list
+    """
+
+    unique = np.unique(index)
+    if unique.shape[0] == 0:
+        return []
+
+    # Split the sorted indices into runs of consecutive values.
+    breaks = np.flatnonzero(np.diff(unique) != 1) + 1
+    starts = unique[np.hstack(([0], breaks))]
+    stops = unique[np.hstack((breaks - 1, [unique.shape[0] - 1]))] + 1
+
+    ret = []
+    start, stop, requested = int(starts[0]), int(stops[0]), int(stops[0] - starts[0])
+    for run_start, run_stop in zip(starts[1:], stops[1:]):
+        run_start, run_stop = int(run_start), int(run_stop)
+        merged_requested = requested + run_stop - run_start
+        is_same_chunk = chunk_size is not None and run_start // chunk_size == (stop - 1) // chunk_size
+        if is_same_chunk or 1. - float(merged_requested) / (run_stop - start) <= waste_threshold:
+            stop, requested = run_stop, merged_requested
+        else:
+            ret.append((start, stop))
+            start, stop, requested = run_start, run_stop, run_stop - run_start
+    ret.append((start, stop))
+    return ret
+
+
+def read_coalesced(getter, slc, waste_threshold, statistics=None, chunks=None):
+    """
+    Read a hyperslab selection containing index arrays. Index arrays are converted to coalesced contiguous blocks (see
+    :func:`~ocgis.driver.hyperslab.get_coalesced_blocks`). Each combination of blocks is read once into a buffer and
+    requested elements are gathered from the buffer in memory. Index arrays are applied independently along each
+    dimension (orthogonal indexing) as with :mod:`netCDF4` slicing.
+
+    :param getter: Function returning the value for a tuple of slices.
+    :type getter: function
+    :param sequence slc: Slices and one-dimensional integer index arrays with one element per dimension.
+    :param float waste_threshold: The maximum fraction of unrequested elements in a block.
+    :param statistics: If provided, record reads on this object.
+    :type statistics: :class:`~ocgis.driver.hyperslab.ReadStatistics`
+    :param tuple chunks: If provided, the source chunk shape used to coalesce indices within the same chunk.
+    :rtype: :class:`numpy.ndarray`
+    """
+
+    # Convert each selection element to source blocks, the blocks' buffer positions, and the buffer positions of
+    # requested elements.
+    dimension_blocks = []
+    buffer_slices = []
+    gathers = []
+    for idx, element in enumerate(slc):
+        if isinstance(element, np.ndarray):
+            index = element.astype(np.int64)
+            chunk_size = None if chunks is None else chunks[idx]
+            blocks = get_coalesced_blocks(index, waste_threshold, chunk_size=chunk_size)
+            block_starts = np.array([b[0] for b in blocks])
+            block_stops = np.cumsum([b[1] - b[0] for b in blocks])
+            offsets = np.hstack(([0], block_stops[:-1]))
+            block_index = np.searchsorted(block_starts, index, side='right') - 1
+            gather = offsets[block_index] + index - block_starts[block_index]
+            # Avoid an in-memory copy if all buffered elements are requested in order.
+            if np.array_equal(gather, np.arange(block_stops[-1])):
+                gather = slice(None)
+            dimension_blocks.append([slice(*b) for b in blocks])
+            buffer_slices.append([slice(o, s) for o, s in zip(offsets, block_stops)])
+            gathers.append(gather)
+        else:
+            dimension_blocks.append([element])
+            buffer_slices.append([slice(None)])
+            gathers.append(slice(None))
+
+    if all(len(blocks) == 1 for blocks in dimension_blocks):
+        ret = getter(tuple([blocks[0] for blocks in dimension_blocks]))
+        if statistics is not None:
+            statistics.add(ret)
+    else:
+        ret = None
+        for combination in np.ndindex(*[len(blocks) for blocks in dimension_blocks]):
+            to_read = tuple([dimension_blocks[idx][c] for idx, c in enumerate(combination)])
+            value = getter(to_read)
+            if statistics is not None:
+                statistics.add(value)
+            if ret is None:
+                shape = list(value.shape)
+                for idx, positions in enumerate(buffer_slices):
+                    if positions[-1].stop is not None:
+                        shape[idx] = positions[-1].stop
+                if isinstance(value, np.ma.MaskedArray):
+                    ret = np.ma.array(np.empty(shape, dtype=value.dtype), mask=np.zeros(shape, dtype=bool),
+                                      fill_value=value.fill_value)
+                else:
+                    ret = np.empty(shape, dtype=value.dtype)
+            ret[tuple([buffer_slices[idx][c] for idx, c in enumerate(combination)])] = value
+
+    # Gather requested elements one dimension at a time to keep orthogonal indexing semantics.
+    for idx, gather in enumerate(gathers):
+        if not isinstance(gather, slice):
+            ret = np.take(ret, gather, axis=idx)
+    return ret
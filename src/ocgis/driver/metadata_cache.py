@@ -0,0 +1,139 @@
+import hashlib
+import os
+import uuid
+from collections import OrderedDict
+from copy import deepcopy
+
+import six
+from six.moves import cPickle
+
+from ocgis.base import AbstractOcgisObject
+
+
+class MetadataCache(AbstractOcgisObject):
+    """
+    Cache metadata and objects derived from metadata for file-sourced request datasets. Entries are stored in an
+    in-process least recently used cache and, optionally, pickled to a cache directory for reuse across processes.
+    Entries are keyed by source paths, sizes, and modification times so changed files are never read from the cache.
+
+    :param int max_entries: The maximum number of in-process entries.
+    :param str directory: If provided, also persist entries to this directory. It is created if it does not exist.
+    """
+
+    def __init__(self, max_entries, directory=None):
+        self.max_entries = max_entries
+        self.directory = directory
+        self._entries = OrderedDict()
+
+    def clear(self):
+        """Clear the in-process entries. On-disk entries are not removed."""
+
+        self._entries.clear()
+
+    def get(self, key, name):
+        """
+        :param str key: The cache key from :meth:`~MetadataCache.get_key`.
+        :param str name: The name of the cached object (i.e. ``'metadata'``).
+        :return: A copy of the cached object or ``None`` if it is not cached.
+        """
+
+        entry_key = (key, name)
+        ret = self._entries.get(entry_key)
+        if ret is not None:
+            # Move the entry to the end to mark it as most recently used.
+            self._entries.pop(entry_key)
+            self._entries[entry_key] = ret
+
+        if ret is None and self.directory is not None:
+            try:
+                with open(self._get_path_(key, name), 'rb') as f:
+                    ret = cPickle.load(f)
+            except (IOError, OSError, EOFError, cPickle.UnpicklingError):
+                ret = None
+            else:
+                self._set_entry_(entry_key, ret)
+
+        if ret is not None:
+            ret = deepcopy(ret)
+        return ret
+
+    @staticmethod
+    def get_key(uri, *args):
+        """
+        Create a cache key for file-sourced metadata.
+
+        :param uri: The source path(s).
+        :type uri: str | sequence of str
+        :param args: Additional hashable arguments differentiating metadata read from the same sources.
+        :return: The cache key or ``None`` if any source is not a local file.
+        :rtype: str | ``None``
+        """
+
+        uris = [uri] if isinstance(uri, six.string_types) else list(uri)
+        sources = []
+        for u in uris:
+            if not isinstance(u, six.string_types) or not os.path.isfile(u):
+                return None
+            stat = os.stat(u)
+            sources.append((os.path.abspath(u), stat.st_size, stat.st_mtime))
+        sha = hashlib.sha1()
+        sha.update(repr((sources, args)).encode())
+        return sha.hexdigest()
+
+    def set(self, key, name, value):
+        """
+        Cache a copy of an object.
+
+        :param str key: The cache key from :meth:`~MetadataCache.get_key`.
+        :param str name: The name of the object to cache.
+        :param value: The object to cache.
+        """
+
+        value = deepcopy(value)
+        self._set_entry_((key, name), value)
+
+        if self.directory is not None:
+            if not os.path.exists(self.directory):
+                try:
+                    os.makedirs(self.directory)
+                except OSError:
+                    # Another process may have created the directory.
+                    if not os.path.isdir(self.directory):
+                        raise
+            # Write under a temporary name so other processes never read a partially written entry.
+            path = self._get_path_(key, name)
+            tmp_path = '{}.{}'.format(path, uuid.uuid4().hex)
+            with open(tmp_path, 'wb') as f:
+                cPickle.dump(value, f, protocol=cPickle.HIGHEST_PROTOCOL)
+            os.rename(tmp_path, path)
+
+    def _get_path_(self, key, name):
+        return os.path.join(self.directory, '{}.{}.pkl'.format(key, name))
+
+    def _set_entry_(self, entry_key, value):
+        self._entries.pop(entry_key, None)
+        self._entries[entry_key] = value
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+#: The process-wide metadata cache.
+_METADATA_CACHE = MetadataCache(0)
+
+
+def get_metadata_cache():
+    """
+    :return: The process-wide metadata cache configured by :attr:`ocgis.env.USE_METADATA_CACHE`,
+     :attr:`ocgis.env.METADATA_CACHE_SIZE`, and :attr:`ocgis.env.DIR_METADATA_CACHE` or ``None`` if caching is disabled.
+    :rtype: :class:`~ocgis.driver.metadata_cache.MetadataCache` | ``None``
+    """
+
+    from ocgis import env
+
+    if not env.USE_METADATA_CACHE:
+        ret = None
+    else:
+        ret = _METADATA_CACHE
+        ret.max_entries = env.METADATA_CACHE_SIZE
+        ret.directory = env.DIR_METADATA_CACHE
+    return ret
@@ -15,11 +15,13 @@ from ocgis.base import orphaned, raise_if_empty
 from ocgis.collection.field import Field
 from ocgis.constants import MPIWriteMode, DimensionMapKey, KeywordArgument, DriverKey, CFName, SourceIndexType
 from ocgis.driver.base import AbstractDriver, driver_scope
+from ocgis.driver.hyperslab import get_read_statistics, read_coalesced
 from ocgis.exc import ProjectionDoesNotMatch, PayloadProtectedError, OcgWarning, NoDataVariablesFound, \
     GridDeficientError
 from ocgis.util.helpers import itersubclasses, get_iter, get_formatted_slice, get_by_key_list, is_auto_dtype, get_group
 from ocgis.util.logging_ocgis import ocgis_lh
-from ocgis.variable.base import SourcedVariable, ObjectType, get_slice_sequence_using_local_bounds
+from ocgis.variable.base import SourcedVariable, ObjectType, get_slice_sequence_using_local_bounds, \
+    has_unlimited_dimension
 from ocgis.variable.crs import CFCoordinateReferenceSystem, CoordinateReferenceSystem, CFRotatedPole, CFSpherical, \
     AbstractProj4CRS
 from ocgis.variable.dimension import Dimension
@@ -133,26 +135,60 @@ class DriverNetcdf(AbstractDriver):
         else:
             ncvar = dataset.createVariable(var.name, dtype, dimensions=dimensions, fill_value=fill_value, **kwargs)
 
+        write_value = True
+        is_collective = False
+        if write_mode == MPIWriteMode.ASYNCHRONOUS:
+            # Ranks write their local bounds of distributed variables concurrently. Values replicated across ranks are
+            # written by the root rank only. Extending an unlimited dimension in parallel must be collective.
+            is_distributed = any([d.dist for d in var.dimensions])
+            if has_unlimited_dimension(var.dimensions) or (is_distributed and env.USE_NETCDF4_MPI_COLLECTIVE):
+                ncvar.set_collective(True)
+                is_collective = True
+            elif not is_distributed and vm.rank != 0:
+                write_value = False
+
+        # Collective writes require every rank to take part in each write. Track if this rank wrote any values.
+        has_written = False
+
         # Do not fill values on file_only calls. Also, only fill values for variables with dimension greater than zero.
-        if not file_only and not var.is_empty and not isinstance(var, CoordinateReferenceSystem):
+        if not file_only and write_value and not var.is_empty and not isinstance(var, CoordinateReferenceSystem):
             if isinstance(var.dtype, ObjectType) and not isinstance(var, TemporalVariable):
+                # Write all variable-length elements in a single call.
                 bounds_local = var.dimensions[0].bounds_local
-                for idx in range(bounds_local[0], bounds_local[1]):
-                    ncvar[idx] = np.array(var.get_value()[idx - bounds_local[0]])
+                value = var.get_value()
+                to_write = np.empty(bounds_local[1] - bounds_local[0], dtype=object)
+                for idx in range(to_write.shape[0]):
+                    to_write[idx] = np.array(value[idx])
+                ncvar[bounds_local[0]:bounds_local[1]] = to_write
+                has_written = to_write.size > 0
             else:
                 fill_slice = get_slice_sequence_using_local_bounds(var)
                 data_value = cls.get_variable_write_value(var)
                 # Only write allocated values.
                 if data_value is not None:
+                    has_written = np.size(data_value) > 0
                     if var.dtype == str or var.is_string_object:
-                        for idx in range(fill_slice[0].start, fill_slice[0].stop):
-                            try:
+                        try:
+                            chars = get_char_array(data_value, ncvar.shape[-1])
+                        except UnicodeEncodeError:
+                            if is_collective:
+                                # Character-at-a-time writes cannot be matched across ranks. Encode the strings
+                                # here so the values are written in a single call.
+                                chars = get_char_array(np.char.encode(np.asarray(data_value, dtype=str), 'utf-8'),
+                                                       ncvar.shape[-1])
+                            else:
+                                # Non-ASCII strings are left to netCDF4 for encoding one character at a time.
+                                chars = None
+                        except ValueError as e:
+                            msg = "Variable name is '{}'. Original message: ".format(var.name) + str(e)
+                            raise ValueError(msg)
+                        if chars is None:
+                            for idx in range(fill_slice[0].start, fill_slice[0].stop):
                                 curr_value = data_value[idx - fill_slice[0].start]
-                            except Exception as e:
-                                msg = "Variable name is '{}'. Original message: ".format(var.name) + e.message
-                                raise e.__class__(msg)
-                            for sidx, sval in enumerate(curr_value):
-                                ncvar[idx, sidx] = sval
+                                for sidx, sval in enumerate(curr_value):
+                                    ncvar[idx, sidx] = sval
+                        else:
+                            ncvar[fill_slice[0], :] = chars
                     elif var.ndim == 0:
                         ncvar[:] = data_value
                     else:
@@ -162,14 +198,16 @@ class DriverNetcdf(AbstractDriver):
                             msg = "Variable name is '{}'. Original message: ".format(var.name) + e.message
                             raise e.__class__(msg)
 
+        # Ranks without values to write still take part in collective writes. Every rank skips file only writes.
+        if is_collective and not has_written and not file_only:
+            write_empty_selection(ncvar)
+
         # Only set variable attributes if this is not a fill operation.
         if write_mode != MPIWriteMode.FILL:
             var.write_attributes_to_netcdf_object(ncvar)
             if var.units is not None:
                 ncvar.setncattr('units', str(var.units))
 
-        dataset.sync()
-
     @classmethod
     def _write_variable_collection_main_(cls, vc, opened_or_path, write_mode, **kwargs):
         assert write_mode is not None
@@ -218,7 +256,9 @@ class DriverNetcdf(AbstractDriver):
                             group = dataset.groups[child.name]
                         child.write(group, write_mode=write_mode, **kwargs)
                     dataset.sync()
-            vm.barrier()
+            # Parallel datasets are closed collectively so ranks do not need to wait on each other.
+            if write_mode != MPIWriteMode.ASYNCHRONOUS:
+                vm.barrier()
 
     def _get_metadata_main_(self):
         with driver_scope(self) as ds:
@@ -231,7 +271,8 @@ class DriverNetcdf(AbstractDriver):
 
         ret = AbstractDriver._get_write_modes_(the_vm, **kwargs)
         if env.USE_NETCDF4_MPI and the_vm.size > 1:
-            if dataset_kwargs.get('format', 'NETCDF4') == 'NETCDF4' and dataset_kwargs.get('parallel', True):
+            if dataset_kwargs.get('format', 'NETCDF4') in constants.NETCDF4_MPI_FORMATS and \
+                    dataset_kwargs.get('parallel', True):
                 ret = [MPIWriteMode.ASYNCHRONOUS]
         return ret
 
@@ -251,7 +292,7 @@ class DriverNetcdf(AbstractDriver):
             # Open the dataset in parallel if we want to use the netCDF MPI capability. It may not be available even in
             # parallel.
             if mode == 'w' and lvm.size > 1:
-                if kwargs.get('format', 'NETCDF4') == 'NETCDF4':
+                if kwargs.get('format', 'NETCDF4') in constants.NETCDF4_MPI_FORMATS:
                     if kwargs.get('parallel') is None and env.USE_NETCDF4_MPI:
                         kwargs['parallel'] = True
                     if kwargs.get('parallel') and kwargs.get('comm') is None:
@@ -391,6 +432,23 @@ class DriverNetcdfCF(AbstractDriverNetcdfCF):
 
         return tuple(dvars)
 
+    @staticmethod
+    def get_dimension_chunk_sizes(group_metadata):
+        dimensions = group_metadata['dimensions']
+        chunked = []
+        for variable_metadata in group_metadata['variables'].values():
+            chunking = variable_metadata.get('chunking')
+            if chunking is not None:
+                sizes = [dimensions.get(d, {}).get('size', 1) for d in variable_metadata['dimensions']]
+                chunked.append((int(np.prod(sizes)), variable_metadata))
+
+        # Prefer chunk sizes of the largest variables as they dominate reads.
+        ret = {}
+        for _, variable_metadata in sorted(chunked, key=lambda x: x[0], reverse=True):
+            for dimension_name, chunk_size in zip(variable_metadata['dimensions'], variable_metadata['chunking']):
+                ret.setdefault(dimension_name, chunk_size)
+        return ret
+
     def get_distributed_dimension_name(self, dimension_map, dimensions_metadata):
         x_variable = dimension_map.get_variable(DimensionMapKey.X)
         y_variable = dimension_map.get_variable(DimensionMapKey.Y)
@@ -601,6 +659,124 @@ def get_variable_value(variable, dimensions):
         slc = get_formatted_slice(to_format, len(dimensions))
     else:
         slc = slice(None)
+
+    chunking = get_variable_chunking(variable)
+    if chunking is not None and isinstance(slc, tuple):
+        update_chunk_cache(variable, slc, chunking)
+
+    statistics = get_read_statistics()
+    # Index arrays remaining after formatting are not contiguous.
+    is_fancy = isinstance(slc, tuple) and any(isinstance(s, np.ndarray) and s.dtype != bool for s in slc)
+    if is_fancy and env.USE_COALESCED_READS:
+        # Read fancy source indices from coalesced contiguous blocks instead of many small strided reads.
+        ret = read_coalesced(lambda x: _get_variable_item_(variable, x), slc,
+                             env.COALESCED_READ_WASTE_THRESHOLD, statistics=statistics, chunks=chunking)
+    else:
+        ret = _get_variable_item_(variable, slc)
+        statistics.add(ret)
+    return ret
+
+
+def get_char_array(values, width):
+    """
+    Encode strings as a fixed-width character array for writing to a netCDF character variable in a single call.
+
+    :param values: One-dimensional sequence of strings.
+    :type values: :class:`numpy.ndarray` | sequence
+    :param int width: The width of the character dimension. Shorter strings are padded with null characters.
+    :return: Character array with shape ``(len(values), width)``.
+    :rtype: :class:`numpy.ndarray`
+    :raises: UnicodeEncodeError, ValueError
+    """
+
+    fixed = np.asarray(values).astype('S')
+    if fixed.dtype.itemsize > width:
+        msg = 'Maximum string length {} exceeds the character dimension width {}.'
+        raise ValueError(msg.format(fixed.dtype.itemsize, width))
+    fixed = np.ascontiguousarray(fixed, dtype='S{}'.format(width))
+    return fixed.view('S1').reshape(fixed.shape[0], width)
+
+
+def write_empty_selection(ncvar):
+    """
+    Take part in a collective write to a netCDF variable without writing any values. Item assignment skips empty
+    selections so the zero-count write is issued directly.
+
+    :param ncvar: The target variable.
+    :type ncvar: :class:`netCDF4.Variable`
+    """
+
+    if isinstance(ncvar.datatype, nc.VLType) or ncvar.dtype == str:
+        dtype = object
+    else:
+        dtype = ncvar.dtype
+    ndim = ncvar.ndim
+    ncvar._put(np.empty([0] * ndim, dtype=dtype), [0] * ndim, [0] * ndim, [1] * ndim)
+
+
+def get_variable_chunking(variable):
+    """
+    :param variable: The source variable.
+    :type variable: :class:`netCDF4.Variable`
+    :return: The variable's chunk shape or ``None`` if the variable is not chunked or chunking is not available.
+    :rtype: tuple | ``None``
+    """
+
+    try:
+        ret = variable.chunking()
+    except (AttributeError, RuntimeError):
+        # Multi-file variables and some file formats do not support chunking.
+        ret = None
+    if ret is None or ret == 'contiguous':
+        ret = None
+    else:
+        ret = tuple(ret)
+    return ret
+
+
+def update_chunk_cache(variable, slc, chunking):
+    """
+    Increase a source variable's chunk cache so it holds every chunk touched by a read. This avoids reading and
+    decompressing chunks more than once when a read does not cover whole chunks. The cache size is limited by
+    :attr:`ocgis.env.NETCDF_CHUNK_CACHE_SIZE`.
+
+    :param variable: The source variable.
+    :type variable: :class:`netCDF4.Variable`
+    :param tuple slc: The read's slices and index arrays with one element per dimension.
+    :param tuple chunking: The variable's chunk shape.
+    """
+
+    limit = env.NETCDF_CHUNK_CACHE_SIZE
+    if limit is None or limit <= 0:
+        return
+    try:
+        itemsize = np.dtype(variable.dtype).itemsize
+    except TypeError:
+        itemsize = 0
+    if itemsize == 0:
+        # Variable-length types have no fixed chunk size.
+        return
+
+    nchunks = 1
+    for element, chunk_size, size in zip(slc, chunking, variable.shape):
+        if isinstance(element, slice):
+            start, stop, _ = element.indices(size)
+        else:
+            start, stop = int(element.min()), int(element.max()) + 1
+        if stop <= start:
+            return
+        nchunks *= (stop - 1) // chunk_size - start // chunk_size + 1
+    chunk_bytes = int(np.prod(chunking)) * itemsize
+
+    size, nelems, preemption = variable.get_var_chunk_cache()
+    desired_size = min(nchunks * chunk_bytes, limit)
+    if desired_size > size:
+        # The number of hash table slots should be much larger than the number of cached chunks.
+        nelems = max(nelems, 100 * max(1, desired_size // chunk_bytes))
+        variable.set_var_chunk_cache(size=desired_size, nelems=nelems, preemption=preemption)
+
+
+def _get_variable_item_(variable, slc):
     try:
         ret = variable.__getitem__(slc)
     except IndexError:
@@ -777,13 +953,22 @@ def update_group_metadata(rootgrp, fill):
                 except AttributeError:
                     fill_value = 'auto'
 
+        # Chunk shapes and chunk cache settings are only available for chunked variables in netCDF4 formats.
+        chunking = get_variable_chunking(value)
+        if chunking is None:
+            chunk_cache = None
+        else:
+            chunk_cache = tuple(value.get_var_chunk_cache())
+
         variables.update({key: {'dimensions': value.dimensions,
                                 'attrs': subvar,
                                 'dtype': value.dtype,
                                 'name': value._name,
                                 'fill_value': fill_value,
                                 'dtype_packed': dtype_packed,
-                                'fill_value_packed': fill_value_packed}})
+                                'fill_value_packed': fill_value_packed,
+                                'chunking': chunking,
+                                'chunk_cache': chunk_cache}})
     fill.update({'variables': variables})
 
     # get dimensions
@@ -1,5 +1,6 @@
 import datetime
 import itertools
+import os
 from collections import OrderedDict
 from copy import deepcopy
 
@@ -7,7 +8,7 @@ import fiona
 import numpy as np
 from shapely.geometry import mapping
 
-from ocgis import constants, vm
+from ocgis import constants, vm, env
 from ocgis.constants import MPIWriteMode, DimensionName, KeywordArgument, DriverKey, DMK, SourceIndexType, VariableName
 from ocgis.driver.base import driver_scope, AbstractTabularDriver
 from ocgis.driver.dimension_map import DimensionMap
@@ -121,35 +122,25 @@ class DriverVector(AbstractTabularDriver):
             if as_geometry_iterator:
                 return (row['geom'] for row in g)
 
-            ret = {}
             if variable.parent is None:
-                ret[variable.name] = np.zeros(variable.shape, dtype=variable.dtype)
-                for idx, row in enumerate(g):
-                    ret[variable.name][idx] = row['properties'][variable.name]
+                targets = [variable]
             else:
-                ret = {}
-                # Initialize the variable data as zero arrays.
-                for v in list(variable.parent.values()):
-                    if not isinstance(v, CoordinateReferenceSystem):
-                        ret[v.name] = np.ma.array(np.zeros(v.shape, dtype=v.dtype), mask=False)
-                # Fill those arrays.
-                for idx, row in enumerate(g):
-                    for dv in list(variable.parent.values()):
-                        if isinstance(dv, (CoordinateReferenceSystem, GeometryVariable)):
-                            continue
-                        dv = dv.name
-                        try:
-                            ret[dv][idx] = row['properties'][dv]
-                        except TypeError:
-                            # Property value may be none. Set the data to masked if this is the case.
-                            if row['properties'][dv] is None:
-                                ret[dv].mask[idx] = True
-                            else:
-                                raise
-                    try:
-                        ret[constants.VariableName.GEOMETRY_VARIABLE][idx] = row['geom']
-                    except KeyError:
-                        pass
+                targets = [v for v in list(variable.parent.values()) if not isinstance(v, CoordinateReferenceSystem)]
+
+            # Load attribute columns and geometries in bulk.
+            load_geoms = any([v.name == VariableName.GEOMETRY_VARIABLE for v in targets])
+            g.load_geoms = load_geoms
+            columns, geoms = g.get_columns()
+
+        ret = {}
+        for v in targets:
+            if v.name == VariableName.GEOMETRY_VARIABLE:
+                ret[v.name] = np.ma.array(geoms, mask=False)
+            elif isinstance(v, GeometryVariable):
+                ret[v.name] = np.ma.array(np.zeros(v.shape, dtype=v.dtype), mask=False)
+            else:
+                column = columns[v.name]
+                ret[v.name] = np.ma.array(np.ma.getdata(column).astype(v.dtype), mask=np.ma.getmaskarray(column))
 
         # Only supply a mask if something is actually masked. Otherwise, remove the mask.
         is_masked = any([v.mask.any() for v in ret.values()])
@@ -263,13 +254,27 @@ class DriverVector(AbstractTabularDriver):
 
         # Write data on each rank to the file.
         if write_mode != MPIWriteMode.TEMPLATE:
-            for rank_to_write in vm.ranks:
-                if vm.rank == rank_to_write:
-                    with driver_scope(cls, opened_or_path=opened_or_path, mode=mode, driver=fiona_driver,
-                                      crs=fiona_crs, schema=fiona_schema) as sink:
-                        itr = field.iter(**iter_kwargs)
-                        write_records_to_fiona(sink, itr, fiona_driver)
+            if vm.size > 1 and env.USE_VECTOR_PART_FILES and not cls.inquire_opened_state(opened_or_path):
+                # Each rank writes its records to a part file concurrently. Part files are merged in rank order.
+                part_path = get_part_path(opened_or_path, vm.rank)
+                with driver_scope(cls, opened_or_path=part_path, mode='w', driver=fiona_driver, crs=fiona_crs,
+                                  schema=fiona_schema) as sink:
+                    itr = field.iter(**iter_kwargs)
+                    write_records_to_fiona(sink, itr, fiona_driver)
+                vm.barrier()
+                if vm.rank == 0:
+                    part_paths = [get_part_path(opened_or_path, rank) for rank in range(vm.size)]
+                    merge_part_files(opened_or_path, part_paths, mode, driver=fiona_driver, crs=fiona_crs,
+                                     schema=fiona_schema)
                 vm.barrier()
+            else:
+                for rank_to_write in vm.ranks:
+                    if vm.rank == rank_to_write:
+                        with driver_scope(cls, opened_or_path=opened_or_path, mode=mode, driver=fiona_driver,
+                                          crs=fiona_crs, schema=fiona_schema) as sink:
+                            itr = field.iter(**iter_kwargs)
+                            write_records_to_fiona(sink, itr, fiona_driver)
+                    vm.barrier()
 
 
 def format_record_for_fiona(driver, record):
@@ -419,8 +424,51 @@ def get_geometry_variable(field_like):
     return geom
 
 
-def write_records_to_fiona(sink, itr, driver):
+def get_part_path(path, rank):
+    """
+    :param str path: The merged output path.
+    :param int rank: The rank writing the part file.
+    :return: The path to a rank's part file.
+    :rtype: str
+    """
+
+    root, ext = os.path.splitext(path)
+    return '{}_part{}{}'.format(root, rank, ext)
+
+
+def merge_part_files(path, part_paths, mode, batch_size=constants.FIONA_WRITE_BATCH_SIZE, **kwargs):
+    """
+    Append records from part files to an output file in order. Part files are removed following the merge.
+
+    :param str path: The merged output path.
+    :param sequence part_paths: Part file paths in merge order.
+    :param str mode: The output open mode. Use ``'a'`` to append to an existing template.
+    :param int batch_size: The number of records written per call.
+    :param kwargs: Keyword arguments to :func:`fiona.open` for the output (i.e. ``driver``, ``crs``, and ``schema``).
+    """
+
+    with fiona.open(path, mode=mode, **kwargs) as sink:
+        for part_path in part_paths:
+            with fiona.open(part_path) as source:
+                batch = []
+                for record in source:
+                    batch.append(record)
+                    if len(batch) == batch_size:
+                        sink.writerecords(batch)
+                        batch = []
+                if len(batch) > 0:
+                    sink.writerecords(batch)
+    for part_path in part_paths:
+        fiona.remove(part_path, driver=kwargs.get('driver'))
+
+
+def write_records_to_fiona(sink, itr, driver, batch_size=constants.FIONA_WRITE_BATCH_SIZE):
+    batch = []
     for geom, record in itr:
         record = format_record_for_fiona(driver, record)
-        record = {'properties': record, 'geometry': mapping(geom)}
-        sink.write(record)
+        batch.append({'properties': record, 'geometry': mapping(geom)})
+        if len(batch) == batch_size:
+            sink.writerecords(batch)
+            batch = []
+    if len(batch) > 0:
+        sink.writerecords(batch)
@@ -81,12 +81,42 @@ class Environment(AbstractOcgisObject):
         self.DEBUG = EnvParm('DEBUG', False, formatter=self._format_bool_)
         self.DIR_BIN = EnvParm('DIR_BIN', None)
         self.USE_SPATIAL_INDEX = EnvParmImport('USE_SPATIAL_INDEX', None, 'rtree')
+        # If not None, persist spatial indexes for file-sourced geometries to this directory for reuse across
+        # operations and processes.
+        self.DIR_SPATIAL_INDEX_CACHE = EnvParm('DIR_SPATIAL_INDEX_CACHE', None)
+        # The maximum size in bytes of the spatial index cache. Least recently used indexes are evicted first.
+        self.SPATIAL_INDEX_CACHE_SIZE = EnvParm('SPATIAL_INDEX_CACHE_SIZE', 1024 ** 3, formatter=int)
+        # If True, cache request dataset metadata, dimension maps, and distributions for file-sourced datasets.
+        self.USE_METADATA_CACHE = EnvParm('USE_METADATA_CACHE', False, formatter=self._format_bool_)
+        # The maximum number of in-process metadata cache entries. Least recently used entries are evicted first.
+        self.METADATA_CACHE_SIZE = EnvParm('METADATA_CACHE_SIZE', 256, formatter=int)
+        # If not None and the metadata cache is used, also persist cached metadata to this directory for reuse across
+        # processes.
+        self.DIR_METADATA_CACHE = EnvParm('DIR_METADATA_CACHE', None)
+        # If True, read non-contiguous source indices from coalesced contiguous blocks.
+        self.USE_COALESCED_READS = EnvParm('USE_COALESCED_READS', True, formatter=self._format_bool_)
+        # The maximum fraction of unrequested elements in a coalesced block.
+        self.COALESCED_READ_WASTE_THRESHOLD = EnvParm('COALESCED_READ_WASTE_THRESHOLD',
+                                                      constants.COALESCED_READ_WASTE_THRESHOLD, formatter=float)
+        # If True, align distributed dimension bounds and field chunks to source chunk boundaries.
+        self.USE_CHUNK_ALIGNMENT = EnvParm('USE_CHUNK_ALIGNMENT', True, formatter=self._format_bool_)
+        # The maximum size in bytes of a source variable's chunk cache when it is increased for a read. Use 0 to keep
+        # the library defaults.
+        self.NETCDF_CHUNK_CACHE_SIZE = EnvParm('NETCDF_CHUNK_CACHE_SIZE', 256 * 1024 ** 2, formatter=int)
         self.USE_CFUNITS = EnvParmImport('USE_CFUNITS', None, ('cf_units', 'cfunits'))
         self.USE_ESMF = EnvParmImport('USE_ESMF', None, 'ESMF')
         self.USE_ICCLIM = EnvParmImport('USE_ICCLIM', None, 'icclim')
         self.USE_MPI4PY = EnvParmImport('USE_MPI4PY', None, 'mpi4py')
+        self.USE_SCIPY = EnvParmImport('USE_SCIPY', None, 'scipy')
         self.USE_MEMORY_OPTIMIZATIONS = EnvParm('USE_MEMORY_OPTIMIZATIONS', False, formatter=self._format_bool_)
         self.USE_NETCDF4_MPI = EnvParm('USE_NETCDF4_MPI', None, formatter=self._format_bool_)
+        # If True, use collective I/O for distributed variables in parallel netCDF writes.
+        self.USE_NETCDF4_MPI_COLLECTIVE = EnvParm('USE_NETCDF4_MPI_COLLECTIVE', True, formatter=self._format_bool_)
+        # If True, ranks write vector GIS records to part files concurrently which are then merged.
+        self.USE_VECTOR_PART_FILES = EnvParm('USE_VECTOR_PART_FILES', True, formatter=self._format_bool_)
+        # If True, construct geometry arrays in bulk using Shapely's vectorized creation functions. If None,
+        # automatically detect if the vectorized functions are available (Shapely >= 2.0).
+        self.USE_VECTORIZED_GEOMETRY = EnvParm('USE_VECTORIZED_GEOMETRY', None, formatter=self._format_bool_)
         self.CONF_PATH = EnvParm('CONF_PATH', os.path.expanduser('~/.config/ocgis.conf'))
         self.SUPPRESS_WARNINGS = EnvParm('SUPPRESS_WARNINGS', True, formatter=self._format_bool_)
         self.DEFAULT_GEOM_UID = EnvParm('DEFAULT_GEOM_UID', constants.OCGIS_UNIQUE_GEOMETRY_IDENTIFIER, formatter=str)
@@ -118,6 +148,9 @@ class Environment(AbstractOcgisObject):
                 if netCDF4.__has_nc_par__ == 1:
                     self.USE_NETCDF4_MPI = True
 
+        if self.USE_VECTORIZED_GEOMETRY is None:
+            self.USE_VECTORIZED_GEOMETRY = get_vectorized_geometry_available()
+
         self.ops = None
         self._optimize_store = {}
 
@@ -289,5 +322,16 @@ def get_netcdftime_preference():
     return ret
 
 
+def get_vectorized_geometry_available():
+    """
+    :return: ``True`` if the installed Shapely provides vectorized geometry creation functions.
+    :rtype: bool
+    """
+
+    import shapely
+
+    return all([hasattr(shapely, name) for name in ('box', 'points', 'polygons')])
+
+
 # Always keep this later to make sure functions may be used in environment set-up.
 env = Environment()
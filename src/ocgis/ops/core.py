@@ -115,6 +115,20 @@ class OcgOperations(AbstractOcgisObject):
      coordinate systems.
     :param bool optimized_bbox_subset: If ``True``, only perform the bounding box subset ignoring other subsetting
      procedures such as spatial operations on geometry objects using a spatial index.
+    :param dict chunking: If provided, execute operations in chunks streaming each chunk through subsetting,
+     calculation, and conversion. Peak memory is bounded by the chunk size as opposed to the request size. Keys are
+     ``'spatial'`` (chunk size for each spatial dimension or a sequence of sizes), ``'memory'`` (bytes of data variable
+     values allowed per chunk used to determine the spatial chunk size), and ``'time'`` (time chunk size). Only
+     file-based output formats are supported.
+    :param str executor: If ``'serial'`` (the default), process datasets and selection geometries sequentially. If
+     ``'process'``, subset multiple datasets concurrently using a local process pool. With a single dataset, selection
+     geometries are distributed across the pool instead. Collections are returned in dataset and selection geometry
+     order. Not available when executing with MPI.
+    :param int workers: The number of local workers to use with a parallel ``executor``. If ``None``, use the processor
+     count.
+    :param bool extract_stations: If ``True``, ``geom`` must contain point geometries. Values are extracted at the grid
+     elements nearest to all points at once and returned in a single field with a station dimension as opposed to
+     subsetting by each point individually.
     """
 
     def __init__(self, dataset=None, spatial_operation='intersects', geom=None, geom_select_sql_where=None,
@@ -126,7 +140,8 @@ class OcgOperations(AbstractOcgisObject):
                  add_auxiliary_files=True, optimizations=None, callback=None, time_range=None, time_region=None,
                  time_subset_func=None, level_range=None, conform_units_to=None, select_nearest=False,
                  regrid_destination=None, regrid_options=None, melted=False, output_format_options=None,
-                 spatial_wrapping=None, spatial_reorder=False, optimized_bbox_subset=False):
+                 spatial_wrapping=None, spatial_reorder=False, optimized_bbox_subset=False, chunking=None,
+                 executor=constants.ExecutorName.SERIAL, workers=None, extract_stations=False):
 
         # Tells "__setattr__" to not perform global validation until all values are initially set.
         self._is_init = True
@@ -175,6 +190,10 @@ class OcgOperations(AbstractOcgisObject):
         self.melted = Melted(init_value=env.MELTED or melted)
         self.spatial_wrapping = SpatialWrapping(spatial_wrapping)
         self.spatial_reorder = SpatialReorder(spatial_reorder)
+        self.chunking = Chunking(chunking)
+        self.executor = Executor(executor)
+        self.workers = Workers(workers)
+        self.extract_stations = ExtractStations(extract_stations)
 
         # These values are left in to perhaps be added back in at a later date.
         self.output_grouping = None
@@ -404,6 +423,39 @@ class OcgOperations(AbstractOcgisObject):
             if self.calc is None:
                 _raise_('File only outputs are only relevant for computations.', obj=FileOnly)
 
+        # Chunks are streamed through operations and written in place to file-based outputs.
+        if self.chunking is not None:
+            if self.output_format in (constants.OutputFormatName.OCGIS, constants.OutputFormatName.ESMPY_GRID):
+                _raise_('Chunked operations require a file-based output format.', obj=Chunking)
+            if vm.size > 1:
+                _raise_('Chunked operations are not supported in parallel.', obj=Chunking)
+            if self.aggregate:
+                _raise_('Spatial aggregation requires the entire spatial domain and may not be chunked.', obj=Chunking)
+            if self.regrid_destination is not None:
+                _raise_('Regridding may not be chunked.', obj=Chunking)
+            if self.calc is not None and self.chunking.get('time') is not None:
+                _raise_('Calculations may not be chunked along the time dimension.', obj=Chunking)
+
+        # Local process pools are an alternative to MPI parallelism.
+        if self.executor != constants.ExecutorName.SERIAL:
+            if vm.size > 1:
+                _raise_('A local pool executor may not be used in parallel with MPI.', obj=Executor)
+            if self.chunking is not None:
+                _raise_('Chunked operations require the serial executor.', obj=Executor)
+
+        # Stations are extracted from the nearest grid elements in a single pass.
+        if self.extract_stations:
+            if self.geom is None:
+                _raise_('Station extraction requires point selection geometries.', obj=ExtractStations)
+            if vm.size > 1:
+                _raise_('Station extraction is not supported in parallel.', obj=ExtractStations)
+            if self.aggregate or self.spatial_operation == 'clip':
+                _raise_('Stations may not be spatially aggregated or clipped.', obj=ExtractStations)
+            if self.regrid_destination is not None:
+                _raise_('Stations may not be regridded.', obj=ExtractStations)
+            if self.chunking is not None:
+                _raise_('Station extraction may not be chunked.', obj=ExtractStations)
+
         # validate any calculations against the operations object. if the calculation is a string eval function do not
         # validate.
         if self.calc is not None:
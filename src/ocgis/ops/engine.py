@@ -1,20 +1,25 @@
 import logging
+import multiprocessing
 from copy import deepcopy
 
 from ocgis import env, constants
 from ocgis import vm
 from ocgis.base import raise_if_empty, AbstractOcgisObject
 from ocgis.calc.engine import CalculationEngine
+from ocgis.calc.tile import get_chunk_schema, get_field_chunk
 from ocgis.collection.field import Field
 from ocgis.collection.spatial import SpatialCollection
-from ocgis.constants import WrappedState, HeaderName, WrapAction, SubcommName, KeywordArgument
+from ocgis.constants import WrappedState, HeaderName, WrapAction, SubcommName, KeywordArgument, DimensionName, \
+    VariableName
 from ocgis.exc import ExtentError, EmptySubsetError, BoundsAlreadyAvailableError, SubcommNotFoundError, \
     NoDataVariablesFound, WrappedStateEvalTargetMissing
+from ocgis.spatial.nearest import get_station_field, update_station_coordinates
 from ocgis.spatial.spatial_subset import SpatialSubsetOperation
-from ocgis.util.helpers import get_default_or_apply
+from ocgis.util.helpers import get_default_or_apply, iter_ordered_results, pool_scope, POOL_WORKER_STATE
 from ocgis.util.logging_ocgis import ocgis_lh, ProgressOcgOperations
 from ocgis.variable.base import create_typed_variable_from_data_model
 from ocgis.variable.crs import CFRotatedPole, Spherical, WGS84
+from ocgis.variable.geom import GeometryVariable
 
 
 class OperationsEngine(AbstractOcgisObject):
@@ -29,6 +34,9 @@ class OperationsEngine(AbstractOcgisObject):
     :type progress: :class:`~ocgis.util.logging_ocgis.ProgressOcgOperations`
     """
 
+    #: If ``True``, the engine is executing in a local pool worker and its work is processed serially.
+    _is_pool_worker = False
+
     def __init__(self, ops, request_base_size_only=False, progress=None):
         self.ops = ops
         self._request_base_size_only = request_base_size_only
@@ -36,6 +44,8 @@ class OperationsEngine(AbstractOcgisObject):
         self._progress = progress or ProgressOcgOperations()
         self._original_subcomm = deepcopy(vm.current_comm_name)
         self._backtransform = {}
+        # Temporal groups shared by the chunks of a field.
+        self._chunk_tgds = {}
 
         # Create the calculation engine is calculations are present.
         if self.ops.calc is None or self._request_base_size_only:
@@ -105,7 +115,7 @@ class OperationsEngine(AbstractOcgisObject):
         ocgis_lh(msg=msg, logger=self._subset_log)
 
         # Process the incoming datasets. Convert from request datasets to fields as needed.
-        for rds in itr_rd:
+        for rds, itr_coll in self._iter_subsettables_(itr_rd):
 
             try:
                 msg = 'Processing URI(s): {0}'.format([rd.uri for rd in rds])
@@ -122,7 +132,8 @@ class OperationsEngine(AbstractOcgisObject):
                 msg = 'Processing URI(s) / field names: {0}'.format(msg)
             ocgis_lh(msg=msg, logger=self._subset_log)
 
-            for coll in self._process_subsettables_(rds):
+            self._chunk_tgds = {}
+            for coll in itr_coll:
                 # If there are calculations, do those now and return a collection.
                 if not vm.is_null and self.cengine is not None:
                     ocgis_lh('Starting calculations.', self._subset_log)
@@ -134,6 +145,13 @@ class OperationsEngine(AbstractOcgisObject):
                     else:
                         tgds = self.ops.optimizations.get('tgds')
 
+                    # Chunks of a field share the same time dimension. Compute the temporal groups once.
+                    if tgds is None and self.ops.chunking is not None and self.ops.calc_grouping is not None:
+                        tgds = self._chunk_tgds
+                        for field in coll.iter_fields():
+                            if field.name not in tgds:
+                                tgds[field.name] = field.time.get_grouping(deepcopy(self.ops.calc_grouping))
+
                     # Execute the calculations.
                     coll = self.cengine.execute(coll, file_only=self.ops.file_only, tgds=tgds)
 
@@ -155,6 +173,35 @@ class OperationsEngine(AbstractOcgisObject):
                     ocgis_lh('_iter_collections_ yielding', self._subset_log, level=logging.DEBUG)
                     yield coll
 
+    def _iter_subsettables_(self, itr_rd):
+        """
+        Yield request dataset groups with their subsetted collections. If a local pool executor is configured and there
+        are multiple dataset groups, groups are subsetted concurrently. Groups are always yielded in their incoming
+        order and the number of groups held in memory is bounded by the worker count.
+
+        :param list itr_rd: Sequence of request dataset groups.
+        :returns: Tuples of the request dataset group and an iterable of its collections.
+        :rtype: tuple
+        """
+
+        if self.ops.executor == constants.ExecutorName.SERIAL or self._is_pool_worker or vm.size > 1 or \
+                len(itr_rd) == 1:
+            for rds in itr_rd:
+                yield rds, self._process_subsettables_(rds)
+        else:
+            workers = self._get_worker_count_()
+            msg = 'Subsetting datasets using {0} local {1} worker(s).'.format(workers, self.ops.executor)
+            ocgis_lh(msg=msg, logger=self._subset_log)
+
+            # Subsetting switches the global virtual machine communicator and reads from netCDF files so only process
+            # pools are supported.
+            # Each pending group holds all its collections so only allow one group per worker in flight.
+            with pool_scope(workers, self._get_pool_worker_state_()) as pool:
+                itr_results = iter_ordered_results(pool, _process_subsettables_in_pool_worker_, itr_rd, workers)
+                for rds, (colls, n_completed) in zip(itr_rd, itr_results):
+                    self._progress.n_completed_operations += n_completed
+                    yield rds, colls
+
     def _process_subsettables_(self, rds):
         """
         :param rds: Sequence of :class:~`ocgis.RequestDataset` objects.
@@ -275,7 +322,12 @@ class OperationsEngine(AbstractOcgisObject):
         else:
             itr = [None] if self.ops.geom is None else self.ops.geom
 
-        for coll in self._process_geometries_(itr, field, alias):
+        if self.ops.extract_stations and self.ops.geom is not None:
+            itr_colls = self._process_stations_(itr, field, alias)
+        else:
+            itr_colls = self._process_geometries_(itr, field, alias)
+
+        for coll in itr_colls:
             # Conform units following the spatial subset.
             if not vm.is_null and self.ops.conform_units_to is not None:
                 for to_conform in coll.iter_fields():
@@ -295,6 +347,12 @@ class OperationsEngine(AbstractOcgisObject):
 
         assert isinstance(field, Field)
 
+        # Distribute the selection geometries to a local process pool if requested.
+        if self._should_use_process_pool_(itr):
+            for coll in self._iter_process_pool_collections_(itr, field, alias):
+                yield coll
+            return
+
         ocgis_lh('processing geometries', self._subset_log, level=logging.DEBUG)
         # Process each geometry.
         for subset_field in itr:
@@ -379,10 +437,154 @@ class OperationsEngine(AbstractOcgisObject):
             # Add the created field to the output collection with the selection geometry.
             if sfield is None:
                 assert self.ops.aggregate
-            if sfield is not None:
-                coll.add_field(sfield, subset_field)
+            if sfield is not None and self._should_chunk_(sfield):
+                for coll in self._iter_chunked_collections_(sfield, subset_field):
+                    yield coll
+            else:
+                if sfield is not None:
+                    coll.add_field(sfield, subset_field)
+                yield coll
+
+    def _process_stations_(self, itr, field, alias):
+        """
+        Extract values for all point selection geometries in a single pass. See
+        :func:`~ocgis.spatial.nearest.get_station_field`.
 
+        :param itr: An iterator yielding point selection geometry :class:`~ocgis.Field` objects.
+        :param :class:`ocgis.Field` field: The target field for operations.
+        :param str alias: The request data alias currently being processed.
+        :rtype: :class:`~ocgis.SpatialCollection`
+        """
+
+        coll = self._get_initialized_collection_()
+        if vm.is_null:
             yield coll
+            return
+
+        geoms = []
+        ugids = []
+        crs = None
+        for subset_field in itr:
+            if subset_field.geom.geom_type != 'Point':
+                msg = 'Station extraction requires point selection geometries.'
+                ocgis_lh(exc=ValueError(msg), logger=self._subset_log)
+            geoms.append(subset_field.geom.get_value()[0])
+            ugids.append(subset_field.geom.ugid.get_value()[0])
+            crs = subset_field.crs
+        ocgis_lh(msg='Extracting values for {0} station(s).'.format(len(geoms)), logger=self._subset_log)
+
+        stations = GeometryVariable(name=VariableName.GEOMETRY_POINT, value=geoms, dimensions=DimensionName.STATION,
+                                    crs=deepcopy(crs))
+        ugid = create_typed_variable_from_data_model('int', data_model=get_data_model(self.ops),
+                                                     name=HeaderName.ID_GEOMETRY, value=ugids,
+                                                     dimensions=stations.dimensions)
+        stations.set_ugid(ugid)
+
+        key = constants.BackTransform.ROTATED_POLE
+        self._backtransform[key] = self._get_update_rotated_pole_state_(field, stations)
+        field = self._get_slice_or_snippet_(field)
+        if stations.crs is not None and stations.crs != field.crs:
+            stations.update_crs(field.crs)
+
+        sfield = get_station_field(field, stations)
+        if not self._request_base_size_only and (self.ops.calc is None or not self.ops.calc_raw):
+            sfield = _update_aggregation_wrapping_crs_(self, alias, sfield, None, None)
+            # Wrapping and coordinate system updates are applied to the station geometries.
+            update_station_coordinates(sfield, field.grid.x.name, field.grid.y.name)
+
+        coll.add_field(sfield, None)
+        yield coll
+
+    def _iter_chunked_collections_(self, sfield, subset_field):
+        """
+        Yield a collection for each chunk of a subsetted field.
+
+        :param sfield: The subsetted field to chunk.
+        :type sfield: :class:`~ocgis.Field`
+        :param subset_field: The selection geometry field used for the subset.
+        :type subset_field: :class:`~ocgis.Field` | None
+        :rtype: :class:`~ocgis.SpatialCollection`
+        """
+
+        schema = get_chunk_schema(sfield, self.ops.chunking)
+        ocgis_lh(msg='Executing operations in {0} chunk(s).'.format(len(schema)), logger=self._subset_log)
+        # Each chunk completes a fraction of the geometry's operations.
+        self._progress.n_chunks = len(schema)
+        try:
+            for chunk in schema:
+                coll = self._get_initialized_collection_()
+                coll.add_field(get_field_chunk(sfield, chunk), subset_field)
+                yield coll
+        finally:
+            self._progress.n_chunks = 1
+
+    def _iter_process_pool_collections_(self, itr, field, alias):
+        """
+        Process selection geometries using a local process pool. Each worker receives the field and operations once
+        when it is started. Collections are yielded in selection geometry order with the number of in-flight
+        geometries bounded by the worker count.
+
+        :param itr: An iterator yielding :class:`~ocgis.Field` objects for subsetting.
+        :param field: The target field for operations.
+        :type field: :class:`~ocgis.Field`
+        :param str alias: The request data alias currently being processed.
+        :rtype: :class:`~ocgis.SpatialCollection`
+        """
+
+        workers = self._get_worker_count_()
+        ocgis_lh(msg='Processing selection geometries using {0} local worker(s).'.format(workers),
+                 logger=self._subset_log)
+
+        with pool_scope(workers, self._get_pool_worker_state_(field=field, alias=alias)) as pool:
+            for colls, n_completed in iter_ordered_results(pool, _process_geometry_in_pool_worker_, itr, 2 * workers):
+                self._progress.n_completed_operations += n_completed
+                for coll in colls:
+                    yield coll
+
+    def _get_pool_worker_state_(self, field=None, alias=None):
+        """
+        :param field: The target field for operations.
+        :type field: :class:`~ocgis.Field`
+        :param str alias: The request data alias currently being processed.
+        :return: State sent to local pool workers. See :func:`~ocgis.util.helpers.pool_scope`.
+        :rtype: dict
+        """
+
+        return {'ops': self.ops, 'request_base_size_only': self._request_base_size_only, 'field': field,
+                'alias': alias}
+
+    def _get_worker_count_(self):
+        """:rtype: int"""
+        return self.ops.workers or multiprocessing.cpu_count()
+
+    def _should_use_process_pool_(self, itr):
+        """
+        :param itr: The selection geometry iterator.
+        :return: ``True`` if selection geometries should be processed using a local process pool.
+        :rtype: bool
+        """
+
+        if self.ops.executor != constants.ExecutorName.PROCESS or self._is_pool_worker or vm.size > 1:
+            ret = False
+        else:
+            # There is nothing to distribute if there is only a single selection geometry.
+            try:
+                ret = len(itr) > 1
+            except TypeError:
+                # Iterators without a length are assumed to have multiple elements.
+                ret = True
+        return ret
+
+    def _should_chunk_(self, sfield):
+        """
+        :param sfield: The subsetted field.
+        :type sfield: :class:`~ocgis.Field`
+        :return: ``True`` if the field should be processed in chunks.
+        :rtype: bool
+        """
+
+        return (self.ops.chunking is not None and not self._request_base_size_only and not vm.is_null and
+                not sfield.is_empty)
 
     def _get_nonspatial_subset_(self, field):
         """
@@ -692,6 +894,37 @@ def _update_wrapping_(obj, field_object):
                     field_object.unwrap()
 
 
+def _get_pool_worker_engine_():
+    # Create the operations engine once per local pool worker process.
+    try:
+        ret = POOL_WORKER_STATE['engine']
+    except KeyError:
+        ret = OperationsEngine(POOL_WORKER_STATE['ops'],
+                               request_base_size_only=POOL_WORKER_STATE['request_base_size_only'])
+        ret._is_pool_worker = True
+        POOL_WORKER_STATE['engine'] = ret
+    return ret
+
+
+def _get_pool_worker_result_(engine, itr):
+    # The worker engine's progress object is a copy. Return the operations completed by the worker with its collections
+    # so they are marked on the parent's progress object.
+    engine._progress.n_completed_operations = 0
+    colls = list(itr)
+    return colls, engine._progress.n_completed_operations
+
+
+def _process_geometry_in_pool_worker_(subset_field):
+    engine = _get_pool_worker_engine_()
+    itr = engine._process_geometries_([subset_field], POOL_WORKER_STATE['field'], POOL_WORKER_STATE['alias'])
+    return _get_pool_worker_result_(engine, itr)
+
+
+def _process_subsettables_in_pool_worker_(rds):
+    engine = _get_pool_worker_engine_()
+    return _get_pool_worker_result_(engine, engine._process_subsettables_(rds))
+
+
 def get_data_model(ops):
     if ops.output_format_options is None:
         ret = None
@@ -28,6 +28,7 @@ from ocgis.ops.parms import base
 from ocgis.ops.parms.definition_helpers import MetadataAttributes
 from ocgis.spatial.geom_cabinet import GeomCabinetIterator
 from ocgis.spatial.grid import Grid
+from ocgis.util.helpers import get_iter
 from ocgis.util.logging_ocgis import ocgis_lh
 from ocgis.util.units import get_units_class, get_units_object
 from ocgis.variable.crs import CoordinateReferenceSystem
@@ -396,6 +397,40 @@ class CalcSampleSize(base.BooleanParameter):
     meta_false = 'Statistical sample size not calculated.'
 
 
+class Chunking(base.AbstractParameter):
+    name = 'chunking'
+    default = None
+    input_types = [dict]
+    nullable = True
+    return_type = [dict]
+    _allowed_keys = ['memory', 'spatial', 'time']
+
+    def _get_meta_(self):
+        if self.value is None:
+            ret = 'Operations were executed without chunking.'
+        else:
+            ret = 'Operations were executed in chunks using the chunking definition: {0}.'.format(self.value)
+        return ret
+
+    def _validate_(self, value):
+        if len(value) == 0:
+            msg = 'Empty dictionaries are not allowed for chunking. Use None instead.'
+            raise DefinitionValidationError(self, msg)
+        if not set(value.keys()).issubset(set(self._allowed_keys)):
+            msg = 'Allowed chunking keys are "{0}".'.format(self._allowed_keys)
+            raise DefinitionValidationError(self, msg)
+        if value.get('spatial') is not None and value.get('memory') is not None:
+            msg = 'Only one of "spatial" or "memory" may be provided.'
+            raise DefinitionValidationError(self, msg)
+        for k, v in value.items():
+            if v is None:
+                continue
+            for element in get_iter(v):
+                if not isinstance(element, (int, np.integer)) or element <= 0:
+                    msg = 'Chunking values must be integers greater than zero. Bad value for "{0}": {1}'.format(k, v)
+                    raise DefinitionValidationError(self, msg)
+
+
 class ConformUnitsTo(base.AbstractParameter):
     name = 'conform_units_to'
     nullable = True
@@ -591,6 +626,27 @@ class DirOutput(base.StringParameter):
             raise DefinitionValidationError(self, 'Path does not exist: {}'.format(value))
 
 
+class Executor(base.StringOptionParameter):
+    name = 'executor'
+    default = constants.ExecutorName.SERIAL
+    valid = (constants.ExecutorName.SERIAL, constants.ExecutorName.PROCESS)
+
+    def _get_meta_(self):
+        if self.value == constants.ExecutorName.SERIAL:
+            ret = 'Datasets and selection geometries were processed sequentially.'
+        else:
+            ret = 'Datasets or selection geometries were processed in parallel using a local process pool.'
+        return ret
+
+
+class ExtractStations(base.BooleanParameter):
+    name = 'extract_stations'
+    default = False
+    meta_true = ('Values were extracted at the grid elements nearest to the point selection geometries and returned '
+                 'along a station dimension.')
+    meta_false = 'Selection geometries were processed individually.'
+
+
 class FileOnly(base.BooleanParameter):
     meta_true = 'File written with empty data.'
     meta_false = 'Actual data written to file.'
@@ -1070,7 +1126,8 @@ class RegridDestination(base.AbstractParameter):
 class RegridOptions(base.AbstractParameter):
     name = 'regrid_options'
     nullable = True
-    default = {'regrid_method': 'auto', 'value_mask': None, 'split': True}
+    default = {'regrid_method': 'auto', 'value_mask': None, 'split': True, 'weights_path': None,
+               'regrid_engine': constants.RegridEngine.ESMF}
     input_types = [dict]
     return_type = [dict]
     _possible_value_mask_types = [type(None), np.ndarray]
@@ -1093,6 +1150,14 @@ class RegridOptions(base.AbstractParameter):
             if value['value_mask'].dtype != np.bool:
                 msg = '"value_mask" must be a boolean array.'
                 raise DefinitionValidationError(self, msg)
+        if not isinstance(value.get('weights_path'), (type(None),) + six.string_types):
+            msg = '"weights_path" must be a string path.'
+            raise DefinitionValidationError(self, msg)
+        regrid_engine = value.get('regrid_engine', constants.RegridEngine.ESMF)
+        if regrid_engine not in (constants.RegridEngine.ESMF, constants.RegridEngine.SPARSE):
+            msg = '"regrid_engine" must be one of: {}'.format([constants.RegridEngine.ESMF,
+                                                              constants.RegridEngine.SPARSE])
+            raise DefinitionValidationError(self, msg)
 
         return value
 
@@ -1353,3 +1418,22 @@ class VectorWrap(base.BooleanParameter):
     default = True
     meta_true = 'Geographic coordinates wrapped from -180 to 180 degrees longitude.'
     meta_false = 'Geographic coordinates match the target dataset coordinate wrapping and may be in the range 0 to 360.'
+
+
+class Workers(base.AbstractParameter):
+    name = 'workers'
+    default = None
+    input_types = [int]
+    nullable = True
+    return_type = [int]
+
+    def _get_meta_(self):
+        if self.value is None:
+            ret = 'The number of local workers defaulted to the processor count.'
+        else:
+            ret = 'The number of local workers was {0}.'.format(self.value)
+        return ret
+
+    def _validate_(self, value):
+        if value <= 0:
+            raise DefinitionValidationError(self, msg='must be > 0')
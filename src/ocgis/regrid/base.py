@@ -1,13 +1,14 @@
+import hashlib
 import logging
+import os
 from copy import deepcopy
 from types import NoneType
 
-import ESMF
+import netCDF4 as nc
 import numpy as np
-from ESMF.api.constants import RegridMethod
 
 from ocgis import constants
-from ocgis import env
+from ocgis import env, vm
 from ocgis.base import AbstractOcgisObject, get_dimension_names
 from ocgis.collection.field import Field
 from ocgis.constants import DMK
@@ -20,6 +21,11 @@ from ocgis.util.logging_ocgis import ocgis_lh
 from ocgis.variable.base import Variable
 from ocgis.variable.crs import Spherical, create_crs
 
+# ESMF is not required when applying precomputed weights (see :mod:`ocgis.regrid.sparse`).
+if env.USE_ESMF:
+    import ESMF
+    from ESMF.api.constants import RegridMethod
+
 
 class RegridOperation(AbstractOcgisObject):
     """
@@ -31,7 +37,9 @@ class RegridOperation(AbstractOcgisObject):
     :type field_dst: :class:`ocgis.Field`
     :param subset_field: If provided, use this field to subset the regridding fields.
     :type subset_field: :class:`ocgis.Field`
-    :param regrid_options: A dictionary of keyword options to pass to :func:`~ocgis.regrid.base.regrid_field`.
+    :param regrid_options: A dictionary of keyword options to pass to :func:`~ocgis.regrid.base.regrid_field`. If the
+     ``'regrid_engine'`` option is :attr:`ocgis.constants.RegridEngine.SPARSE`, the options are passed to
+     :func:`~ocgis.regrid.sparse.regrid_field_sparse` instead.
     :type regrid_options: dict
     :param bool revert_dst_crs: If ``True``, revert the destination grid coordinate system if it needed to be
      transformed. Typically, a number of source fields are regridded to a common destination and this transform
@@ -64,7 +72,13 @@ class RegridOperation(AbstractOcgisObject):
 
         # Regrid the input field.
         ocgis_lh(logger='regrid', msg='Creating regridded field...', level=logging.INFO)
-        regridded_source = regrid_field(regrid_source, regrid_destination, **self.regrid_options)
+        regrid_options = self.regrid_options.copy()
+        regrid_engine = regrid_options.pop('regrid_engine', constants.RegridEngine.ESMF)
+        if regrid_engine == constants.RegridEngine.SPARSE:
+            from ocgis.regrid.sparse import regrid_field_sparse
+            regridded_source = regrid_field_sparse(regrid_source, regrid_destination, **regrid_options)
+        else:
+            regridded_source = regrid_field(regrid_source, regrid_destination, **regrid_options)
 
         if backtransform_src_crs is not None:
             regridded_source.update_crs(backtransform_src_crs)
@@ -516,15 +530,7 @@ def iter_esmf_fields(ofield, regrid_method='auto', value_mask=None, split=True):
         assert ofield.realization.shape[0] == 1
 
     # Retrieve the mask from the first variable.
-    if value_mask is None:
-        if ofield.time is not None:
-            sfield = ofield.get_field_slice({'time': 0})
-        else:
-            sfield = ofield
-        archetype = sfield.data_variables[0]
-        value_mask = archetype.get_mask()
-        if value_mask is not None and value_mask.ndim == 3 and value_mask.shape[0] == 1:
-            value_mask = np.squeeze(value_mask, 0)
+    value_mask = get_source_value_mask(ofield, value_mask=value_mask)
 
     # Create the ESMF grid.
     egrid = get_esmf_grid(ofield.grid, regrid_method=regrid_method, value_mask=value_mask)
@@ -620,9 +626,33 @@ def check_fields_for_regridding(source, destination, regrid_method='auto'):
             raise CornersInconsistentError(msg)
 
 
-def regrid_field(source, destination, regrid_method='auto', value_mask=None, split=True):
+def get_source_value_mask(ofield, value_mask=None):
+    """
+    :param ofield: The source field.
+    :type ofield: :class:`ocgis.Field`
+    :param value_mask: See :func:`~ocgis.regrid.base.get_esmf_grid`.
+    :type value_mask: :class:`numpy.ndarray`
+    :return: The value mask applied to the source field's ESMF grid. If ``value_mask`` is ``None``, this is the mask of
+     the first data variable's first time slice.
+    :rtype: :class:`numpy.ndarray` | ``None``
+    """
+
+    if value_mask is None:
+        if ofield.time is not None:
+            sfield = ofield.get_field_slice({'time': 0})
+        else:
+            sfield = ofield
+        archetype = sfield.data_variables[0]
+        value_mask = archetype.get_mask()
+        if value_mask is not None and value_mask.ndim == 3 and value_mask.shape[0] == 1:
+            value_mask = np.squeeze(value_mask, 0)
+    return value_mask
+
+
+def regrid_field(source, destination, regrid_method='auto', value_mask=None, split=True, weights_path=None):
     """
-    Regrid ``source`` data to match the grid of ``destination``.
+    Regrid ``source`` data to match the grid of ``destination``. Regridding weights are generated once and applied to
+    all data variables and time slices.
 
     :param source: The source field.
     :type source: :class:`ocgis.Field`
@@ -632,19 +662,26 @@ def regrid_field(source, destination, regrid_method='auto', value_mask=None, spl
     :param value_mask: See :func:`~ocgis.regrid.base.iter_esmf_fields`.
     :type value_mask: :class:`numpy.ndarray`
     :param bool split: See :func:`~ocgis.regrid.base.iter_esmf_fields`.
+    :param str weights_path: If provided, path to an ESMF weight file used to persist regridding weights. Weights are
+     loaded from the file if it was created for the same source grid, destination grid, regrid method, and mask (see
+     :func:`~ocgis.regrid.base.get_regrid_weight_key`). Otherwise, weights are generated and written to the file.
     :rtype: :class:`ocgis.Field`
     """
 
     # This function runs a series of asserts to make sure the sources and destination are compatible.
     check_fields_for_regridding(source, destination, regrid_method=regrid_method)
 
+    # The mask applied to the source ESMF grid is part of the regridding weight key.
+    source_value_mask = get_source_value_mask(source, value_mask=value_mask)
+
     # Regrid each source.
     ocgis_lh(logger='iter_regridded_fields', msg='starting source regrid loop', level=logging.DEBUG)
     # for source in sources:
     build = True
+    regrid = None
     fills = {}
     for variable_name, src_efield, tidx in iter_esmf_fields(source, regrid_method=regrid_method,
-                                                            value_mask=value_mask, split=split):
+                                                            value_mask=source_value_mask, split=split):
         # We need to generate new variables given the change in shape
         if variable_name not in fills:
             if source.time is not None:
@@ -678,17 +715,23 @@ def regrid_field(source, destination, regrid_method='auto', value_mask=None, spl
             regridded_source.grid.extract(clean_break=True)
             regridded_source.set_grid(destination.grid.extract())
 
+            # The destination ESMF field is reused for all variables and time slices.
+            dst_efield = ESMF.Field(esmf_destination_grid, name='destination', ndbounds=ndbounds)
+
             build = False
 
-        dst_efield = ESMF.Field(esmf_destination_grid, name='destination', ndbounds=ndbounds)
         fill_variable = fills[variable_name]
         fv = fill_variable.fill_value
         if fv is None:
             fv = np.ma.array([0], dtype=fill_variable.dtype).fill_value
         dst_efield.data.fill(fv)
-        # Construct the regrid object. Weight generation actually occurs in this call.
-        regrid = ESMF.Regrid(src_efield, dst_efield, unmapped_action=ESMF.UnmappedAction.IGNORE,
-                             regrid_method=regrid_method, src_mask_values=[0], dst_mask_values=[0])
+        # Construct the regrid object once. Weight generation actually occurs in this call. The source and destination
+        # grids do not change between variables and time slices.
+        if regrid is None:
+            regrid = get_esmf_regrid(src_efield, dst_efield, regrid_method, weights_path=weights_path,
+                                     key=get_regrid_weight_key(source.grid, destination.grid, regrid_method,
+                                                               value_mask=value_mask,
+                                                               source_value_mask=source_value_mask))
         # Perform the regrid operation. "zero_region" only fills values involved with regridding.
         regridded_esmf_field = regrid(src_efield, dst_efield, zero_region=ESMF.Region.SELECT)
         e_data = regridded_esmf_field.data
@@ -737,20 +780,117 @@ def regrid_field(source, destination, regrid_method='auto', value_mask=None, spl
             fv_mask[:, :] = fill_variable_mask
         fill_variable.set_mask(fv_mask)
 
-        # Destroy ESMF objects, but keep the grid until all splits have finished. If split=False, there is only one
-        # split.
-        destroy_esmf_objects([regrid, dst_efield, src_efield])
+        # Destroy the source ESMF field, but keep the regrid objects until all splits have finished. If split=False,
+        # there is only one split.
+        destroy_esmf_objects([src_efield])
 
         # Create a new variable collection and add the variables to the output field.
         # source.variables = VariableCollection()
         for v in list(fills.values()):
             regridded_source.add_variable(v, is_data=True, force=True)
 
-    destroy_esmf_objects([esmf_destination_grid])
+    destroy_esmf_objects([regrid, dst_efield, esmf_destination_grid])
 
     return regridded_source
 
 
+def get_esmf_regrid(src_efield, dst_efield, regrid_method, weights_path=None, key=None):
+    """
+    Create an ESMF regrid object. If a weight file path is provided, weights are loaded from the file when its key
+    matches. Otherwise, weights are generated and written to the file along with the key.
+
+    :param src_efield: The source ESMF field.
+    :type src_efield: :class:`ESMF.Field`
+    :param dst_efield: The destination ESMF field.
+    :type dst_efield: :class:`ESMF.Field`
+    :param regrid_method: The ESMF regrid method.
+    :type regrid_method: :attr:`ESMF.api.constants.RegridMethod`
+    :param str weights_path: Path to the ESMF weight file.
+    :param str key: The weight key stored in the weight file (see :func:`~ocgis.regrid.base.get_regrid_weight_key`).
+    :rtype: :class:`ESMF.Regrid`
+    """
+
+    if weights_path is None:
+        return ESMF.Regrid(src_efield, dst_efield, unmapped_action=ESMF.UnmappedAction.IGNORE,
+                           regrid_method=regrid_method, src_mask_values=[0], dst_mask_values=[0])
+
+    # Check for an existing weight file created with the same inputs.
+    if vm.rank == 0:
+        existing_key = None
+        if os.path.exists(weights_path):
+            with nc.Dataset(weights_path) as ds:
+                existing_key = getattr(ds, constants.REGRID_WEIGHT_KEY_ATTR, None)
+        is_reusable = existing_key is not None and existing_key == key
+        if not is_reusable and os.path.exists(weights_path):
+            os.remove(weights_path)
+    else:
+        is_reusable = None
+    is_reusable = vm.bcast(is_reusable)
+
+    if is_reusable:
+        ocgis_lh(logger='regrid', msg='loading weights from: {}'.format(weights_path), level=logging.DEBUG)
+        ret = ESMF.RegridFromFile(src_efield, dst_efield, weights_path)
+    else:
+        ocgis_lh(logger='regrid', msg='writing weights to: {}'.format(weights_path), level=logging.DEBUG)
+        ret = ESMF.Regrid(src_efield, dst_efield, filename=weights_path, unmapped_action=ESMF.UnmappedAction.IGNORE,
+                          regrid_method=regrid_method, src_mask_values=[0], dst_mask_values=[0])
+        vm.barrier()
+        if vm.rank == 0:
+            with nc.Dataset(weights_path, mode='a') as ds:
+                ds.setncattr(constants.REGRID_WEIGHT_KEY_ATTR, key)
+                ds.setncattr(constants.REGRID_WEIGHT_ENGINE_ATTR, constants.RegridEngine.ESMF)
+        vm.barrier()
+    return ret
+
+
+def get_regrid_weight_key(source_grid, destination_grid, regrid_method, value_mask=None, source_value_mask=None):
+    """
+    Create a key identifying regridding weights. The key changes if grid coordinates, bounds, or masks change. For
+    distributed grids, the key is computed from all ranks' grid elements. Regrid methods are identified by name so
+    ESMF and native regrid methods create the same key (see :func:`~ocgis.regrid.sparse.regrid_field_sparse`).
+
+    :param source_grid: The source grid.
+    :type source_grid: :class:`~ocgis.Grid`
+    :param destination_grid: The destination grid.
+    :type destination_grid: :class:`~ocgis.Grid`
+    :param regrid_method: The resolved regrid method. ``None`` is bilinear as with ESMF.
+    :param value_mask: See :func:`~ocgis.regrid.base.iter_esmf_fields`.
+    :type value_mask: :class:`numpy.ndarray`
+    :param source_value_mask: The value mask applied to the source ESMF grid. See
+     :func:`~ocgis.regrid.base.get_source_value_mask`.
+    :type source_value_mask: :class:`numpy.ndarray`
+    :rtype: str
+    """
+
+    sha = hashlib.sha1()
+    for grid in (source_grid, destination_grid):
+        if grid.is_empty:
+            continue
+        targets = [grid.get_value_stacked(), grid.get_mask()]
+        if grid.has_bounds:
+            targets += [grid.x.bounds.get_value(), grid.y.bounds.get_value()]
+        for target in targets:
+            if target is None:
+                sha.update(b'None')
+            else:
+                sha.update(np.ascontiguousarray(target).tobytes())
+    for name, mask in (('value_mask', value_mask), ('source_value_mask', source_value_mask)):
+        if mask is not None:
+            sha.update(name.encode())
+            sha.update(np.ascontiguousarray(mask).tobytes())
+    if regrid_method is None:
+        regrid_method = 'bilinear'
+    sha.update(str(getattr(regrid_method, 'name', regrid_method)).lower().encode())
+    local = sha.hexdigest()
+
+    digests = vm.gather(local)
+    if vm.rank == 0:
+        ret = hashlib.sha1(''.join(digests).encode()).hexdigest()
+    else:
+        ret = None
+    return vm.bcast(ret)
+
+
 def destroy_esmf_objects(objs):
     for obj in objs:
         obj.destroy()
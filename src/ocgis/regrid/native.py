@@ -0,0 +1,219 @@
+import numpy as np
+
+from ocgis.exc import RegriddingError
+from ocgis.regrid.sparse import SparseWeights
+from ocgis.spatial.nearest import get_is_spherical
+
+
+class NativeRegridMethod(object):
+    BILINEAR = 'bilinear'
+    CONSERVE = 'conserve'
+
+
+def create_rectilinear_weights(source_grid, destination_grid, regrid_method='auto'):
+    """
+    Create regridding weights for rectilinear source and destination grids without ESMF. Grid dimensions are separable
+    so weights are the products of one-dimensional weights along each axis.
+
+    First-order conservative weights are fractions of destination cell areas overlapped by source cells. On spherical
+    coordinate systems, cell areas are computed for cells bounded by lines of constant longitude and latitude. Bilinear
+    weights interpolate between the source cell centers surrounding each destination cell center. Longitudes are
+    treated as periodic on spherical coordinate systems.
+
+    Weights are created for all elements regardless of masks. Masks are applied when weights are applied (see
+    :meth:`~ocgis.regrid.sparse.SparseWeights.apply`).
+
+    :param source_grid: The source grid. It must be vectorized.
+    :type source_grid: :class:`~ocgis.Grid`
+    :param destination_grid: The destination grid. It must be vectorized.
+    :type destination_grid: :class:`~ocgis.Grid`
+    :param regrid_method: If ``'auto'``, use conservative weights if both grids have bounds. Otherwise, use bilinear
+     weights. May also be a :class:`~ocgis.regrid.native.NativeRegridMethod` value or the equivalent ESMF regrid method.
+    :rtype: :class:`~ocgis.regrid.sparse.SparseWeights`
+    :raises: RegriddingError
+    """
+
+    for grid in (source_grid, destination_grid):
+        if not grid.is_vectorized:
+            raise RegriddingError('Native weight generation requires rectilinear (vectorized) grids.')
+    regrid_method = get_native_regrid_method(source_grid, destination_grid, regrid_method)
+
+    is_spherical = get_is_spherical(source_grid.crs)
+    period = 360. if is_spherical else None
+    axes = []
+    for name in ('y', 'x'):
+        src_coordinate = getattr(source_grid, name)
+        dst_coordinate = getattr(destination_grid, name)
+        if regrid_method == NativeRegridMethod.CONSERVE:
+            src_lower, src_upper = get_cell_edges(src_coordinate.bounds.get_value())
+            dst_lower, dst_upper = get_cell_edges(dst_coordinate.bounds.get_value())
+            if is_spherical and name == 'y':
+                # Spherical cell areas are proportional to the difference in the sine of the latitude edges.
+                src_lower, src_upper, dst_lower, dst_upper = [np.sin(np.radians(np.clip(e, -90., 90.))) for e in
+                                                              (src_lower, src_upper, dst_lower, dst_upper)]
+            axis_period = period if name == 'x' else None
+            axes.append(get_conservative_weights_1d(src_lower, src_upper, dst_lower, dst_upper, period=axis_period))
+        else:
+            src_centers = src_coordinate.get_value()
+            axis_period = None
+            if name == 'x' and period is not None and get_is_periodic(src_centers, period):
+                axis_period = period
+            axes.append(get_bilinear_weights_1d(src_centers, dst_coordinate.get_value(), period=axis_period))
+
+    # Combine the weights along each axis. Grid elements are flattened in C order.
+    (dst_y, src_y, weights_y), (dst_x, src_x, weights_x) = axes
+    src_shape = source_grid.shape
+    dst_shape = destination_grid.shape
+    row = (dst_y[:, np.newaxis] * dst_shape[1] + dst_x[np.newaxis, :]).reshape(-1) + 1
+    col = (src_y[:, np.newaxis] * src_shape[1] + src_x[np.newaxis, :]).reshape(-1) + 1
+    weights = (weights_y[:, np.newaxis] * weights_x[np.newaxis, :]).reshape(-1)
+
+    return SparseWeights(row, col, weights, n_dst=dst_shape[0] * dst_shape[1], n_src=src_shape[0] * src_shape[1])
+
+
+def get_bilinear_weights_1d(src_centers, dst_centers, period=None):
+    """
+    Create one-dimensional linear interpolation weights. Destination centers outside the source centers are unmapped.
+
+    :param src_centers: Source cell centers. They must be monotonic.
+    :type src_centers: :class:`numpy.ndarray`
+    :param dst_centers: Destination cell centers.
+    :type dst_centers: :class:`numpy.ndarray`
+    :param float period: If provided, coordinates are periodic with this period.
+    :returns: A tuple of zero-based destination indices, zero-based source indices, and weights.
+    :rtype: tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`, :class:`numpy.ndarray`)
+    """
+
+    src_centers = np.asarray(src_centers, dtype=float)
+    dst_centers = np.asarray(dst_centers, dtype=float)
+    order = np.argsort(src_centers)
+    centers = src_centers[order]
+    if period is not None:
+        # Add the cells adjacent across the periodic boundary and move destination centers into the source range.
+        centers = np.hstack(([centers[-1] - period], centers, [centers[0] + period]))
+        order = np.hstack(([order[-1]], order, [order[0]]))
+        dst_centers = centers[1] + np.mod(dst_centers - centers[1], period)
+
+    position = np.searchsorted(centers, dst_centers, side='right') - 1
+    # Destination centers equal to the last source center use the last interval.
+    position[dst_centers == centers[-1]] = centers.shape[0] - 2
+    select = np.logical_and(position >= 0, position < centers.shape[0] - 1)
+    dst_index = np.flatnonzero(select)
+    position = position[select]
+    lower = centers[position]
+    upper = centers[position + 1]
+    fraction = (dst_centers[select] - lower) / (upper - lower)
+
+    dst_index = np.hstack((dst_index, dst_index))
+    src_index = np.hstack((order[position], order[position + 1]))
+    weights = np.hstack((1. - fraction, fraction))
+    keep = weights > 0
+    return dst_index[keep], src_index[keep], weights[keep]
+
+
+def get_cell_edges(bounds):
+    """
+    :param bounds: Cell bounds with shape ``(<number of cells>, 2)``. Bounds may be in either order.
+    :type bounds: :class:`numpy.ndarray`
+    :returns: A tuple of lower and upper cell edges.
+    :rtype: tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`)
+    """
+
+    bounds = np.asarray(bounds, dtype=float)
+    return bounds.min(axis=1), bounds.max(axis=1)
+
+
+def get_conservative_weights_1d(src_lower, src_upper, dst_lower, dst_upper, period=None):
+    """
+    Create one-dimensional first-order conservative weights. The weight for a source and destination cell pair is the
+    length of their overlap divided by the destination cell length.
+
+    :param src_lower: Lower source cell edges. Source cells must not overlap.
+    :type src_lower: :class:`numpy.ndarray`
+    :param src_upper: Upper source cell edges.
+    :type src_upper: :class:`numpy.ndarray`
+    :param dst_lower: Lower destination cell edges.
+    :type dst_lower: :class:`numpy.ndarray`
+    :param dst_upper: Upper destination cell edges.
+    :type dst_upper: :class:`numpy.ndarray`
+    :param float period: If provided, coordinates are periodic with this period.
+    :returns: See :func:`~ocgis.regrid.native.get_bilinear_weights_1d`.
+    :rtype: tuple(:class:`numpy.ndarray`, :class:`numpy.ndarray`, :class:`numpy.ndarray`)
+    """
+
+    order = np.argsort(src_lower)
+    src_lower = np.asarray(src_lower, dtype=float)[order]
+    src_upper = np.asarray(src_upper, dtype=float)[order]
+    dst_lower = np.asarray(dst_lower, dtype=float)
+    dst_upper = np.asarray(dst_upper, dtype=float)
+
+    shifts = [0.] if period is None else [-period, 0., period]
+    dst_indices, src_indices, overlaps = [], [], []
+    for shift in shifts:
+        lower = src_lower + shift
+        upper = src_upper + shift
+        # Source cells overlapping a destination cell are contiguous in the sorted source cells.
+        start = np.searchsorted(upper, dst_lower, side='right')
+        stop = np.searchsorted(lower, dst_upper, side='left')
+        counts = np.maximum(stop - start, 0)
+        dst_index = np.repeat(np.arange(dst_lower.shape[0]), counts)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        src_index = np.repeat(start, counts) + offsets
+        overlap = np.minimum(upper[src_index], dst_upper[dst_index]) - np.maximum(lower[src_index],
+                                                                                   dst_lower[dst_index])
+        keep = overlap > 0
+        dst_indices.append(dst_index[keep])
+        src_indices.append(order[src_index[keep]])
+        overlaps.append(overlap[keep])
+
+    dst_index = np.hstack(dst_indices)
+    overlap = np.hstack(overlaps)
+    weights = overlap / (dst_upper - dst_lower)[dst_index]
+    return dst_index, np.hstack(src_indices), weights
+
+
+def get_is_periodic(centers, period):
+    """
+    :param centers: Cell centers.
+    :type centers: :class:`numpy.ndarray`
+    :param float period: The coordinate period.
+    :returns: ``True`` if evenly spaced cell centers cover the period.
+    :rtype: bool
+    """
+
+    centers = np.sort(np.asarray(centers, dtype=float))
+    if centers.shape[0] < 2:
+        return False
+    spacing = np.diff(centers).mean()
+    return bool(np.isclose(centers[-1] - centers[0] + spacing, period, rtol=1e-3))
+
+
+def get_native_regrid_method(source_grid, destination_grid, regrid_method):
+    """
+    :param source_grid: The source grid.
+    :type source_grid: :class:`~ocgis.Grid`
+    :param destination_grid: The destination grid.
+    :type destination_grid: :class:`~ocgis.Grid`
+    :param regrid_method: See :func:`~ocgis.regrid.native.create_rectilinear_weights`. ``None`` is bilinear as with
+     ESMF.
+    :returns: The :class:`~ocgis.regrid.native.NativeRegridMethod` value.
+    :rtype: str
+    :raises: RegriddingError
+    """
+
+    if regrid_method == 'auto':
+        if source_grid.has_bounds and destination_grid.has_bounds:
+            ret = NativeRegridMethod.CONSERVE
+        else:
+            ret = NativeRegridMethod.BILINEAR
+    elif regrid_method is None:
+        ret = NativeRegridMethod.BILINEAR
+    else:
+        # ESMF regrid methods are enumerations.
+        ret = str(getattr(regrid_method, 'name', regrid_method)).lower()
+        if ret not in (NativeRegridMethod.BILINEAR, NativeRegridMethod.CONSERVE):
+            raise RegriddingError('Regrid method not supported for native weight generation: {}'.format(regrid_method))
+
+    if ret == NativeRegridMethod.CONSERVE and not (source_grid.has_bounds and destination_grid.has_bounds):
+        raise RegriddingError('Conservative weights require bounds on the source and destination grids.')
+    return ret
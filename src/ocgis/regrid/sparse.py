@@ -0,0 +1,334 @@
+import os
+from collections import OrderedDict
+from copy import deepcopy
+
+import netCDF4 as nc
+import numpy as np
+
+from ocgis import constants
+from ocgis import env, vm
+from ocgis.base import AbstractOcgisObject, get_dimension_names
+from ocgis.collection.field import Field
+from ocgis.driver.metadata_cache import MetadataCache
+from ocgis.exc import RegriddingError
+from ocgis.regrid.base import get_regrid_weight_key, get_source_value_mask
+from ocgis.variable.base import Variable
+
+
+class SparseWeights(AbstractOcgisObject):
+    """
+    Regridding weights stored as a sparse matrix mapping flattened source elements to flattened destination elements.
+    A :class:`scipy.sparse.csr_matrix` is used if :attr:`ocgis.env.USE_SCIPY` is ``True``. Otherwise, weights are applied
+    using NumPy scatter-adds.
+
+    Indices follow the ESMF weight file convention. They are one-based and refer to grid elements flattened in C order
+    (i.e. the x-dimension varies fastest). This is also the convention for weight files merged by
+    :meth:`~ocgis.spatial.grid_splitter.GridSplitter.create_merged_weight_file`.
+
+    :param row: One-based destination element indices.
+    :type row: :class:`numpy.ndarray`
+    :param col: One-based source element indices.
+    :type col: :class:`numpy.ndarray`
+    :param weights: The weight for each row/column pair.
+    :type weights: :class:`numpy.ndarray`
+    :param int n_dst: The number of destination elements. If ``None``, use the maximum row index.
+    :param int n_src: The number of source elements. If ``None``, use the maximum column index.
+    :raises: RegriddingError
+    """
+
+    def __init__(self, row, col, weights, n_dst=None, n_src=None):
+        self.row = np.asarray(row, dtype=np.int64) - 1
+        self.col = np.asarray(col, dtype=np.int64) - 1
+        self.weights = np.asarray(weights, dtype=np.float64)
+
+        if n_dst is None:
+            n_dst = int(self.row.max()) + 1 if self.row.size > 0 else 0
+        if n_src is None:
+            n_src = int(self.col.max()) + 1 if self.col.size > 0 else 0
+        self.n_dst = n_dst
+        self.n_src = n_src
+        for name, index, size in (('row', self.row, n_dst), ('col', self.col, n_src)):
+            if index.size > 0 and (index.min() < 0 or index.max() >= size):
+                msg = 'Weight "{}" indices are out of bounds for {} elements.'.format(name, size)
+                raise RegriddingError(msg)
+
+        if env.USE_SCIPY:
+            from scipy.sparse import csr_matrix
+            self._matrix = csr_matrix((self.weights, (self.row, self.col)), shape=(n_dst, n_src))
+        else:
+            self._matrix = None
+
+        #: The sum of weights for each destination element. Destination elements with a sum of zero are unmapped.
+        self.total = self.dot(np.ones((1, n_src)))[0]
+
+    @classmethod
+    def from_file(cls, path, n_dst=None, n_src=None):
+        """
+        Load weights from a netCDF weight file containing ``row``, ``col``, and ``S`` variables.
+
+        :param str path: Path to the weight file.
+        :param int n_dst: See :class:`~ocgis.regrid.sparse.SparseWeights`. If ``None``, use the ESMF ``n_b`` dimension
+         if present.
+        :param int n_src: See :class:`~ocgis.regrid.sparse.SparseWeights`. If ``None``, use the ESMF ``n_a`` dimension
+         if present.
+        :rtype: :class:`~ocgis.regrid.sparse.SparseWeights`
+        :raises: RegriddingError
+        """
+
+        sizes = {'n_b': n_dst, 'n_a': n_src}
+        with nc.Dataset(path) as ds:
+            row = ds.variables['row'][:]
+            col = ds.variables['col'][:]
+            weights = ds.variables['S'][:]
+            for name, size in list(sizes.items()):
+                if name in ds.dimensions:
+                    file_size = len(ds.dimensions[name])
+                    if size is not None and size != file_size:
+                        msg = 'Weight file dimension "{}" has size {}. Expected {}.'.format(name, file_size, size)
+                        raise RegriddingError(msg)
+                    sizes[name] = file_size
+        return cls(row, col, weights, n_dst=sizes['n_b'], n_src=sizes['n_a'])
+
+    def apply(self, values, mask=None):
+        """
+        Apply weights to a block of source values. Masked source elements are excluded and the remaining weights for
+        each destination element are renormalized to the element's total weight. Destination elements are masked if
+        they are unmapped or all their source elements are masked.
+
+        :param values: Source values with shape ``(<block size>, n_src)``.
+        :type values: :class:`numpy.ndarray`
+        :param mask: If provided, ``True`` source elements are masked. The shape must match ``values``.
+        :type mask: :class:`numpy.ndarray`
+        :return: Destination values with shape ``(<block size>, n_dst)``.
+        :rtype: :class:`numpy.ma.MaskedArray`
+        """
+
+        values = np.asarray(values, dtype=np.float64)
+        is_unmapped = self.total == 0
+        if mask is None or not mask.any():
+            ret = self.dot(values)
+            ret_mask = np.zeros(ret.shape, dtype=bool)
+            ret_mask[:, is_unmapped] = True
+        else:
+            valid = np.invert(mask)
+            ret = self.dot(np.where(valid, values, 0.))
+            valid_total = self.dot(valid.astype(np.float64))
+            ret_mask = np.invert(valid_total > 0)
+            select = np.invert(ret_mask)
+            ret[select] *= np.broadcast_to(self.total, ret.shape)[select] / valid_total[select]
+        ret[ret_mask] = 0.
+        return np.ma.array(ret, mask=ret_mask)
+
+    def write(self, path, key=None):
+        """
+        Write weights to a netCDF weight file. Indices are written one-based as in ESMF weight files. The ``n_a`` and
+        ``n_b`` dimensions contain the source and destination element counts.
+
+        :param str path: Path to the output weight file.
+        :param str key: If provided, the weight key stored in the weight file (see
+         :func:`~ocgis.regrid.base.get_regrid_weight_key`) along with the sparse regrid engine name.
+        """
+
+        with nc.Dataset(path, mode='w') as ds:
+            ds.createDimension('n_s', self.weights.shape[0])
+            ds.createDimension('n_a', self.n_src)
+            ds.createDimension('n_b', self.n_dst)
+            for name, value, dtype in (('row', self.row + 1, np.int32), ('col', self.col + 1, np.int32),
+                                       ('S', self.weights, np.float64)):
+                ds.createVariable(name, dtype, ('n_s',))[:] = value
+            if key is not None:
+                ds.setncattr(constants.REGRID_WEIGHT_KEY_ATTR, key)
+                ds.setncattr(constants.REGRID_WEIGHT_ENGINE_ATTR, constants.RegridEngine.SPARSE)
+
+    def dot(self, values):
+        """
+        :param values: Source values with shape ``(<block size>, n_src)``.
+        :type values: :class:`numpy.ndarray`
+        :return: The weighted sums with shape ``(<block size>, n_dst)``.
+        :rtype: :class:`numpy.ndarray`
+        """
+
+        if self._matrix is None:
+            ret = np.zeros((values.shape[0], self.n_dst), dtype=np.float64)
+            np.add.at(ret, (slice(None), self.row), values[:, self.col] * self.weights)
+        else:
+            ret = np.asarray(self._matrix.dot(values.T).T)
+        return ret
+
+
+class SparseWeightsCache(AbstractOcgisObject):
+    """
+    Least recently used cache of weights loaded from files. Entries are keyed by the weight file path, size, and
+    modification time (see :meth:`~ocgis.driver.metadata_cache.MetadataCache.get_key`) and the destination and source
+    element counts.
+
+    :param int max_entries: The maximum number of cached weights.
+    """
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+
+    def clear(self):
+        self._entries.clear()
+
+    def get(self, path, n_dst=None, n_src=None):
+        """
+        Return weights from the cache loading them from file if they are not cached.
+
+        :param str path: Path to the weight file.
+        :param int n_dst: See :meth:`~ocgis.regrid.sparse.SparseWeights.from_file`.
+        :param int n_src: See :meth:`~ocgis.regrid.sparse.SparseWeights.from_file`.
+        :rtype: :class:`~ocgis.regrid.sparse.SparseWeights`
+        """
+
+        key = (MetadataCache.get_key(path), n_dst, n_src)
+        ret = self._entries.pop(key, None)
+        if ret is None:
+            ret = SparseWeights.from_file(path, n_dst=n_dst, n_src=n_src)
+        # Add the entry to the end to mark it as most recently used.
+        self._entries[key] = ret
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return ret
+
+
+#: Process-wide cache for weights loaded from files.
+_SPARSE_WEIGHTS_CACHE = SparseWeightsCache(constants.SPARSE_WEIGHTS_CACHE_SIZE)
+
+
+def get_sparse_weights_cache():
+    """
+    :return: The process-wide cache for weights loaded from files.
+    :rtype: :class:`~ocgis.regrid.sparse.SparseWeightsCache`
+    """
+
+    return _SPARSE_WEIGHTS_CACHE
+
+
+def regrid_field_sparse(source, destination, regrid_method='auto', value_mask=None, split=True, weights_path=None):
+    """
+    Regrid ``source`` data to match the grid of ``destination`` by applying sparse weights. ESMF is not required.
+    Weight files are loaded once per process (see :func:`~ocgis.regrid.sparse.get_sparse_weights_cache`). If there is
+    no weight file, weights are generated for rectilinear grids (see
+    :func:`~ocgis.regrid.native.create_rectilinear_weights`).
+
+    Grid dimensions of each data variable are flattened and weights are applied to blocks of the remaining dimensions.
+    The output variables have the non-grid dimensions of the source variables followed by the destination grid
+    dimensions.
+
+    :param source: The source field.
+    :type source: :class:`ocgis.Field`
+    :param destination: The destination field.
+    :type destination: :class:`ocgis.Field`
+    :param regrid_method: The regrid method used when generating weights. See
+     :func:`~ocgis.regrid.native.create_rectilinear_weights`. It is part of the weight key when ``weights_path`` is
+     provided.
+    :param value_mask: If provided, ``True`` elements of the source grid are masked.
+    :type value_mask: :class:`numpy.ndarray`
+    :param bool split: If ``True``, apply weights to blocks of :attr:`ocgis.constants.SPARSE_REGRID_BLOCK_SIZE`
+     non-grid elements. If ``False``, apply weights to all elements at once.
+    :param str weights_path: Path to the weight file. See :meth:`~ocgis.regrid.sparse.SparseWeights.from_file`. A
+     weight file with a key is loaded only if its key matches the grids, masks, and regrid method (see
+     :func:`~ocgis.regrid.base.get_regrid_weight_key`). The key is the same as for weight files written by
+     :func:`~ocgis.regrid.base.regrid_field`. Weight files without a key (i.e. merged by
+     :meth:`~ocgis.spatial.grid_splitter.GridSplitter.create_merged_weight_file`) are always loaded. If the file does
+     not exist or was written by the sparse engine with a different key, generated weights are written to the file
+     along with the key.
+    :rtype: :class:`ocgis.Field`
+    :raises: RegriddingError
+    """
+
+    for element in [source, destination]:
+        if not isinstance(element, Field) or element.grid is None:
+            raise RegriddingError('Fields with grids are required for regridding.')
+    if source.crs != destination.crs:
+        raise RegriddingError('Source and destination coordinate systems must be equal.')
+    src_grid = source.grid
+    dst_grid = destination.grid
+    if vm.size > 1 and any([d.dist for g in (src_grid, dst_grid) for d in g.dimensions]):
+        raise RegriddingError('Sparse regridding does not support distributed grids.')
+
+    # The native weights module imports this module.
+    from ocgis.regrid.native import create_rectilinear_weights, get_native_regrid_method
+
+    n_src = int(np.prod(src_grid.shape))
+    n_dst = int(np.prod(dst_grid.shape))
+    key = None
+    is_reusable = False
+    if weights_path is not None:
+        # Resolve the regrid method and masks as regrid_field does so weight files written by ESMF have the same key.
+        if regrid_method == 'auto':
+            regrid_method = get_native_regrid_method(src_grid, dst_grid, regrid_method)
+        source_value_mask = get_source_value_mask(source, value_mask=value_mask)
+        key = get_regrid_weight_key(src_grid, dst_grid, regrid_method, value_mask=value_mask,
+                                    source_value_mask=source_value_mask)
+        msg = None
+        if vm.rank == 0 and os.path.exists(weights_path):
+            with nc.Dataset(weights_path) as ds:
+                existing_key = getattr(ds, constants.REGRID_WEIGHT_KEY_ATTR, None)
+                existing_engine = getattr(ds, constants.REGRID_WEIGHT_ENGINE_ATTR, None)
+            # Weight files without a key were not created by a regrid engine (i.e. merged weight files).
+            is_reusable = existing_key is None or existing_key == key
+            # Only weight files written by the sparse engine are replaced.
+            if not is_reusable and existing_engine != constants.RegridEngine.SPARSE:
+                msg = 'Weight file "{}" does not match the regridding inputs. Remove it to regenerate weights.'
+                msg = msg.format(weights_path)
+        is_reusable, msg = vm.bcast((is_reusable, msg))
+        if msg is not None:
+            raise RegriddingError(msg)
+
+    if is_reusable:
+        weights = get_sparse_weights_cache().get(weights_path, n_dst=n_dst, n_src=n_src)
+    else:
+        weights = create_rectilinear_weights(src_grid, dst_grid, regrid_method=regrid_method)
+        if weights_path is not None:
+            if vm.rank == 0:
+                weights.write(weights_path, key=key)
+            vm.barrier()
+
+    src_grid_mask = src_grid.get_mask()
+    if value_mask is not None:
+        src_grid_mask = value_mask if src_grid_mask is None else np.logical_or(src_grid_mask, value_mask)
+    dst_grid_mask = dst_grid.get_mask()
+
+    # Prepare the regridded source field. This amounts to exchanging the grids between the objects.
+    regridded_source = source.copy()
+    regridded_source.grid.extract(clean_break=True)
+    regridded_source.set_grid(dst_grid.extract())
+
+    grid_names = get_dimension_names(src_grid.dimensions)
+    for variable in source.data_variables:
+        dimension_names = get_dimension_names(variable.dimensions)
+        if any([n not in dimension_names for n in grid_names]):
+            msg = 'Data variable "{}" does not have the grid dimensions.'.format(variable.name)
+            raise RegriddingError(msg)
+        axes = [dimension_names.index(n) for n in grid_names]
+        others = [d for d in variable.dimensions if d.name not in grid_names]
+        other_shape = [len(d) for d in others]
+
+        # Move grid dimensions to the end and flatten them.
+        value = variable.get_masked_value()
+        src_values = np.moveaxis(value.data, axes, range(-len(axes), 0)).reshape(-1, n_src)
+        src_mask = np.moveaxis(np.ma.getmaskarray(value), axes, range(-len(axes), 0)).reshape(-1, n_src)
+        if src_grid_mask is not None:
+            src_mask = np.logical_or(src_mask, src_grid_mask.reshape(1, n_src))
+
+        dst_values = np.zeros((src_values.shape[0], n_dst), dtype=variable.dtype)
+        dst_mask = np.zeros(dst_values.shape, dtype=bool)
+        block_size = constants.SPARSE_REGRID_BLOCK_SIZE if split else max(1, src_values.shape[0])
+        for start in range(0, src_values.shape[0], block_size):
+            stop = start + block_size
+            applied = weights.apply(src_values[start:stop], mask=src_mask[start:stop])
+            dst_values[start:stop] = applied.data
+            dst_mask[start:stop] = applied.mask
+        if dst_grid_mask is not None:
+            dst_mask = np.logical_or(dst_mask, dst_grid_mask.reshape(1, n_dst))
+
+        new_shape = other_shape + list(dst_grid.shape)
+        new_variable = Variable(name=variable.name, dimensions=others + list(dst_grid.dimensions),
+                                value=dst_values.reshape(new_shape), mask=dst_mask.reshape(new_shape),
+                                dtype=variable.dtype, fill_value=variable.fill_value, attrs=deepcopy(variable.attrs))
+        regridded_source.add_variable(new_variable, is_data=True, force=True)
+
+    return regridded_source
@@ -3,7 +3,7 @@ from abc import abstractmethod
 
 import numpy as np
 import six
-from pyproj import Proj, transform
+from pyproj import transform
 from shapely.geometry import box
 
 from ocgis import Variable, SourcedVariable, vm
@@ -467,11 +467,9 @@ class AbstractXYZSpatialContainer(AbstractSpatialContainer):
         elif isinstance(to_crs, crs.CFRotatedPole):
             to_crs.update_with_rotated_pole_transformation(self, inverse=True)
         else:
-            src_proj4 = self.crs.proj4
-            dst_proj4 = to_crs.proj4
-
-            src_proj4 = Proj(src_proj4)
-            dst_proj4 = Proj(dst_proj4)
+            cache = crs.get_spatial_reference_cache()
+            src_proj4 = cache.get_proj(self.crs.proj4)
+            dst_proj4 = cache.get_proj(to_crs.proj4)
 
             y = self.y
             x = self.x
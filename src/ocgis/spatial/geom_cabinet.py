@@ -1,8 +1,11 @@
+import itertools
 import os
 from collections import OrderedDict
 
 import fiona
+import numpy as np
 import ogr
+import shapely
 from shapely import wkb
 
 from ocgis import env
@@ -116,41 +119,14 @@ class GeomCabinet(object):
             yld = Field.from_records(gic, meta['schema'], crs=meta['crs'], uid=uid, union=True, data_model=data_model)
             yield yld
         else:
-            if slc is not None and (select_uid is not None or select_sql_where is not None):
-                exc = ValueError('Slice is not allowed with other select statements.')
-                ocgis_lh(exc=exc, logger='geom_cabinet')
-
-            # Format the slice for iteration. We will get the features by index if a slice is provided.
-            if slc is not None:
-                slc = get_index_slice_for_iteration(slc)
-
             # Open the target geometry file.
             ds = ogr.Open(shp_path)
             try:
-                # Return the features iterator.
-                features = self._get_features_object_(ds, uid=uid, select_uid=select_uid,
-                                                      select_sql_where=select_sql_where, driver_kwargs=driver_kwargs)
-
-                # Using slicing, we will select the features individually from the object.
-                if slc is None:
-                    itr = features
-                else:
-                    # The geodatabase API requires iterations to get the given location.
-                    if self.get_gdal_driver(shp_path) == 'OpenFileGDB' or isinstance(slc, slice):
-                        def _o_itr_(features_object, slice_start, slice_stop):
-                            for ctr2, fb in enumerate(features_object):
-                                # ... iterate until start is reached.
-                                if ctr2 < slice_start:
-                                    continue
-                                # ... stop if we have reached the stop.
-                                elif ctr2 == slice_stop:
-                                    raise StopIteration
-                                yield fb
-
-                        itr = _o_itr_(features, slc.start, slc.stop)
-                    else:
-                        # Convert the slice index to an integer to avoid type conflict in GDAL layer.
-                        itr = (features.GetFeature(int(idx)) for idx in slc)
+                # Return the features iterator applying any selection or slice.
+                features, itr = self._get_features_iterator_(ds, shp_path, uid=uid, select_uid=select_uid,
+                                                             select_sql_where=select_sql_where, slc=slc,
+                                                             driver_kwargs=driver_kwargs)
+                names = get_field_names(features)
 
                 # Convert feature objects to record dictionaries.
                 for ctr, feature in enumerate(itr):
@@ -158,8 +134,7 @@ class GeomCabinet(object):
                         yld = {'geom': wkb.loads(feature.geometry().ExportToWkb())}
                     else:
                         yld = {}
-                    items = feature.items()
-                    properties = OrderedDict([(key, items[key]) for key in feature.keys()])
+                    properties = OrderedDict([(name, feature.GetField(idx)) for idx, name in enumerate(names)])
                     yld.update({'properties': properties, 'meta': meta})
 
                     if ctr == 0:
@@ -192,6 +167,111 @@ class GeomCabinet(object):
                     ds.Destroy()
                     ds = None
 
+    def get_columns(self, key=None, select_uid=None, path=None, load_geoms=True, uid=None, select_sql_where=None,
+                    slc=None, driver_kwargs=None):
+        """
+        Load attributes and geometries as arrays with one element per feature. This avoids creating a record dictionary
+        for each feature. Selection arguments are the same as :meth:`~ocgis.GeomCabinet.iter_geoms`.
+
+        :returns: A tuple containing an ordered dictionary of attribute arrays with attribute names as keys and an
+         object array of geometries. Integer and float attributes are masked arrays with null values masked. Other
+         attributes are object arrays with null values set to ``None``. The unique identifier is added as with
+         :meth:`~ocgis.GeomCabinet.iter_geoms`. Geometries are ``None`` if ``load_geoms`` is ``False``.
+        :rtype: tuple(:class:`collections.OrderedDict`, :class:`numpy.ndarray`)
+        :raises: ValueError
+        """
+
+        shp_path = self._get_path_by_key_or_direct_path_(key=key, path=path)
+
+        ds = ogr.Open(shp_path)
+        try:
+            features, itr = self._get_features_iterator_(ds, shp_path, uid=uid, select_uid=select_uid,
+                                                         select_sql_where=select_sql_where, slc=slc,
+                                                         driver_kwargs=driver_kwargs)
+            names = get_field_names(features)
+            definition = features.GetLayerDefn()
+            field_types = [definition.GetFieldDefn(idx).GetType() for idx in range(len(names))]
+
+            # Collect values by column.
+            values = [[] for _ in names]
+            fids = []
+            wkbs = []
+            for feature in itr:
+                for idx, column in enumerate(values):
+                    column.append(feature.GetField(idx))
+                fids.append(feature.GetFID())
+                if load_geoms:
+                    geometry = feature.geometry()
+                    wkbs.append(None if geometry is None else bytes(geometry.ExportToWkb()))
+        finally:
+            if ds is not None:
+                ds.Destroy()
+                ds = None
+
+        if len(fids) == 0:
+            msg = 'No features returned from target data source. Were features appropriately selected?'
+            raise ValueError(msg)
+
+        columns = OrderedDict()
+        for name, field_type, column in zip(names, field_types, values):
+            columns[name] = get_column_array(column, field_type)
+
+        uid, add_uid = get_uid_from_properties(OrderedDict([(k, v[0]) for k, v in columns.items()]), uid)
+        if add_uid:
+            columns[uid] = np.ma.array(fids, dtype=int, mask=False)
+        else:
+            columns[uid] = np.ma.array(columns[uid], dtype=int)
+
+        if load_geoms:
+            if env.USE_VECTORIZED_GEOMETRY:
+                geoms = shapely.from_wkb(np.array(wkbs, dtype=object))
+            else:
+                geoms = np.array([None] * len(wkbs), dtype=object)
+                for idx, element in enumerate(wkbs):
+                    if element is not None:
+                        geoms[idx] = wkb.loads(element)
+        else:
+            geoms = None
+
+        return columns, geoms
+
+    def _get_features_iterator_(self, ds, shp_path, uid=None, select_uid=None, select_sql_where=None, slc=None,
+                                driver_kwargs=None):
+        """
+        :returns: A tuple containing the features object (see :meth:`~ocgis.GeomCabinet._get_features_object_`) and an
+         iterator over its features with any slice applied.
+        :rtype: tuple
+        """
+
+        if slc is not None and (select_uid is not None or select_sql_where is not None):
+            exc = ValueError('Slice is not allowed with other select statements.')
+            ocgis_lh(exc=exc, logger='geom_cabinet')
+
+        # Format the slice for iteration. We will get the features by index if a slice is provided.
+        if slc is not None:
+            slc = get_index_slice_for_iteration(slc)
+
+        features = self._get_features_object_(ds, uid=uid, select_uid=select_uid, select_sql_where=select_sql_where,
+                                              driver_kwargs=driver_kwargs)
+
+        # Using slicing, we will select the features individually from the object.
+        if slc is None:
+            itr = features
+        elif self.get_gdal_driver(shp_path) == 'OpenFileGDB':
+            # The geodatabase API requires iterations to get the given location.
+            if isinstance(slc, slice):
+                itr = itertools.islice(features, slc.start, slc.stop)
+            else:
+                wanted = set([int(idx) for idx in slc])
+                itr = (fb for ctr, fb in enumerate(features) if ctr in wanted)
+        elif isinstance(slc, slice):
+            itr = _iter_layer_range_(features, slc.start, slc.stop)
+        else:
+            # Convert the slice index to an integer to avoid type conflict in GDAL layer.
+            itr = (features.GetFeature(int(idx)) for idx in slc)
+
+        return features, itr
+
     def _get_path_by_key_or_direct_path_(self, key=None, path=None):
         """
         :param str key:
@@ -377,6 +457,50 @@ class GeomCabinetIterator(object):
                     ds = None
         return ret
 
+    def get_columns(self):
+        """
+        Return attribute and geometry arrays as from :meth:`ocgis.GeomCabinet.get_columns`.
+        """
+
+        return self.sc.get_columns(key=self.key, select_uid=self.select_uid, path=self.path,
+                                   load_geoms=self.load_geoms, uid=self.uid, select_sql_where=self.select_sql_where,
+                                   slc=self.slc, driver_kwargs=self.driver_kwargs)
+
+
+def get_column_array(values, field_type):
+    """
+    :param list values: Attribute values for a single field with ``None`` for null values.
+    :param int field_type: The OGR field type.
+    :returns: A masked array for integer and float fields. An object array otherwise.
+    :rtype: :class:`numpy.ndarray`
+    """
+
+    if field_type in (ogr.OFTInteger, ogr.OFTInteger64):
+        dtype = int
+    elif field_type == ogr.OFTReal:
+        dtype = float
+    else:
+        ret = np.array([None] * len(values), dtype=object)
+        ret[:] = values
+        return ret
+
+    mask = np.array([v is None for v in values], dtype=bool)
+    if mask.any():
+        values = [0 if v is None else v for v in values]
+    return np.ma.array(np.array(values, dtype=dtype), mask=mask)
+
+
+def get_field_names(features):
+    """
+    :param features: The features object.
+    :type features: :class:`osgeo.ogr.Layer`
+    :returns: Attribute field names in field order.
+    :rtype: list
+    """
+
+    definition = features.GetLayerDefn()
+    return [definition.GetFieldDefn(idx).GetName() for idx in range(definition.GetFieldCount())]
+
 
 def get_uid_from_properties(properties, uid):
     """
@@ -432,3 +556,13 @@ def get_gdal_driver(ds):
 def get_index_slice_for_iteration(slc):
     slc = get_formatted_slice(slc, 1)[0]
     return slc
+
+
+def _iter_layer_range_(features, start, stop):
+    # Position the layer at the start feature avoiding reads for skipped features.
+    features.SetNextByIndex(start)
+    for _ in range(start, stop):
+        feature = features.GetNextFeature()
+        if feature is None:
+            break
+        yield feature
@@ -462,8 +462,21 @@ class AbstractGeometryCoordinates(AbstractXYZSpatialContainer):
 
         return self.__shapely_geometry_class__(*args, **kwargs)
 
-    def get_spatial_index(self):
-        raise NotImplementedError
+    def get_spatial_index(self, *args, **kwargs):
+        """
+        See :meth:`~ocgis.GeometryVariable.get_spatial_index`. The spatial index is created from the converted geometry
+        variable and keyed in the spatial index cache using the coordinate variables.
+        """
+
+        kwargs = kwargs.copy()
+        cache_sources = list(self.coordinate_variables)
+        if self.cindex is not None:
+            cache_sources.append(self.cindex)
+        kwargs['cache_sources'] = kwargs.get('cache_sources') or cache_sources
+        if kwargs.get('target') is None and kwargs.get('original_mask') is None:
+            # Masked elements are converted to empty geometry values.
+            kwargs['original_mask'] = self.get_mask()
+        return self.convert_to().get_spatial_index(*args, **kwargs)
 
     @format_gridunstruct_return
     def get_spatial_subset_operation(self, spatial_op, subset_geom, return_slice=False, original_mask=None,
@@ -573,6 +586,10 @@ class AbstractGeometryCoordinates(AbstractXYZSpatialContainer):
             if not original_mask.all():
                 if perform_intersection:
                     geometry_fill = np.zeros(fill_mask.shape, dtype=object)
+                if env.USE_SPATIAL_INDEX and env.DIR_SPATIAL_INDEX_CACHE is not None:
+                    # Only create geometries for elements whose bounding boxes intersect the subset geometry.
+                    original_mask = self._get_spatial_index_hint_mask_(subset_geom, original_mask)
+                    fill_mask = original_mask
                 gp = GeometryProcessor(self.get_geometry_iterable(hint_mask=original_mask), subset_geom,
                                        keep_touches=keep_touches)
                 for idx, intersects_logical, current_geometry in gp.iter_intersects():
@@ -626,6 +643,34 @@ class AbstractGeometryCoordinates(AbstractXYZSpatialContainer):
 
         return ret
 
+    def _get_spatial_index_hint_mask_(self, subset_geom, hint_mask):
+        """
+        Exclude elements whose bounding boxes do not intersect the subset geometry using the cached spatial index. See
+        :meth:`~ocgis.spatial.geomc.AbstractGeometryCoordinates.get_spatial_index`.
+
+        :param subset_geom: The subset geometry.
+        :type subset_geom: :class:`shapely.geometry.base.BaseGeometry`
+        :param hint_mask: Boolean array with ``True`` values excluded from spatial consideration.
+        :type hint_mask: :class:`numpy.ndarray`
+        :rtype: :class:`numpy.ndarray`
+        """
+
+        # Spatial index identifiers are the positions of unmasked elements.
+        element_index = np.arange(hint_mask.shape[0])
+        mask = self.get_mask()
+        if mask is not None:
+            element_index = element_index[np.invert(mask)]
+
+        ret = np.ones(hint_mask.shape, dtype=bool)
+        si = self.get_spatial_index()
+        try:
+            for idx in si.iter_rtree_intersection(subset_geom):
+                ret[element_index[idx]] = False
+        finally:
+            # Release the index files of cached indexes.
+            si.close()
+        return np.logical_or(ret, hint_mask)
+
     def iter_geometries(self, **kwargs):
         for yld in self.get_geometry_iterable(**kwargs):
             yield yld
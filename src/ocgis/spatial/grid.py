@@ -3,6 +3,7 @@ import itertools
 from collections import OrderedDict
 
 import numpy as np
+import shapely
 import six
 from shapely.geometry import Polygon, Point, box
 from shapely.geometry.base import BaseGeometry, BaseMultipartGeometry
@@ -21,7 +22,7 @@ from ocgis.spatial.geomc import AbstractGeometryCoordinates, PolygonGC, PointGC,
 from ocgis.util.helpers import get_formatted_slice, get_iter
 from ocgis.variable.base import get_dslice, get_dimension_lengths
 from ocgis.variable.dimension import Dimension
-from ocgis.variable.geom import GeometryVariable, get_masking_slice, GeometryProcessor
+from ocgis.variable.geom import GeometryVariable, get_masking_slice, GeometryProcessor, get_intersects_array
 from ocgis.vmachine.mpi import MPI_SIZE
 
 CreateGeometryFromWkb, Geometry, wkbGeometryCollection, wkbPoint = ogr.CreateGeometryFromWkb, ogr.Geometry, \
@@ -42,14 +43,64 @@ class GridGeometryProcessor(GeometryProcessor):
         geometry_iterable = self.get_geometry_iterable()
         super(GridGeometryProcessor, self).__init__(geometry_iterable, subset_geometry, keep_touches=keep_touches)
 
+    @property
+    def abstraction(self):
+        """
+        :return: the geometry abstraction to construct for the grid elements
+        :rtype: str
+        """
+        if self.use_bounds:
+            ret = self.grid.abstraction
+        else:
+            ret = GridAbstraction.POINT
+        return ret
+
+    def get_geometry_array(self, fill=None):
+        """
+        Construct the grid element geometries in bulk. Geometries are not constructed for hint-masked elements.
+
+        :param fill: The object array to fill. If ``None``, a new array filled with ``None`` is created.
+        :type fill: :class:`numpy.ndarray`
+        :rtype: :class:`numpy.ndarray`
+        """
+        if fill is None:
+            fill = np.empty(self.grid.shape, dtype=object)
+
+        abstraction = self.abstraction
+        if abstraction == GridAbstraction.POINT:
+            get_point_geometry_array(self.grid, fill, mask=self.hint_mask)
+        elif abstraction == GridAbstraction.POLYGON:
+            get_polygon_geometry_array(self.grid, fill, mask=self.hint_mask)
+        else:
+            raise NotImplementedError(abstraction)
+        return fill
+
+    def get_intersects_array(self, geometries=None):
+        """
+        Evaluate the intersects predicate for all grid elements in a single call. This is the bulk equivalent of
+        :meth:`~ocgis.variable.geom.GeometryProcessor.iter_intersects`.
+
+        :param geometries: The grid element geometries. If ``None``, use :meth:`~GridGeometryProcessor.get_geometry_array`.
+        :type geometries: :class:`numpy.ndarray`
+        :return: boolean array with the grid's shape with intersecting elements set to ``True``. Hint-masked elements
+         are always ``False``.
+        :rtype: :class:`numpy.ndarray`
+        """
+        if geometries is None:
+            geometries = self.get_geometry_array()
+        return get_intersects_array(geometries, self.subset_geometry, keep_touches=self.keep_touches)
+
     def get_geometry_iterable(self):
+        if env.USE_VECTORIZED_GEOMETRY:
+            fill = self.get_geometry_array()
+            for idx in itertools.product(*[list(range(ii)) for ii in fill.shape]):
+                yield idx, fill[idx]
+            return
+
         grid = self.grid
         hint_mask = self.hint_mask
         is_vectorized = grid.is_vectorized
-        if self.use_bounds:
-            abstraction = grid.abstraction
-        else:
-            abstraction = 'point'
+        abstraction = self.abstraction
 
         if abstraction == 'point':
             x_data = grid.x.get_value()
@@ -560,6 +611,23 @@ class Grid(AbstractGrid, AbstractXYZSpatialContainer):
     def get_nearest(self, *args, **kwargs):
         return self.get_abstraction_geometry().get_nearest(*args, **kwargs).parent.grid
 
+    def get_nearest_index(self, spherical=None):
+        """
+        Create a nearest neighbor index from the grid's center coordinates. Build the index once and reuse it for
+        repeated nearest neighbor queries (i.e. with :meth:`~ocgis.Grid.get_nearest` or when mapping many points to grid
+        indices).
+
+        :param bool spherical: If ``True``, use great-circle distances. If ``None``, use great-circle distances for
+         geographic coordinate systems.
+        :rtype: :class:`~ocgis.spatial.nearest.NearestIndex`
+        """
+        from ocgis.spatial.nearest import NearestIndex, get_is_spherical
+
+        if spherical is None:
+            spherical = get_is_spherical(self.crs)
+        stacked = self.get_value_stacked()
+        return NearestIndex(stacked[1], stacked[0], mask=self.get_mask(), spherical=spherical)
+
     def get_point(self, value=None, mask=None):
         return get_geometry_variable(self, value=value, mask=mask, use_bounds=False)
 
@@ -567,6 +635,9 @@ class Grid(AbstractGrid, AbstractXYZSpatialContainer):
         return get_geometry_variable(self, value=value, mask=mask, use_bounds=True)
 
     def get_spatial_index(self, *args, **kwargs):
+        # Abstraction geometries are created on demand. Key any cached index using the grid's coordinate variables.
+        kwargs = kwargs.copy()
+        kwargs['cache_sources'] = kwargs.get('cache_sources') or self.coordinate_variables
         return self.get_abstraction_geometry().get_spatial_index(*args, **kwargs)
 
     def get_report(self):
@@ -717,10 +788,15 @@ class Grid(AbstractGrid, AbstractXYZSpatialContainer):
                     new_intersects_target = subset_geom
                 gp = GridGeometryProcessor(self, new_intersects_target, original_mask, keep_touches=keep_touches,
                                            use_bounds=use_bounds)
-                for idx, intersects_logical, current_geometry in gp.iter_intersects():
-                    fill_mask[idx] = not intersects_logical
-                    if perform_intersection and intersects_logical:
-                        geometry_fill[idx] = current_geometry.intersection(subset_geom)
+                geometries = gp.get_geometry_array()
+                intersects = gp.get_intersects_array(geometries=geometries)
+                fill_mask[:] = np.invert(intersects)
+                if perform_intersection:
+                    if env.USE_VECTORIZED_GEOMETRY:
+                        geometry_fill[intersects] = shapely.intersection(geometries[intersects], subset_geom)
+                    else:
+                        for idx in zip(*np.nonzero(intersects)):
+                            geometry_fill[idx] = geometries[idx].intersection(subset_geom)
 
             if perform_intersection:
                 if geometry_fill is None:
@@ -1153,17 +1229,43 @@ def update_crs_with_geometry_collection(src_sr, to_sr, value_row, value_col):
         value_row[ii] = geom.GetY()
 
 
-def get_polygon_geometry_array(grid, fill):
+def get_polygon_geometry_array(grid, fill, mask=None):
+    """
+    Create polygons for the grid's bounds/corners regardless if the data is masked.
+
+    :param grid: The source grid.
+    :type grid: :class:`~ocgis.Grid`
+    :param fill: The object array to fill with polygons. It must have the same shape as the grid.
+    :type fill: :class:`numpy.ndarray`
+    :param mask: If provided, polygons are not created for ``True`` values.
+    :type mask: :class:`numpy.ndarray`
+    :rtype: :class:`numpy.ndarray`
+    """
+
+    if not grid.has_bounds:
+        msg = 'A grid must have bounds/corners to construct polygons. Consider using "set_extrapolated_bounds".'
+        raise GridDeficientError(msg)
+
     is_vectorized = grid.is_vectorized
+    x_bounds = grid.x.bounds.get_value()
+    y_bounds = grid.y.bounds.get_value()
 
-    if grid.has_bounds:
-        # We want geometries for everything even if masked.
-        x_bounds = grid.x.bounds.get_value()
-        y_bounds = grid.y.bounds.get_value()
+    if env.USE_VECTORIZED_GEOMETRY:
+        rows, cols = get_geometry_array_indices(grid.shape, mask)
+        if is_vectorized:
+            x_min, x_max = np.min(x_bounds, axis=1), np.max(x_bounds, axis=1)
+            y_min, y_max = np.min(y_bounds, axis=1), np.max(y_bounds, axis=1)
+            fill[rows, cols] = shapely.box(x_min[cols], y_min[rows], x_max[cols], y_max[rows])
+        else:
+            coords = np.stack((x_bounds[rows, cols, :], y_bounds[rows, cols, :]), axis=-1)
+            fill[rows, cols] = shapely.polygons(coords)
+    else:
         range_row = list(range(grid.shape[0]))
         range_col = list(range(grid.shape[1]))
         if is_vectorized:
             for row, col in itertools.product(range_row, range_col):
+                if mask is not None and mask[row, col]:
+                    continue
                 min_x, max_x = np.min(x_bounds[col, :]), np.max(x_bounds[col, :])
                 min_y, max_y = np.min(y_bounds[row, :]), np.max(y_bounds[row, :])
                 polygon = box(min_x, min_y, max_x, max_y)
@@ -1173,37 +1275,72 @@ def get_polygon_geometry_array(grid, fill):
             corners = np.vstack((y_bounds, x_bounds))
             corners = corners.reshape([2] + list(x_bounds.shape))
             for row, col in itertools.product(range_row, range_col):
+                if mask is not None and mask[row, col]:
+                    continue
                 current_corner = corners[:, row, col]
                 coords = np.hstack((current_corner[1, :].reshape(-1, 1),
                                     current_corner[0, :].reshape(-1, 1)))
                 polygon = Polygon(coords)
                 fill[row, col] = polygon
-    else:
-        msg = 'A grid must have bounds/corners to construct polygons. Consider using "set_extrapolated_bounds".'
-        raise GridDeficientError(msg)
 
     return fill
 
 
-def get_point_geometry_array(grid, fill):
-    """Create geometries for all the underlying coordinates regardless if the data is masked."""
+def get_point_geometry_array(grid, fill, mask=None):
+    """
+    Create points for all the underlying coordinates regardless if the data is masked.
+
+    :param grid: The source grid.
+    :type grid: :class:`~ocgis.Grid`
+    :param fill: The object array to fill with points. It must have the same shape as the grid.
+    :type fill: :class:`numpy.ndarray`
+    :param mask: If provided, points are not created for ``True`` values.
+    :type mask: :class:`numpy.ndarray`
+    :rtype: :class:`numpy.ndarray`
+    """
 
     x_data = grid.x.get_value()
     y_data = grid.y.get_value()
     is_vectorized = grid.is_vectorized
 
-    for idx_row, idx_col in itertools.product(*[list(range(ii)) for ii in grid.shape]):
+    if env.USE_VECTORIZED_GEOMETRY:
+        rows, cols = get_geometry_array_indices(grid.shape, mask)
         if is_vectorized:
-            y = y_data[idx_row]
-            x = x_data[idx_col]
+            fill[rows, cols] = shapely.points(x_data[cols], y_data[rows])
         else:
-            y = y_data[idx_row, idx_col]
-            x = x_data[idx_row, idx_col]
-        pt = Point(x, y)
-        fill[idx_row, idx_col] = pt
+            fill[rows, cols] = shapely.points(x_data[rows, cols], y_data[rows, cols])
+    else:
+        for idx_row, idx_col in itertools.product(*[list(range(ii)) for ii in grid.shape]):
+            if mask is not None and mask[idx_row, idx_col]:
+                continue
+            if is_vectorized:
+                y = y_data[idx_row]
+                x = x_data[idx_col]
+            else:
+                y = y_data[idx_row, idx_col]
+                x = x_data[idx_row, idx_col]
+            pt = Point(x, y)
+            fill[idx_row, idx_col] = pt
     return fill
 
 
+def get_geometry_array_indices(shape, mask=None):
+    """
+    :param tuple shape: The two-dimensional grid shape.
+    :param mask: If provided, ``True`` values are excluded from the returned indices.
+    :type mask: :class:`numpy.ndarray`
+    :return: flat row and column index arrays for the grid elements to consider
+    :rtype: tuple
+    """
+
+    if mask is None:
+        rows, cols = np.indices(shape)
+        rows, cols = rows.reshape(-1), cols.reshape(-1)
+    else:
+        rows, cols = np.nonzero(np.invert(mask))
+    return rows, cols
+
+
 def get_geometry_variable(grid, value=None, mask=None, use_bounds=True):
     is_empty = grid.is_empty
     if is_empty:
@@ -1214,11 +1351,7 @@ def get_geometry_variable(grid, value=None, mask=None, use_bounds=True):
             mask = grid.get_mask()
         if value is None:
             gp = GridGeometryProcessor(grid, None, mask, use_bounds=use_bounds)
-            itr = gp.get_geometry_iterable()
-            value = np.zeros(grid.shape, dtype=object)
-            for idx, geometry in itr:
-                if geometry is not None:
-                    value[idx] = geometry
+            value = gp.get_geometry_array(fill=np.zeros(grid.shape, dtype=object))
     if grid.abstraction == 'point':
         name = grid._point_name
     else:
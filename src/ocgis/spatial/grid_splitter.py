@@ -1,6 +1,9 @@
 import itertools
 import logging
+import multiprocessing
 import os
+from collections import OrderedDict
+from functools import partial
 
 import netCDF4 as nc
 import numpy as np
@@ -8,11 +11,12 @@ from shapely.geometry import box
 
 from ocgis import Dimension, vm
 from ocgis import Variable
-from ocgis.base import AbstractOcgisObject
+from ocgis.base import AbstractOcgisObject, get_dimension_names
 from ocgis.collection.field import Field
-from ocgis.constants import GridSplitterConstants, RegriddingRole, Topology
+from ocgis.constants import GridSplitterConstants, RegriddingRole, Topology, ExecutorName
 from ocgis.driver.request.core import RequestDataset
 from ocgis.spatial.grid import GridUnstruct, AbstractGrid
+from ocgis.util.helpers import iter_ordered_results, pool_scope, POOL_WORKER_STATE
 from ocgis.util.logging_ocgis import ocgis_lh
 from ocgis.variable.base import VariableCollection
 from ocgis.variable.geom import GeometryVariable
@@ -160,17 +164,23 @@ class GridSplitter(AbstractOcgisObject):
             ret = ret.format(index)
         return ret
 
-    def create_merged_weight_file(self, merged_weight_filename, strict=False):
+    def create_merged_weight_file(self, merged_weight_filename, strict=False, executor=ExecutorName.SERIAL,
+                                  workers=None):
         """
-        Merge weight file chunks to a single, global weight file.
+        Merge weight file chunks to a single, global weight file. Output offsets for each chunk are computed before any
+        chunk is remapped so chunks may be remapped concurrently. When running with MPI, each rank remaps a round-robin
+        share of the chunks and ranks write their chunks in turn.
 
         :param str merged_weight_filename: Path to the merged weight file.
         :param bool strict: If ``False``, allow "missing" files where the iterator index cannot create a found file.
          It is best to leave these ``False`` as not all source and destinations are mapped. If ``True``, raise an
+         ``IOError``.
+        :param str executor: The local executor used to remap chunks in serial (``vm.size == 1``). Either ``'serial'``
+         or ``'process'``. See :class:`~ocgis.constants.ExecutorName`.
+        :param int workers: The number of local workers. If ``None``, use the CPU count.
         """
 
-        if vm.size > 1:
-            raise ValueError("'create_merged_weight_file' does not work in parallel")
+        _validate_executor_(executor)
 
         index_filename = self.create_full_path_from_template('index_file')
         ifile = RequestDataset(uri=index_filename).get()
@@ -181,60 +191,82 @@ class GridSplitter(AbstractOcgisObject):
         src_global_shape = gidx[ifc.NAME_SRC_GRID_SHAPE]
         dst_global_shape = gidx[ifc.NAME_DST_GRID_SHAPE]
 
-        # Get the global weight dimension size.
-        n_s_size = 0
+        # Count the weights in this rank's share of the split weight files.
         weight_filename = ifile[gidx[ifc.NAME_WEIGHTS_VARIABLE]]
         wv = weight_filename.join_string_value()
         split_weight_file_directory = self.paths['wd']
-        for wfn in map(lambda x: os.path.join(split_weight_file_directory, x), wv):
+        weight_paths = [os.path.join(split_weight_file_directory, x) for x in wv]
+        counts = OrderedDict()
+        missing = []
+        for ii in range(vm.rank, len(weight_paths), vm.size):
+            wfn = weight_paths[ii]
             if not os.path.exists(wfn):
-                if strict:
-                    raise IOError(wfn)
-                else:
-                    continue
-            n_s_size += RequestDataset(wfn).get().dimensions['n_s'].size
+                missing.append(wfn)
+                continue
+            with nc.Dataset(wfn) as wds:
+                counts[ii] = len(wds.dimensions['n_s'])
+
+        # Compute the output offset for each chunk on the root rank.
+        gathered = vm.gather((counts, missing))
+        if vm.rank == 0:
+            offsets = OrderedDict()
+            missing = []
+            n_s_size = 0
+            counts = {}
+            for rank_counts, rank_missing in gathered:
+                counts.update(rank_counts)
+                missing += rank_missing
+            for ii in sorted(counts):
+                offsets[ii] = n_s_size
+                n_s_size += counts[ii]
+            offsets = (offsets, missing)
+        else:
+            offsets = None
+        offsets, missing = vm.bcast(offsets)
+        if strict and len(missing) > 0:
+            raise IOError(missing[0])
 
         # Create output weight file.
-        wf_varnames = ['row', 'col', 'S']
-        wf_dtypes = [np.int32, np.int32, np.float64]
-        vc = VariableCollection()
-        dim = Dimension('n_s', n_s_size)
-        for w, wd in zip(wf_varnames, wf_dtypes):
-            var = Variable(name=w, dimensions=dim, dtype=wd)
-            vc.add_variable(var)
-        vc.write(merged_weight_filename)
+        with vm.scoped('create merged weight file', [0]):
+            if not vm.is_null:
+                wf_varnames = ['row', 'col', 'S']
+                wf_dtypes = [np.int32, np.int32, np.float64]
+                vc = VariableCollection()
+                dim = Dimension('n_s', n_s_size)
+                for w, wd in zip(wf_varnames, wf_dtypes):
+                    var = Variable(name=w, dimensions=dim, dtype=wd)
+                    vc.add_variable(var)
+                vc.write(merged_weight_filename)
+        vm.barrier()
 
         # Transfer weights to the merged file.
-        sidx = 0
         src_indices = self.src_grid._gs_create_global_indices_(src_global_shape)
         dst_indices = self.dst_grid._gs_create_global_indices_(dst_global_shape)
-
-        out_wds = nc.Dataset(merged_weight_filename, 'a')
-        for ii, wfn in enumerate(map(lambda x: os.path.join(split_weight_file_directory, x), wv)):
-            if not os.path.exists(wfn):
-                if strict:
-                    raise IOError(wfn)
-                else:
-                    continue
-            wdata = RequestDataset(wfn).get()
-            for wvn in wf_varnames:
-                odata = wdata[wvn].get_value()
-                try:
-                    split_grids_directory = self.paths['wd']
-                    odata = self._gs_remap_weight_variable_(ii, wvn, odata, src_indices, dst_indices, ifile, gidx,
-                                                            split_grids_directory=split_grids_directory)
-                except IndexError as e:
-                    msg = "Weight filename: '{}'; Weight Variable Name: '{}'. {}".format(wfn, wvn, e.message)
-                    raise IndexError(msg)
-                out_wds[wvn][sidx:sidx + odata.size] = odata
-                out_wds.sync()
-            sidx += odata.size
-        out_wds.close()
+        chunks = [(ii, weight_paths[ii]) for ii in offsets if ii % vm.size == vm.rank]
+
+        if vm.size > 1 or executor == ExecutorName.SERIAL or len(chunks) <= 1:
+            remapped = (self._gs_get_merged_weight_chunk_(ii, wfn, src_indices, dst_indices, ifile, gidx)
+                        for ii, wfn in chunks)
+            if vm.size > 1:
+                # Ranks share the output file so only one rank writes at a time.
+                remapped = list(remapped)
+            for rank in range(vm.size):
+                if rank == vm.rank and len(chunks) > 0:
+                    _write_merged_weight_chunks_(merged_weight_filename, offsets, chunks, remapped)
+                if vm.size > 1:
+                    vm.barrier()
+        else:
+            workers = workers or multiprocessing.cpu_count()
+            state = {'grid_splitter': self, 'merge': (src_indices, dst_indices, ifile, gidx)}
+            with pool_scope(workers, state) as pool:
+                remapped = iter_ordered_results(pool, _get_merged_weight_chunk_in_pool_worker_, chunks, 2 * workers)
+                _write_merged_weight_chunks_(merged_weight_filename, offsets, chunks, remapped)
 
     @staticmethod
     def insert_weighted(index_path, dst_wd, dst_master_path):
         """
-        Inserted weighted, destination variable data into the master destination file.
+        Inserted weighted, destination variable data into the master destination file. The master file is opened once
+        and each destination split file is read once. All time steps for a split are written in a single hyperslab.
 
         :param str index_path: Path to the split index netCDF file.
         :param str dst_wd: Working directory containing the destination files holding the weighted data.
@@ -256,20 +288,20 @@ class GridSplitter(AbstractOcgisObject):
 
         joined = dst_filenames.join_string_value()
         dst_master_field = RequestDataset(dst_master_path).get()
+        # Dimension names for the data variables in the master file. Split file values are transposed to match.
+        master_dimensions = OrderedDict()
         for data_variable in dst_master_field.data_variables:
             assert data_variable.ndim == 3
             assert not data_variable.has_allocated_value
-            for time_index in range(dst_master_field.time.shape[0]):
-                for vidx, source_path in enumerate(joined):
-                    source_path = os.path.join(dst_wd, source_path)
-                    slc = {dst_master_field.time.dimensions[0].name: time_index,
-                           dst_master_field.y.dimensions[0].name: slice(None),
-                           dst_master_field.x.dimensions[0].name: slice(None)}
-                    source_data = RequestDataset(source_path).get()[data_variable.name][slc]
-                    assert not source_data.has_allocated_value
-                    with nc.Dataset(dst_master_path, 'a') as ds:
-                        ds.variables[data_variable.name][time_index, y_bounds[vidx][0]:y_bounds[vidx][1],
-                        x_bounds[vidx][0]:x_bounds[vidx][1]] = source_data.get_value()
+            master_dimensions[data_variable.name] = get_dimension_names(data_variable.dimensions)
+        source_paths = [os.path.join(dst_wd, source_path) for source_path in joined]
+        read_split = partial(_read_weighted_split_, master_dimensions)
+
+        with nc.Dataset(dst_master_path, 'a') as ds:
+            for vidx, values in enumerate(map(read_split, source_paths)):
+                for name, value in values.items():
+                    ds.variables[name][:, y_bounds[vidx][0]:y_bounds[vidx][1],
+                    x_bounds[vidx][0]:x_bounds[vidx][1]] = value
 
     def iter_dst_grid_slices(self):
         """
@@ -326,33 +358,7 @@ class GridSplitter(AbstractOcgisObject):
         else:
             yield_slice = False
 
-        if self.buffer_value is None:
-            try:
-                if self.dst_grid_resolution is None:
-                    dst_grid_resolution = self.dst_grid.resolution
-                else:
-                    dst_grid_resolution = self.dst_grid_resolution
-                if self.src_grid_resolution is None:
-                    src_grid_resolution = self.src_grid.resolution
-                else:
-                    src_grid_resolution = self.src_grid_resolution
-
-                if dst_grid_resolution <= src_grid_resolution:
-                    target_resolution = dst_grid_resolution
-                else:
-                    target_resolution = src_grid_resolution
-                buffer_value = 2. * target_resolution
-            except NotImplementedError:
-                # Unstructured grids do not have an associated resolution.
-                if isinstance(self.src_grid, GridUnstruct) or isinstance(self.dst_grid, GridUnstruct):
-                    buffer_value = None
-                else:
-                    raise
-        else:
-            buffer_value = self.buffer_value
-
-        dst_grid_wrapped_state = self.dst_grid.wrapped_state
-        dst_grid_crs = self.dst_grid.crs
+        buffer_value = self._gs_get_buffer_value_()
 
         # Use a destination grid iterator if provided.
         if self.iter_dst is not None:
@@ -367,72 +373,7 @@ class GridSplitter(AbstractOcgisObject):
             else:
                 dst_grid_subset = yld
 
-            dst_box = None
-            with vm.scoped_by_emptyable('extent_global', dst_grid_subset):
-                if not vm.is_null:
-                    if self.check_contains:
-                        dst_box = box(*dst_grid_subset.extent_global)
-
-                    # Use the envelope! A buffer returns "fancy" borders. We just want to expand the bounding box.
-                    extent_global = dst_grid_subset.parent.attrs.get('extent_global')
-                    if extent_global is None:
-                        extent_global = dst_grid_subset.extent_global
-                    sub_box = box(*extent_global)
-                    if buffer_value is not None:
-                        sub_box = sub_box.buffer(buffer_value).envelope
-
-                    ocgis_lh(msg=str(sub_box.bounds), level=logging.DEBUG)
-                else:
-                    sub_box, dst_box = [None, None]
-
-            live_ranks = vm.get_live_ranks_from_object(dst_grid_subset)
-            sub_box = vm.bcast(sub_box, root=live_ranks[0])
-
-            if self.check_contains:
-                dst_box = vm.bcast(dst_box, root=live_ranks[0])
-
-            sub_box = GeometryVariable.from_shapely(sub_box, is_bbox=True, wrapped_state=dst_grid_wrapped_state,
-                                                    crs=dst_grid_crs)
-            src_grid_subset, src_grid_slice = self.src_grid.get_intersects(sub_box, keep_touches=False, cascade=False,
-                                                                           optimized_bbox_subset=self.optimized_bbox_subset,
-                                                                           return_slice=True)
-
-            # Reload the data using a new source index distribution.
-            if hasattr(src_grid_subset, 'reduce_global'):
-                # Only redistribute if we have one live rank.
-                if self.redistribute and len(vm.get_live_ranks_from_object(src_grid_subset)) > 0:
-                    topology = src_grid_subset.abstractions_available[Topology.POLYGON]
-                    cindex = topology.cindex
-                    redist_dimname = self.src_grid.abstractions_available[Topology.POLYGON].element_dim.name
-                    if src_grid_subset.is_empty:
-                        redist_dim = None
-                    else:
-                        redist_dim = topology.element_dim
-                    redistribute_by_src_idx(cindex, redist_dimname, redist_dim)
-
-            with vm.scoped_by_emptyable('src_grid_subset', src_grid_subset):
-                if not vm.is_null:
-                    if not self.allow_masked:
-                        gmask = src_grid_subset.get_mask()
-                        if gmask is not None and gmask.any():
-                            raise ValueError('Masked values in source grid subset.')
-
-                    if self.check_contains:
-                        src_box = box(*src_grid_subset.extent_global)
-                        if not does_contain(src_box, dst_box):
-                            raise ValueError('Contains check failed.')
-
-                    # Try to reduce the coordinates in the case of unstructured grid data.
-                    if hasattr(src_grid_subset, 'reduce_global'):
-                        src_grid_subset = src_grid_subset.reduce_global()
-                else:
-                    src_grid_subset = VariableCollection(is_empty=True)
-
-                if src_grid_subset.is_empty:
-                    src_grid_slice = None
-                else:
-                    src_grid_slice = {src_grid_subset.dimensions[ii].name: src_grid_slice[ii] for ii in
-                                      range(src_grid_subset.ndim)}
+            src_grid_subset, src_grid_slice = self._gs_get_src_grid_subset_(dst_grid_subset, buffer_value)
 
             if yield_dst:
                 yld = (src_grid_subset, src_grid_slice, dst_grid_subset, dst_slice)
@@ -441,10 +382,21 @@ class GridSplitter(AbstractOcgisObject):
 
             yield yld
 
-    def write_subsets(self):
+    def write_subsets(self, executor=ExecutorName.SERIAL, workers=None):
         """
         Write grid subsets to netCDF files using the provided filename templates.
+
+        When running with MPI and neither grid is distributed, each rank creates and writes a round-robin share of the
+        subsets without synchronizing between subsets. Otherwise, subsets are created collectively in order.
+
+        :param str executor: The local executor used to create and write subsets in serial (``vm.size == 1``). Either
+         ``'serial'`` or ``'process'``. See :class:`~ocgis.constants.ExecutorName`. Ignored if a destination iterator
+         is provided.
+        :param int workers: The number of local workers. If ``None``, use the CPU count.
         """
+
+        _validate_executor_(executor)
+
         src_filenames = []
         dst_filenames = []
         wgt_filenames = []
@@ -452,45 +404,33 @@ class GridSplitter(AbstractOcgisObject):
         src_slices = []
         index_path = self.create_full_path_from_template('index_file')
 
-        # nzeros = len(str(reduce(lambda x, y: x * y, self.nsplits_dst)))
-
-        ctr = 1
-        for sub_src, src_slc, sub_dst, dst_slc in self.iter_src_grid_subsets(yield_dst=True):
-            # if vm.rank == 0:
-            #     vm.rank_print('write_subset iterator count :: {}'.format(ctr))
-            #     tstart = time.time()
-            # padded = create_zero_padded_integer(ctr, nzeros)
-
-            src_path = self.create_full_path_from_template('src_template', index=ctr)
-            dst_path = self.create_full_path_from_template('dst_template', index=ctr)
-            wgt_path = self.create_full_path_from_template('wgt_template', index=ctr)
-
-            src_filenames.append(os.path.split(src_path)[1])
-            dst_filenames.append(os.path.split(dst_path)[1])
-            wgt_filenames.append(wgt_path)
-            dst_slices.append(dst_slc)
-            src_slices.append(src_slc)
-
-            # Only write destinations if an iterator is not provided.
-            if self.iter_dst is None:
-                zip_args = [[sub_src, sub_dst], [src_path, dst_path]]
-            else:
-                zip_args = [[sub_src], [src_path]]
-
-            for target, path in zip(*zip_args):
-                with vm.scoped_by_emptyable('field.write', target):
-                    if not vm.is_null:
-                        ocgis_lh(msg='writing: {}'.format(path), level=logging.DEBUG)
-                        field = Field(grid=target)
-                        field.write(path)
-                        ocgis_lh(msg='finished writing: {}'.format(path), level=logging.DEBUG)
-
-            # Increment the counter outside of the loop to avoid counting empty subsets.
-            ctr += 1
+        if self._gs_should_write_concurrently_(executor):
+            dst_slices = list(self.iter_dst_grid_slices())
+            src_slices = self._gs_write_subsets_concurrently_(dst_slices, executor, workers)
+            for ctr in range(1, len(dst_slices) + 1):
+                src_path, dst_path, wgt_path = self._gs_get_subset_paths_(ctr)
+                src_filenames.append(os.path.split(src_path)[1])
+                dst_filenames.append(os.path.split(dst_path)[1])
+                wgt_filenames.append(wgt_path)
+        else:
+            ctr = 1
+            for sub_src, src_slc, sub_dst, dst_slc in self.iter_src_grid_subsets(yield_dst=True):
+                src_path, dst_path, wgt_path = self._gs_get_subset_paths_(ctr)
+
+                src_filenames.append(os.path.split(src_path)[1])
+                dst_filenames.append(os.path.split(dst_path)[1])
+                wgt_filenames.append(wgt_path)
+                dst_slices.append(dst_slc)
+                src_slices.append(src_slc)
+
+                # Only write destinations if an iterator is not provided.
+                if self.iter_dst is None:
+                    _write_subset_grids_([sub_src, sub_dst], [src_path, dst_path])
+                else:
+                    _write_subset_grids_([sub_src], [src_path])
 
-            # if vm.rank == 0:
-            #     tstop = time.time()
-            #     vm.rank_print('timing::write_subset iteration::{}'.format(tstop - tstart))
+                # Increment the counter outside of the loop to avoid counting empty subsets.
+                ctr += 1
 
         # Global shapes require a VM global scope to collect.
         src_global_shape = global_grid_shape(self.src_grid)
@@ -549,6 +489,222 @@ class GridSplitter(AbstractOcgisObject):
 
         vm.barrier()
 
+    def _gs_get_buffer_value_(self):
+        """
+        :return: The buffer value used to expand destination subset extents when subsetting the source grid.
+        :rtype: float | None
+        """
+
+        if self.buffer_value is None:
+            try:
+                if self.dst_grid_resolution is None:
+                    dst_grid_resolution = self.dst_grid.resolution
+                else:
+                    dst_grid_resolution = self.dst_grid_resolution
+                if self.src_grid_resolution is None:
+                    src_grid_resolution = self.src_grid.resolution
+                else:
+                    src_grid_resolution = self.src_grid_resolution
+
+                if dst_grid_resolution <= src_grid_resolution:
+                    target_resolution = dst_grid_resolution
+                else:
+                    target_resolution = src_grid_resolution
+                buffer_value = 2. * target_resolution
+            except NotImplementedError:
+                # Unstructured grids do not have an associated resolution.
+                if isinstance(self.src_grid, GridUnstruct) or isinstance(self.dst_grid, GridUnstruct):
+                    buffer_value = None
+                else:
+                    raise
+        else:
+            buffer_value = self.buffer_value
+        return buffer_value
+
+    def _gs_get_src_grid_subset_(self, dst_grid_subset, buffer_value):
+        """
+        :param dst_grid_subset: The destination grid subset.
+        :param float buffer_value: See :meth:`~ocgis.spatial.grid_splitter.GridSplitter._gs_get_buffer_value_`.
+        :return: A tuple containing the source grid subset and its slice.
+        :rtype: tuple
+        """
+
+        dst_box = None
+        with vm.scoped_by_emptyable('extent_global', dst_grid_subset):
+            if not vm.is_null:
+                if self.check_contains:
+                    dst_box = box(*dst_grid_subset.extent_global)
+
+                # Use the envelope! A buffer returns "fancy" borders. We just want to expand the bounding box.
+                extent_global = dst_grid_subset.parent.attrs.get('extent_global')
+                if extent_global is None:
+                    extent_global = dst_grid_subset.extent_global
+                sub_box = box(*extent_global)
+                if buffer_value is not None:
+                    sub_box = sub_box.buffer(buffer_value).envelope
+
+                ocgis_lh(msg=str(sub_box.bounds), level=logging.DEBUG)
+            else:
+                sub_box, dst_box = [None, None]
+
+        live_ranks = vm.get_live_ranks_from_object(dst_grid_subset)
+        sub_box = vm.bcast(sub_box, root=live_ranks[0])
+
+        if self.check_contains:
+            dst_box = vm.bcast(dst_box, root=live_ranks[0])
+
+        sub_box = GeometryVariable.from_shapely(sub_box, is_bbox=True, wrapped_state=self.dst_grid.wrapped_state,
+                                                crs=self.dst_grid.crs)
+        src_grid_subset, src_grid_slice = self.src_grid.get_intersects(sub_box, keep_touches=False, cascade=False,
+                                                                       optimized_bbox_subset=self.optimized_bbox_subset,
+                                                                       return_slice=True)
+
+        # Reload the data using a new source index distribution.
+        if hasattr(src_grid_subset, 'reduce_global'):
+            # Only redistribute if we have one live rank.
+            if self.redistribute and len(vm.get_live_ranks_from_object(src_grid_subset)) > 0:
+                topology = src_grid_subset.abstractions_available[Topology.POLYGON]
+                cindex = topology.cindex
+                redist_dimname = self.src_grid.abstractions_available[Topology.POLYGON].element_dim.name
+                if src_grid_subset.is_empty:
+                    redist_dim = None
+                else:
+                    redist_dim = topology.element_dim
+                redistribute_by_src_idx(cindex, redist_dimname, redist_dim)
+
+        with vm.scoped_by_emptyable('src_grid_subset', src_grid_subset):
+            if not vm.is_null:
+                if not self.allow_masked:
+                    gmask = src_grid_subset.get_mask()
+                    if gmask is not None and gmask.any():
+                        raise ValueError('Masked values in source grid subset.')
+
+                if self.check_contains:
+                    src_box = box(*src_grid_subset.extent_global)
+                    if not does_contain(src_box, dst_box):
+                        raise ValueError('Contains check failed.')
+
+                # Try to reduce the coordinates in the case of unstructured grid data.
+                if hasattr(src_grid_subset, 'reduce_global'):
+                    src_grid_subset = src_grid_subset.reduce_global()
+            else:
+                src_grid_subset = VariableCollection(is_empty=True)
+
+            if src_grid_subset.is_empty:
+                src_grid_slice = None
+            else:
+                src_grid_slice = {src_grid_subset.dimensions[ii].name: src_grid_slice[ii] for ii in
+                                  range(src_grid_subset.ndim)}
+
+        return src_grid_subset, src_grid_slice
+
+    def _gs_get_merged_weight_chunk_(self, ii, wfn, src_indices, dst_indices, ifile, gidx):
+        """
+        :return: Weight variable values from a split weight file remapped to global indices.
+        :rtype: :class:`collections.OrderedDict`
+        """
+
+        ret = OrderedDict()
+        with nc.Dataset(wfn) as wds:
+            wds.set_auto_mask(False)
+            for wvn in ('row', 'col', 'S'):
+                odata = wds.variables[wvn][:]
+                try:
+                    odata = self._gs_remap_weight_variable_(ii, wvn, odata, src_indices, dst_indices, ifile, gidx,
+                                                            split_grids_directory=self.paths['wd'])
+                except IndexError as e:
+                    msg = "Weight filename: '{}'; Weight Variable Name: '{}'. {}".format(wfn, wvn, e)
+                    raise IndexError(msg)
+                ret[wvn] = odata
+        return ret
+
+    def _gs_get_subset_paths_(self, ctr):
+        """
+        :param int ctr: The one-based subset counter.
+        :return: A tuple of source, destination, and weight file paths for the subset.
+        :rtype: tuple
+        """
+
+        src_path = self.create_full_path_from_template('src_template', index=ctr)
+        dst_path = self.create_full_path_from_template('dst_template', index=ctr)
+        wgt_path = self.create_full_path_from_template('wgt_template', index=ctr)
+        return src_path, dst_path, wgt_path
+
+    def _gs_is_distributed_(self):
+        """
+        :return: ``True`` if the source or destination grid has a distributed dimension.
+        :rtype: bool
+        """
+
+        for grid in (self.src_grid, self.dst_grid):
+            if any([d.dist for d in grid.dimensions]):
+                return True
+        return False
+
+    def _gs_should_write_concurrently_(self, executor):
+        """
+        :param str executor: See :meth:`~ocgis.spatial.grid_splitter.GridSplitter.write_subsets`.
+        :return: ``True`` if subsets should be created and written independently by local workers or MPI ranks.
+        :rtype: bool
+        """
+
+        # Custom destination iterators may depend on the iteration order.
+        if self.iter_dst is not None:
+            ret = False
+        elif vm.size > 1:
+            ret = not self._gs_is_distributed_()
+        else:
+            ret = executor != ExecutorName.SERIAL
+        return ret
+
+    def _gs_write_subset_(self, idx, dst_slice, buffer_value):
+        """
+        Create and write a single source and destination subset.
+
+        :param int idx: The zero-based subset index.
+        :param dict dst_slice: The destination grid slice.
+        :param float buffer_value: See :meth:`~ocgis.spatial.grid_splitter.GridSplitter._gs_get_buffer_value_`.
+        :return: The source grid slice.
+        :rtype: dict
+        """
+
+        dst_grid_subset = self.dst_grid.get_distributed_slice(dst_slice)
+        src_grid_subset, src_grid_slice = self._gs_get_src_grid_subset_(dst_grid_subset, buffer_value)
+        src_path, dst_path, _ = self._gs_get_subset_paths_(idx + 1)
+        _write_subset_grids_([src_grid_subset, dst_grid_subset], [src_path, dst_path])
+        return src_grid_slice
+
+    def _gs_write_subsets_concurrently_(self, dst_slices, executor, workers):
+        """
+        Write subsets using a local process pool or, when running with MPI, a round-robin share of subsets on each
+        rank. Each rank creates its subsets using a rank-local communicator so there is no synchronization between
+        subsets.
+
+        :param list dst_slices: Destination grid slices.
+        :return: Source grid slices. Subsets not handled by the current rank are ``None``.
+        :rtype: list
+        """
+
+        ret = [None] * len(dst_slices)
+        buffer_value = self._gs_get_buffer_value_()
+
+        if vm.size > 1:
+            indices = range(vm.rank, len(dst_slices), vm.size)
+            with vm.scoped('grid splitter write subsets', [vm.rank]):
+                for idx in indices:
+                    ret[idx] = self._gs_write_subset_(idx, dst_slices[idx], buffer_value)
+        else:
+            # Subsets are written in separate processes as the virtual machine and netCDF library are not thread-safe.
+            workers = workers or multiprocessing.cpu_count()
+            ocgis_lh(msg='Writing subsets using {0} local process worker(s).'.format(workers), level=logging.DEBUG)
+            state = {'grid_splitter': self, 'buffer_value': buffer_value}
+            with pool_scope(workers, state) as pool:
+                itr = iter_ordered_results(pool, _write_subset_in_pool_worker_, enumerate(dst_slices), 2 * workers)
+                for idx, src_grid_slice in enumerate(itr):
+                    ret[idx] = src_grid_slice
+
+        return ret
+
     def _gs_remap_weight_variable_(self, ii, wvn, odata, src_indices, dst_indices, ifile, gidx,
                                    split_grids_directory=None):
         if wvn == 'S':
@@ -560,7 +716,7 @@ class GridSplitter(AbstractOcgisObject):
                 if is_unstruct:
                     dst_filename = ifile[gidx[ifc.NAME_DESTINATION_VARIABLE]].join_string_value()[ii]
                     dst_filename = os.path.join(split_grids_directory, dst_filename)
-                    oindices = RequestDataset(dst_filename).get()[ifc.NAME_DSTIDX_GUID].get_value()
+                    oindices = _read_netcdf_variable_(dst_filename, ifc.NAME_DSTIDX_GUID)
                 else:
                     y_bounds = ifile[gidx[ifc.NAME_Y_DST_BOUNDS_VARIABLE]].get_value()
                     x_bounds = ifile[gidx[ifc.NAME_X_DST_BOUNDS_VARIABLE]].get_value()
@@ -570,23 +726,83 @@ class GridSplitter(AbstractOcgisObject):
                 if is_unstruct:
                     src_filename = ifile[gidx[ifc.NAME_SOURCE_VARIABLE]].join_string_value()[ii]
                     src_filename = os.path.join(split_grids_directory, src_filename)
-                    oindices = RequestDataset(src_filename).get()[ifc.NAME_SRCIDX_GUID].get_value()
+                    oindices = _read_netcdf_variable_(src_filename, ifc.NAME_SRCIDX_GUID)
                 else:
                     y_bounds = ifile[gidx[ifc.NAME_Y_SRC_BOUNDS_VARIABLE]].get_value()
                     x_bounds = ifile[gidx[ifc.NAME_X_SRC_BOUNDS_VARIABLE]].get_value()
                     indices = src_indices
             else:
                 raise NotImplementedError
-            if not is_unstruct:
-                islice = [slice(y_bounds[ii][0], y_bounds[ii][1]),
-                          slice(x_bounds[ii][0], x_bounds[ii][1])]
-                oindices = indices[islice]
-                oindices = oindices.flatten()
-            odata = oindices[odata - 1]
+            if is_unstruct:
+                odata = oindices[odata - 1]
+            else:
+                # Convert the one-based, C-order split indices to global grid coordinates and look up the global
+                # indices directly. This avoids copying the split's block of the global index array.
+                y_start, x_start = y_bounds[ii][0], x_bounds[ii][0]
+                x_size = x_bounds[ii][1] - x_start
+                y_local, x_local = np.divmod(np.asarray(odata) - 1, x_size)
+                if (y_local >= y_bounds[ii][1] - y_start).any() or (y_local < 0).any():
+                    raise IndexError('Weight index out of bounds for the split grid.')
+                odata = indices[y_local + y_start, x_local + x_start]
 
         return odata
 
 
+def _get_merged_weight_chunk_in_pool_worker_(chunk):
+    ii, wfn = chunk
+    src_indices, dst_indices, ifile, gidx = POOL_WORKER_STATE['merge']
+    return POOL_WORKER_STATE['grid_splitter']._gs_get_merged_weight_chunk_(ii, wfn, src_indices, dst_indices, ifile,
+                                                                           gidx)
+
+
+def _read_netcdf_variable_(path, name):
+    # Read directly from the file so values are not distributed when running with MPI.
+    with nc.Dataset(path) as ds:
+        ds.set_auto_mask(False)
+        return ds.variables[name][:]
+
+
+def _read_weighted_split_(master_dimensions, path):
+    # Read all time steps of each data variable from a destination split file.
+    ret = OrderedDict()
+    with nc.Dataset(path) as ds:
+        for name, dimension_names in master_dimensions.items():
+            variable = ds.variables[name]
+            value = variable[:]
+            ret[name] = np.transpose(value, [variable.dimensions.index(d) for d in dimension_names])
+    return ret
+
+
+def _write_merged_weight_chunks_(path, offsets, chunks, remapped):
+    # Write remapped weight chunks at their precomputed offsets in the merged weight file.
+    with nc.Dataset(path, 'a') as out_wds:
+        for (ii, _), odata in zip(chunks, remapped):
+            start = offsets[ii]
+            for wvn, value in odata.items():
+                out_wds.variables[wvn][start:start + value.size] = value
+
+
+def _write_subset_grids_(targets, paths):
+    for target, path in zip(targets, paths):
+        with vm.scoped_by_emptyable('field.write', target):
+            if not vm.is_null:
+                ocgis_lh(msg='writing: {}'.format(path), level=logging.DEBUG)
+                field = Field(grid=target)
+                field.write(path)
+                ocgis_lh(msg='finished writing: {}'.format(path), level=logging.DEBUG)
+
+
+def _write_subset_in_pool_worker_(args):
+    idx, dst_slice = args
+    return POOL_WORKER_STATE['grid_splitter']._gs_write_subset_(idx, dst_slice, POOL_WORKER_STATE['buffer_value'])
+
+
+def _validate_executor_(executor):
+    if executor not in (ExecutorName.SERIAL, ExecutorName.PROCESS):
+        raise ValueError("Grid splitting supports the '{0}' and '{1}' executors only. Received: '{2}'".format(
+            ExecutorName.SERIAL, ExecutorName.PROCESS, executor))
+
+
 def create_slice_from_tuple(tup):
     return slice(tup[0], tup[1])
 
@@ -1,3 +1,10 @@
+import hashlib
+import json
+import os
+import uuid
+
+import numpy as np
+import six
 from rtree import index
 from shapely.prepared import prep
 
@@ -6,14 +13,23 @@ class SpatialIndex(object):
     """
     Create and access spatial indexes using the :mod:`rtree` module.
     
-    :param str path: If provided, this is the path to pre-computed spatial index file in the ``rtree`` format.
+    :param str path: If provided, this is the path to pre-computed spatial index file in the ``rtree`` format. If
+     ``stream`` is also provided, the index is created on disk at this path.
+    :param stream: If provided, bulk load the index from an iterable yielding ``(<id>, <bounds>, None)`` tuples.
     """
 
-    def __init__(self, path=None):
-        if path is None:
+    def __init__(self, path=None, stream=None):
+        if path is None and stream is None:
             self._index = index.Index()
-        else:
+        elif stream is None:
             self._index = index.Rtree(path)
+        elif path is None:
+            self._index = index.Index(stream)
+        else:
+            self._index = index.Index(path, stream)
+
+    def __len__(self):
+        return len(self._index)
 
     def add(self, id_geom, shapely_geom):
         """
@@ -31,6 +47,10 @@ class SpatialIndex(object):
             for ig, sg in zip(id_geom, shapely_geom):
                 _insert(ig, sg.bounds)
 
+    def close(self):
+        """Close the index flushing any on-disk storage."""
+        self._index.close()
+
     def iter_intersects(self, shapely_geom, arr, keep_touches=True):
         """
         Return an iterator for the unique identifiers of the geometries intersecting the target geometry.
@@ -85,3 +105,205 @@ class SpatialIndex(object):
 
     def _get_intersection_rtree_(self, shapely_geom):
         return self._index.intersection(shapely_geom.bounds)
+
+
+class SpatialIndexCache(object):
+    """
+    Persist spatial indexes to a cache directory so they may be reused across operations and processes. Cached indexes
+    are keyed by the source URI, variable name, and source slice of the indexed variables as well as the coordinate
+    system and bounds of the indexed geometries. An entry is invalidated if a source file's modification time
+    changes. The least recently used entries are evicted when the cache exceeds ``max_size``.
+
+    :param str directory: The cache directory. It is created if it does not exist.
+    :param int max_size: The maximum size of the cache directory's index files in bytes.
+    """
+
+    _extensions = ('.dat', '.idx')
+
+    def __init__(self, directory, max_size):
+        self.directory = directory
+        self.max_size = max_size
+
+        if not os.path.exists(directory):
+            try:
+                os.makedirs(directory)
+            except OSError:
+                # Another process may have created the directory.
+                if not os.path.isdir(directory):
+                    raise
+
+    def create(self, key, sources, bounds):
+        """
+        Create and persist a spatial index.
+
+        :param str key: The cache key from :meth:`~SpatialIndexCache.get_key`.
+        :param sources: The source files of the indexed geometries used to invalidate the cache entry.
+        :type sources: sequence of str
+        :param bounds: Two-dimensional array of geometry bounds with rows ``(minx, miny, maxx, maxy)``. Identifiers are
+         the row indices.
+        :type bounds: :class:`numpy.ndarray`
+        :rtype: :class:`~ocgis.spatial.index.SpatialIndex`
+        """
+
+        # Build the index under a temporary name so other processes never see a partially written index.
+        tmp_path = os.path.join(self.directory, '{}.{}'.format(key, uuid.uuid4().hex))
+        stream = ((idx, tuple(row), None) for idx, row in enumerate(bounds))
+        SpatialIndex(path=tmp_path, stream=stream).close()
+        for ext in self._extensions:
+            os.rename(tmp_path + ext, self._get_path_(key) + ext)
+
+        # The metadata file is written last and marks a complete cache entry.
+        meta = {'mtimes': {source: os.path.getmtime(source) for source in sources}, 'size': len(bounds)}
+        tmp_meta = tmp_path + '.json'
+        with open(tmp_meta, 'w') as f:
+            json.dump(meta, f)
+        os.rename(tmp_meta, self._get_path_(key) + '.json')
+
+        self.evict(keep=key)
+
+        return SpatialIndex(path=self._get_path_(key))
+
+    def evict(self, keep=None):
+        """
+        Remove least recently used cache entries until the cache is smaller than the maximum size.
+
+        :param str keep: If provided, never evict the entry with this key.
+        """
+
+        entries = []
+        total = 0
+        for fn in os.listdir(self.directory):
+            if not fn.endswith('.json'):
+                continue
+            key = fn[:-len('.json')]
+            try:
+                used = os.path.getmtime(self._get_path_(key) + '.json')
+                size = sum([os.path.getsize(self._get_path_(key) + ext) for ext in self._extensions])
+            except OSError:
+                # Entry removed by another process.
+                continue
+            entries.append((used, size, key))
+            total += size
+
+        for _, size, key in sorted(entries):
+            if total <= self.max_size:
+                break
+            if key == keep:
+                continue
+            self.remove(key)
+            total -= size
+
+    def get(self, key):
+        """
+        :param str key: The cache key from :meth:`~SpatialIndexCache.get_key`.
+        :return: The cached spatial index or ``None`` if it is not available, incomplete, or out-of-date.
+        :rtype: :class:`~ocgis.spatial.index.SpatialIndex` | ``None``
+        """
+
+        path = self._get_path_(key)
+        try:
+            with open(path + '.json') as f:
+                meta = json.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+
+        # Rtree creates an empty index if the index files do not exist.
+        if not all([os.path.exists(path + ext) for ext in self._extensions]):
+            self.remove(key)
+            return None
+
+        for source, mtime in meta['mtimes'].items():
+            if not os.path.exists(source) or os.path.getmtime(source) != mtime:
+                self.remove(key)
+                return None
+
+        ret = SpatialIndex(path=path)
+        if len(ret) == 0 or len(ret) != meta.get('size'):
+            ret.close()
+            self.remove(key)
+            return None
+
+        # Touch the metadata file to track usage for eviction.
+        os.utime(path + '.json', None)
+        return ret
+
+    @staticmethod
+    def get_key(variables, mask=None, tag=None, crs=None, bounds=None):
+        """
+        Create a cache key for geometries derived from source variables. Source variables may be modified after they
+        are loaded (i.e. wrapped or transformed to another coordinate system). The coordinate system and the bounds of
+        the indexed geometries are included in the key so modified coordinates never load an out-of-date index.
+
+        :param variables: The source variables of the indexed geometries.
+        :type variables: sequence of :class:`~ocgis.Variable`
+        :param mask: The mask used to select the indexed geometries. ``True`` values are not indexed.
+        :type mask: :class:`numpy.ndarray`
+        :param str tag: An additional string to differentiate indexes created from the same source variables.
+        :param crs: The coordinate system of the indexed geometries.
+        :type crs: :class:`~ocgis.variable.crs.AbstractCRS`
+        :param bounds: The bounds of the indexed geometries. See :meth:`~SpatialIndexCache.create`.
+        :type bounds: :class:`numpy.ndarray`
+        :return: A tuple containing the key and the source files or ``None`` if any variable is not sourced from file.
+        :rtype: tuple | ``None``
+        """
+
+        sha = hashlib.sha1()
+        sources = []
+        for variable in variables:
+            rd = getattr(variable, '_request_dataset', None)
+            if rd is None or rd.uri is None:
+                return None
+            uris = [rd.uri] if isinstance(rd.uri, six.string_types) else list(rd.uri)
+            if not all([os.path.isfile(uri) for uri in uris]):
+                return None
+            uris = [os.path.abspath(uri) for uri in uris]
+            sources += uris
+            sha.update(repr((uris, variable.source_name)).encode())
+            for dim in variable.dimensions:
+                src_idx = dim._src_idx
+                if src_idx is None:
+                    return None
+                elif isinstance(src_idx, np.ndarray):
+                    sha.update(src_idx.tobytes())
+                else:
+                    sha.update(repr(tuple([int(ii) for ii in src_idx])).encode())
+        if mask is not None and mask.any():
+            sha.update(np.packbits(mask).tobytes())
+        if tag is not None:
+            sha.update(tag.encode())
+        if crs is not None:
+            sha.update(repr((type(crs).__name__, sorted(getattr(crs, 'value', {}).items()))).encode())
+        if bounds is not None:
+            sha.update(np.ascontiguousarray(bounds, dtype=float).tobytes())
+
+        return sha.hexdigest(), sources
+
+    def remove(self, key):
+        """
+        :param str key: The key of the cache entry to remove.
+        """
+
+        for ext in ('.json',) + self._extensions:
+            try:
+                os.remove(self._get_path_(key) + ext)
+            except OSError:
+                pass
+
+    def _get_path_(self, key):
+        return os.path.join(self.directory, key)
+
+
+def get_spatial_index_cache():
+    """
+    :return: The spatial index cache configured by :attr:`ocgis.env.DIR_SPATIAL_INDEX_CACHE` or ``None`` if caching is
+     disabled.
+    :rtype: :class:`~ocgis.spatial.index.SpatialIndexCache` | ``None``
+    """
+
+    from ocgis import env
+
+    if env.DIR_SPATIAL_INDEX_CACHE is None:
+        ret = None
+    else:
+        ret = SpatialIndexCache(env.DIR_SPATIAL_INDEX_CACHE, env.SPATIAL_INDEX_CACHE_SIZE)
+    return ret
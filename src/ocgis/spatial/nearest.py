@@ -0,0 +1,293 @@
+from copy import deepcopy
+
+import numpy as np
+import shapely
+from shapely.geometry import Point
+
+from ocgis import env, constants
+from ocgis.base import AbstractOcgisObject, get_dimension_names
+from ocgis.constants import DimensionName, VariableName, DimensionMapKey
+
+
+class NearestIndex(AbstractOcgisObject):
+    """
+    Nearest neighbor index for element centroids. A :class:`scipy.spatial.cKDTree` is used if
+    :attr:`ocgis.env.USE_SCIPY` is ``True``. Otherwise, nearest neighbors are found by vectorized brute force.
+
+    Spherical indexes convert longitude and latitude coordinates in degrees to three-dimensional unit vectors. The
+    straight-line distance between unit vectors increases with great-circle distance so nearest neighbors are the same.
+
+    :param x: Centroid x-coordinates or longitudes with the shape of the indexed elements.
+    :type x: :class:`numpy.ndarray`
+    :param y: Centroid y-coordinates or latitudes with the shape of the indexed elements.
+    :type y: :class:`numpy.ndarray`
+    :param mask: If provided, ``True`` elements are excluded from the index.
+    :type mask: :class:`numpy.ndarray`
+    :param bool spherical: If ``True``, use great-circle distances.
+    """
+
+    #: The maximum number of target-element distances computed at once when using brute force.
+    brute_force_block_size = 1000000
+
+    def __init__(self, x, y, mask=None, spherical=False):
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        if x.shape != y.shape:
+            raise ValueError('Coordinate shapes must match: {} != {}'.format(x.shape, y.shape))
+
+        self.shape = x.shape
+        self.spherical = spherical
+
+        select = np.ones(x.size, dtype=bool)
+        if mask is not None:
+            select[np.asarray(mask, dtype=bool).reshape(-1)] = False
+        if not select.any():
+            raise ValueError('At least one unmasked element is required to create a nearest neighbor index.')
+        # Flat indices of the indexed elements.
+        self.indices = np.flatnonzero(select)
+        self.points = self._get_points_(x.reshape(-1)[select], y.reshape(-1)[select])
+
+        if env.USE_SCIPY:
+            from scipy.spatial import cKDTree
+            self._tree = cKDTree(self.points)
+        else:
+            self._tree = None
+
+    def query(self, x, y):
+        """
+        Find the nearest indexed elements to target coordinates.
+
+        :param x: Target x-coordinate(s) or longitude(s).
+        :type x: float | :class:`numpy.ndarray`
+        :param y: Target y-coordinate(s) or latitude(s).
+        :type y: float | :class:`numpy.ndarray`
+        :return: Indices of the nearest elements suitable for slicing objects with the indexed shape. If the targets are
+         scalars, the tuple contains integers. Otherwise, it contains index arrays with the target shape.
+        :rtype: tuple
+        """
+
+        is_scalar = np.isscalar(x)
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        target_shape = x.shape
+        targets = self._get_points_(x.reshape(-1), y.reshape(-1))
+
+        if self._tree is None:
+            nearest = np.empty(targets.shape[0], dtype=int)
+            block_size = max(1, self.brute_force_block_size // self.points.shape[0])
+            for start in range(0, targets.shape[0], block_size):
+                block = targets[start:start + block_size]
+                distances = ((block[:, np.newaxis, :] - self.points[np.newaxis, :, :]) ** 2).sum(axis=2)
+                nearest[start:start + block_size] = distances.argmin(axis=1)
+        else:
+            nearest = self._tree.query(targets)[1]
+
+        ret = np.unravel_index(self.indices[nearest], self.shape)
+        if is_scalar:
+            ret = tuple([int(r[0]) for r in ret])
+        else:
+            ret = tuple([r.reshape(target_shape) for r in ret])
+        return ret
+
+    def query_geometries(self, geometries):
+        """
+        Find the nearest indexed elements to target geometry centroids.
+
+        :param geometries: The target geometry or sequence of target geometries.
+        :type geometries: :class:`shapely.geometry.base.BaseGeometry` | sequence
+        :rtype: tuple
+        :return: See :meth:`~ocgis.spatial.nearest.NearestIndex.query`.
+        """
+
+        try:
+            centroid = geometries.centroid
+        except AttributeError:
+            if env.USE_VECTORIZED_GEOMETRY:
+                centroids = shapely.centroid(np.asarray(geometries, dtype=object))
+                ret = self.query(shapely.get_x(centroids), shapely.get_y(centroids))
+            else:
+                centroids = [g.centroid for g in geometries]
+                ret = self.query([c.x for c in centroids], [c.y for c in centroids])
+        else:
+            ret = self.query(centroid.x, centroid.y)
+        return ret
+
+    def _get_points_(self, x, y):
+        if self.spherical:
+            lon = np.radians(x)
+            lat = np.radians(y)
+            cos_lat = np.cos(lat)
+            ret = np.column_stack((cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)))
+        else:
+            ret = np.column_stack((x, y))
+        return ret
+
+
+def get_is_spherical(crs):
+    """
+    :param crs: The coordinate system of the indexed elements.
+    :type crs: :class:`~ocgis.variable.crs.AbstractCRS` | ``None``
+    :return: ``True`` if nearest neighbors should use great-circle distances for the coordinate system.
+    :rtype: bool
+    """
+
+    return crs is not None and bool(getattr(crs, 'is_geographic', False))
+
+
+def get_coalesced_windows(rows, cols, elements_per_station=constants.STATION_WINDOW_ELEMENTS_PER_STATION):
+    """
+    Group station grid indices into rectangular windows so neighboring stations are read together. Stations are added
+    to a window in row-major order while the window contains at most ``elements_per_station`` elements per station.
+
+    :param rows: Row indices of the stations.
+    :type rows: :class:`numpy.ndarray`
+    :param cols: Column indices of the stations.
+    :type cols: :class:`numpy.ndarray`
+    :param int elements_per_station: The maximum window elements per station.
+    :return: A list of ``(<row slice>, <column slice>, <station indices>)`` tuples.
+    :rtype: list
+    """
+
+    windows = []
+    current = None
+    for idx in np.lexsort((cols, rows)):
+        row, col = rows[idx], cols[idx]
+        if current is not None:
+            bounds = [min(current[0], row), max(current[1], row), min(current[2], col), max(current[3], col)]
+            size = (bounds[1] - bounds[0] + 1) * (bounds[3] - bounds[2] + 1)
+            if size <= elements_per_station * (len(current[4]) + 1):
+                current = bounds + [current[4]]
+                current[4].append(idx)
+                continue
+            windows.append(current)
+        current = [row, row, col, col, [idx]]
+    if current is not None:
+        windows.append(current)
+
+    return [(slice(w[0], w[1] + 1), slice(w[2], w[3] + 1), np.array(w[4])) for w in windows]
+
+
+def get_station_field(field, stations, nearest_index=None, dimension_name=DimensionName.STATION):
+    """
+    Extract values at the grid elements nearest to station geometries. All stations are mapped to grid indices using a
+    single nearest neighbor query. Values are read from source in windows coalescing neighboring stations (see
+    :func:`~ocgis.spatial.nearest.get_coalesced_windows`).
+
+    The returned field replaces the grid dimensions of data variables with a station dimension. Its geometry variable
+    contains the nearest grid element centers and the station unique identifiers if present. The grid's coordinate
+    variables are converted to station coordinate variables.
+
+    :param field: The field to extract values from. It must have a grid.
+    :type field: :class:`~ocgis.Field`
+    :param stations: One-dimensional geometry variable containing the stations. It must have the field's coordinate
+     system.
+    :type stations: :class:`~ocgis.GeometryVariable`
+    :param nearest_index: The nearest neighbor index for the field's grid. If ``None``, create it.
+    :type nearest_index: :class:`~ocgis.spatial.nearest.NearestIndex`
+    :param str dimension_name: The name of the station dimension.
+    :rtype: :class:`~ocgis.Field`
+    :raises: ValueError
+    """
+
+    from ocgis import Field, Variable, GeometryVariable
+    from ocgis.variable.dimension import Dimension
+
+    grid = field.grid
+    if grid is None:
+        raise ValueError('A grid is required for station extraction.')
+    if nearest_index is None:
+        nearest_index = grid.get_nearest_index()
+
+    rows, cols = nearest_index.query_geometries(stations.get_value().reshape(-1))
+    nstations = rows.shape[0]
+    y_name, x_name = get_dimension_names(grid.dimensions)
+
+    coordinates = {}
+    for key in (DimensionMapKey.REALIZATION, DimensionMapKey.TIME, DimensionMapKey.LEVEL):
+        target = getattr(field, key)
+        if target is not None:
+            coordinates[key] = target.extract()
+    ret = Field(name=field.name, crs=deepcopy(field.crs), **coordinates)
+    station_dimension = Dimension(dimension_name, size=nstations)
+
+    # Allocate the station values for each data variable. Grid dimensions are moved to the end for filling.
+    fills = []
+    for variable in field.data_variables:
+        dimension_names = get_dimension_names(variable.dimensions)
+        if y_name not in dimension_names or x_name not in dimension_names:
+            raise ValueError('Data variable "{}" does not have the grid dimensions.'.format(variable.name))
+        axes = [dimension_names.index(y_name), dimension_names.index(x_name)]
+        others = [d for d in variable.dimensions if d.name not in (y_name, x_name)]
+        shape = [len(d) for d in others] + [nstations]
+        fill = np.ma.array(np.zeros(shape, dtype=variable.dtype), mask=np.zeros(shape, dtype=bool))
+        fills.append((variable, axes, others, fill))
+
+    # Read each window once and fill values for the stations it contains.
+    for row_slice, col_slice, members in get_coalesced_windows(rows, cols):
+        sub = grid[row_slice, col_slice].parent
+        window_rows = rows[members] - row_slice.start
+        window_cols = cols[members] - col_slice.start
+        for variable, axes, _, fill in fills:
+            value = np.moveaxis(sub[variable.name].get_masked_value(), axes, [-2, -1])
+            fill[..., members] = value[..., window_rows, window_cols]
+
+    for variable, axes, others, fill in fills:
+        dimensions = []
+        for d in others:
+            if d.name in ret.dimensions:
+                dimensions.append(ret.dimensions[d.name])
+            else:
+                dimensions.append(Dimension(d.name, size=len(d)))
+        insert_position = min(axes)
+        dimensions.insert(insert_position, station_dimension)
+        new_variable = Variable(name=variable.name, value=np.moveaxis(fill, -1, insert_position),
+                                dimensions=dimensions, attrs=deepcopy(variable.attrs), dtype=variable.dtype,
+                                fill_value=variable.fill_value)
+        ret.add_variable(new_variable, is_data=True)
+
+    # Station coordinates are the centers of the nearest grid elements.
+    stacked = grid.get_value_stacked()
+    x = stacked[1][rows, cols]
+    y = stacked[0][rows, cols]
+    for source, value in ((grid.x, x), (grid.y, y)):
+        attrs = deepcopy(source.attrs)
+        attrs.pop('bounds', None)
+        ret.add_variable(Variable(name=source.name, value=value, dimensions=station_dimension, attrs=attrs))
+
+    if env.USE_VECTORIZED_GEOMETRY:
+        points = shapely.points(x, y)
+    else:
+        points = np.array([None] * nstations)
+        for idx in range(nstations):
+            points[idx] = Point(x[idx], y[idx])
+    geom = GeometryVariable(name=VariableName.GEOMETRY_POINT, value=points, dimensions=station_dimension,
+                            crs=ret.crs)
+    if stations.ugid is not None:
+        ugid = stations.ugid
+        geom.set_ugid(Variable(name=ugid.name, value=ugid.get_value().copy(), dimensions=station_dimension,
+                               attrs=deepcopy(ugid.attrs)))
+    ret.set_geom(geom)
+
+    return ret
+
+
+def update_station_coordinates(field, x_name, y_name):
+    """
+    Update station coordinate variables in-place from the field's point geometries. Use this following wrapping or
+    coordinate system updates on the field returned by :func:`~ocgis.spatial.nearest.get_station_field`.
+
+    :param field: The station field.
+    :type field: :class:`~ocgis.Field`
+    :param str x_name: The name of the station x-coordinate variable.
+    :param str y_name: The name of the station y-coordinate variable.
+    """
+
+    value = field.geom.get_value()
+    if env.USE_VECTORIZED_GEOMETRY:
+        x = shapely.get_x(value)
+        y = shapely.get_y(value)
+    else:
+        x = np.array([g.x for g in value])
+        y = np.array([g.y for g in value])
+    field[x_name].get_value()[:] = x
+    field[y_name].get_value()[:] = y
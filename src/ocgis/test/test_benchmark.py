@@ -1,9 +1,23 @@
+import time
 from unittest import SkipTest
 
+import numpy as np
+
 import ocgis
-from ocgis import RequestDataset
+from ocgis import RequestDataset, env, TemporalVariable, Variable, Field, Grid, vm
+from ocgis.calc.library.statistics import Mean
 from ocgis.ops.core import OcgOperations
-from ocgis.test.base import TestBase, attr
+from ocgis.spatial.grid import get_polygon_geometry_array, get_point_geometry_array
+from ocgis.test.base import TestBase, attr, create_gridxy_global, create_exact_field
+
+
+def get_elapsed(func, *args, **kwargs):
+    """Return the elapsed time in seconds for a function call along with its return value."""
+
+    t1 = time.time()
+    ret = func(*args, **kwargs)
+    t2 = time.time()
+    return t2 - t1, ret
 
 
 class Test(TestBase):
@@ -42,3 +56,142 @@ class Test(TestBase):
         # tkk
         # pprint_dict(field.dimension_map)
         # print field.grid.extent
+
+
+class TestGeometryArray(TestBase):
+    @attr('release', 'benchmark')
+    def test_vectorized(self):
+        if not env.USE_VECTORIZED_GEOMETRY:
+            raise SkipTest('vectorized geometry creation not available')
+
+        # A global quarter-degree grid with shape 720x1440.
+        grid = create_gridxy_global(resolution=0.25, dist=False)
+
+        for func in [get_point_geometry_array, get_polygon_geometry_array]:
+            results = {}
+            for use_vectorized in [False, True]:
+                env.USE_VECTORIZED_GEOMETRY = use_vectorized
+                fill = np.zeros(grid.shape, dtype=object)
+                results[use_vectorized] = get_elapsed(func, grid, fill)
+            print('{}: looped={:.3f}s, vectorized={:.3f}s'.format(func.__name__, results[False][0], results[True][0]))
+            self.assertTrue(results[True][1][-1, -1].equals(results[False][1][-1, -1]))
+
+
+class TestTemporalGrouping(TestBase):
+    @attr('release', 'benchmark')
+    def test_get_grouping_other(self):
+        # A 150-year daily time series.
+        value = np.arange(0, 150 * 365, dtype=float)
+        tvar = TemporalVariable(value=value, dimensions='time', units='days since 1850-01-01', calendar='noleap')
+        tvar.set_extrapolated_bounds('time_bnds', 'bounds')
+
+        groupings = [['month'], ['month', 'year'], [[12, 1, 2], [3, 4, 5], [6, 7, 8], [9, 10, 11], 'year']]
+        for grouping in groupings:
+            looped = get_elapsed(tvar._get_grouping_other_iterative_, grouping)
+            vectorized = get_elapsed(tvar._get_grouping_other_, grouping)
+            print('{}: looped={:.3f}s, vectorized={:.3f}s'.format(grouping, looped[0], vectorized[0]))
+            self.assertEqual(len(looped[1][3]), len(vectorized[1][3]))
+
+
+class TestSegmentedReduction(TestBase):
+    @attr('release', 'benchmark')
+    def test_execute(self):
+        # A 30-year daily time series on a 100x100 grid.
+        ntime = 30 * 365
+        tvar = TemporalVariable(value=np.arange(0, ntime, dtype=float), dimensions='time',
+                                units='days since 1950-01-01', calendar='noleap')
+        x = Variable(name='x', value=np.arange(100, dtype=float), dimensions='x')
+        y = Variable(name='y', value=np.arange(100, dtype=float), dimensions='y')
+        data = Variable(name='tas', value=np.random.rand(ntime, 100, 100), dimensions=['time', 'y', 'x'])
+        field = Field(grid=Grid(x, y), time=tvar, variables=data, is_data=data)
+        tgd = field.temporal.get_grouping(['month', 'year'])
+
+        results = {}
+        for segmented in [False, True]:
+            mu = Mean(field=field, tgd=tgd, calc_sample_size=True)
+            mu.segmented = segmented
+            results[segmented] = get_elapsed(mu.execute)
+        print('mean: grouped={:.3f}s, segmented={:.3f}s'.format(results[False][0], results[True][0]))
+        self.assertNumpyAllClose(results[True][1]['mean'].get_masked_value(),
+                                 results[False][1]['mean'].get_masked_value())
+
+
+class TestNetcdfParallelWrite(TestBase):
+    @attr('mpi', 'release', 'benchmark')
+    def test_write_bandwidth(self):
+        if vm.size == 1 or not env.USE_NETCDF4_MPI:
+            raise SkipTest('parallel netCDF writes not available')
+
+        # Ten time steps on a global quarter-degree grid with shape 720x1440.
+        ntime = 10
+        with vm.scoped('source', [0]):
+            if not vm.is_null:
+                path = self.get_temporary_file_path('source.nc')
+                grid = create_gridxy_global(resolution=0.25, dist=False)
+                create_exact_field(grid, 'tas', ntime=ntime).write(path)
+            else:
+                path = None
+        path = vm.bcast(path)
+        nbytes = ntime * 720 * 1440 * np.dtype(np.float32).itemsize
+
+        sizes = sorted(set([2 ** ii for ii in range(int(np.log2(vm.size)) + 1)] + [vm.size]))
+        for size in sizes:
+            with vm.scoped('benchmark', list(range(size))):
+                if vm.is_null:
+                    continue
+                field = RequestDataset(path).get()
+                for variable in list(field.values()):
+                    variable.load()
+
+                results = {}
+                for use_netcdf4_mpi in [False, True]:
+                    env.USE_NETCDF4_MPI = use_netcdf4_mpi
+                    if vm.rank == 0:
+                        out_path = self.get_temporary_file_path('out_{}_{}.nc'.format(size, use_netcdf4_mpi))
+                    else:
+                        out_path = None
+                    out_path = vm.bcast(out_path)
+                    vm.barrier()
+                    results[use_netcdf4_mpi] = get_elapsed(field.write, out_path)[0]
+                    vm.barrier()
+
+                if vm.rank == 0:
+                    bandwidth = {k: nbytes / v / 1024 ** 2 for k, v in results.items()}
+                    print('ranks={}: serialized={:.1f} MB/s, parallel={:.1f} MB/s'.format(size, bandwidth[False],
+                                                                                        bandwidth[True]))
+                    with self.nc_scope(out_path) as ds:
+                        self.assertEqual(ds.variables['tas'].shape, (ntime, 720, 1440))
+
+
+class TestRegridNative(TestBase):
+    @attr('release', 'benchmark')
+    def test_create_rectilinear_weights(self):
+        from ocgis.regrid.native import create_rectilinear_weights
+        from ocgis.regrid.sparse import regrid_field_sparse
+        from ocgis.variable.crs import Spherical
+
+        # Regrid ten time steps from a global half-degree grid to a global two-degree grid.
+        source = create_exact_field(create_gridxy_global(resolution=0.5, crs=Spherical(), dist=False), 'tas', ntime=10)
+        destination = create_exact_field(create_gridxy_global(resolution=2., crs=Spherical(), dist=False), 'tas')
+
+        for regrid_method in ['conserve', 'bilinear']:
+            elapsed, weights = get_elapsed(create_rectilinear_weights, source.grid, destination.grid,
+                                           regrid_method=regrid_method)
+            print('{}: weights={:.3f}s, nnz={}'.format(regrid_method, elapsed, weights.weights.shape[0]))
+
+            native = get_elapsed(regrid_field_sparse, source, destination, regrid_method=regrid_method)
+            print('{}: native regrid={:.3f}s'.format(regrid_method, native[0]))
+
+            # Compare against ESMF if it is available.
+            if env.USE_ESMF:
+                import ESMF
+                from ocgis.regrid.base import regrid_field
+                esmf_method = getattr(ESMF.RegridMethod, regrid_method.upper())
+                esmf = get_elapsed(regrid_field, source, destination, regrid_method=esmf_method)
+                actual = native[1]['tas'].get_masked_value()
+                desired = esmf[1]['tas'].get_masked_value()
+                select = np.logical_not(np.logical_or(actual.mask, desired.mask))
+                relative = np.abs(actual.data[select] - desired.data[select]) / np.abs(desired.data[select])
+                print('{}: esmf regrid={:.3f}s, max relative difference={:.2e}'.format(regrid_method, esmf[0],
+                                                                                       relative.max()))
+                self.assertLess(relative.max(), 1e-2)
@@ -8,7 +8,8 @@ from ocgis import RequestDataset
 from ocgis import env
 from ocgis.base import get_variable_names
 from ocgis.calc.base import AbstractUnivariateFunction, AbstractUnivariateSetFunction, AbstractFunction, \
-    AbstractMultivariateFunction, AbstractParameterizedFunction, AbstractFieldFunction
+    AbstractMultivariateFunction, AbstractParameterizedFunction, AbstractFieldFunction, get_segmented_reduction, \
+    get_temporal_group_segments
 from ocgis.collection.field import Field
 from ocgis.driver.request.multi_request import MultiRequestDataset
 from ocgis.exc import UnitsValidationError, DefinitionValidationError
@@ -47,6 +48,42 @@ class MockSampleSize(MockNeedsUnitsSet):
     long_name = 'the_standard_long_name'
 
 
+class Test(TestBase):
+    def test_get_segmented_reduction(self):
+        value = np.ma.array(np.arange(1, 41, dtype=float).reshape(1, 8, 1, 1, 5), mask=False)
+        value.mask[0, 0:3, 0, 0, 0] = True
+        starts = np.array([0, 3, 5])
+
+        for operation in ['sum', 'mean', 'max', 'min', 'std']:
+            actual = get_segmented_reduction(value, starts, operation)
+            self.assertEqual(actual.shape, (1, 3, 1, 1, 5))
+            desired = getattr(np.ma, operation)
+            for idx, slc in enumerate([slice(0, 3), slice(3, 5), slice(5, 8)]):
+                desired_value = desired(value[:, slc], axis=1)
+                self.assertNumpyAll(actual.mask[:, idx], np.ma.getmaskarray(desired_value))
+                self.assertNumpyAllClose(actual[:, idx].compressed(), desired_value.compressed())
+            # The first element of the first group is fully masked.
+            self.assertTrue(actual.mask[0, 0, 0, 0, 0])
+
+        with self.assertRaises(NotImplementedError):
+            get_segmented_reduction(value, starts, 'median')
+
+    def test_get_temporal_group_segments(self):
+        dgroups = [np.array([True, False, True, False]), np.array([False, True, False, True])]
+        order, starts = get_temporal_group_segments(dgroups, 4)
+        self.assertEqual(order.tolist(), [0, 2, 1, 3])
+        self.assertEqual(starts.tolist(), [0, 2])
+
+        # Groups already sorted in time do not need reordering.
+        order, starts = get_temporal_group_segments([slice(None)], 4)
+        self.assertIsNone(order)
+        self.assertEqual(starts.tolist(), [0])
+
+        # Empty groups may not be reduced as segments.
+        dgroups = [np.array([True, True]), np.array([False, False])]
+        self.assertIsNone(get_temporal_group_segments(dgroups, 2))
+
+
 class TestAbstractFunction(AbstractTestField):
     def test_init(self):
         f = MockNeedsUnits()
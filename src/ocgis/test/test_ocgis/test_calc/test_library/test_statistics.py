@@ -1,7 +1,9 @@
 import numpy as np
 
 import ocgis
-from ocgis.calc.library.statistics import Mean, FrequencyPercentile, MovingWindow, DailyPercentile
+from ocgis.calc.library.statistics import Mean, FrequencyPercentile, MovingWindow, DailyPercentile, Max, Min, \
+    StandardDeviation
+from ocgis.calc.library.thresholds import Threshold
 from ocgis.collection.field import Field
 from ocgis.constants import OutputFormatName
 from ocgis.exc import DefinitionValidationError
@@ -282,6 +284,26 @@ class TestMean(AbstractTestField):
         dvc = mu.execute()
         self.assertNotIn('n_my_mean', list(dvc.keys()))
 
+    def test_execute_segmented(self):
+        """Test segmented reductions match reducing each temporal group independently."""
+
+        field = self.get_field(with_value=True, month_count=3)
+        mask = field['tmax'].get_mask(create=True)
+        mask[0, 0:5, 0, 0, 0] = True
+        field['tmax'].set_mask(mask)
+        for grouping in [['month'], ['month', 'year'], 'all', [[12, 1, 2], [3, 4, 5]]]:
+            tgd = field.temporal.get_grouping(grouping)
+            for klass, parms in [(Mean, None), (Max, None), (Min, None), (StandardDeviation, None),
+                                 (Threshold, {'threshold': 0.5, 'operation': 'gte'})]:
+                self.assertTrue(klass.segmented)
+                actual = klass(field=field, tgd=tgd, parms=parms, calc_sample_size=True, dtype=np.float64)
+                actual = actual.execute()
+                desired = klass(field=field, tgd=tgd, parms=parms, calc_sample_size=True, dtype=np.float64)
+                desired.segmented = False
+                desired = desired.execute()
+                for key in [klass.key, 'n_' + klass.key]:
+                    self.assertNumpyAllClose(actual[key].get_masked_value(), desired[key].get_masked_value())
+
     def test_execute_two_variables(self):
         """Test running a field with two variables through the mean calculation."""
 
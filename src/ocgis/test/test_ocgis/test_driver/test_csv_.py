@@ -1,11 +1,12 @@
 import csv
+from collections import OrderedDict
 
 import numpy as np
 
 from ocgis import RequestDataset, vm
 from ocgis.collection.field import Field
 from ocgis.constants import HeaderName
-from ocgis.driver.csv_ import DriverCSV
+from ocgis.driver.csv_ import DriverCSV, get_block_rows
 from ocgis.test.base import TestBase, attr
 from ocgis.variable.base import Variable, VariableCollection
 from ocgis.variable.temporal import TemporalVariable
@@ -48,6 +49,35 @@ class TestDriverCSV(TestBase):
 
         self.assertCSVFilesEqual(path, path_out)
 
+    def test_system_write_blocks(self):
+        """Test writing a multi-dimensional field in blocks matches the records."""
+
+        time = TemporalVariable(name='time', value=[1, 2, 3], dimensions='time')
+        data = Variable(name='data', value=np.arange(3 * 4 * 5).reshape(3, 4, 5), dimensions=['time', 'y', 'x'])
+        data.get_mask(create=True)[1, 2, :] = True
+        field = Field(time=time, is_data=data, variables=[Variable(name='y', value=np.arange(4), dimensions='y'),
+                                                          Variable(name='x', value=np.arange(5), dimensions='x')])
+
+        desired = [list(record.items()) for _, record in field.iter(driver=DriverCSV)]
+
+        path = self.get_temporary_file_path('blocks.csv')
+        field.write(path, driver=DriverCSV, iter_kwargs={'block_size': 7})
+        with open(path) as f:
+            actual = list(csv.reader(f))
+
+        self.assertEqual(actual[0], [k for k, _ in desired[0]])
+        self.assertEqual(len(actual), len(desired) + 1)
+        for arow, drow in zip(actual[1:], desired):
+            self.assertEqual(arow, ['' if v is None else str(v) for _, v in drow])
+
+    def test_get_block_rows(self):
+        block = OrderedDict([('a', [1, 2]), ('b', ['x', None])])
+        actual = get_block_rows(block, ['b', 'c', 'a'])
+        self.assertEqual(actual, [('x', None, 1), (None, None, 2)])
+
+        with self.assertRaises(ValueError):
+            get_block_rows(block, ['a'])
+
     def test_get_dump_report(self):
         path = self.get_path_to_template_csv()
         rd = RequestDataset(path)
@@ -0,0 +1,65 @@
+import numpy as np
+
+from ocgis.driver.hyperslab import get_coalesced_blocks, read_coalesced, ReadStatistics, get_read_statistics
+from ocgis.test.base import TestBase
+
+
+class Test(TestBase):
+
+    def test_get_coalesced_blocks(self):
+        index = np.array([9, 0, 1, 2, 5, 5, 20])
+        self.assertEqual(get_coalesced_blocks(index, 0.), [(0, 3), (5, 6), (9, 10), (20, 21)])
+        self.assertEqual(get_coalesced_blocks(index, 0.5), [(0, 10), (20, 21)])
+        self.assertEqual(get_coalesced_blocks(index, 1.), [(0, 21)])
+        self.assertEqual(get_coalesced_blocks(np.array([], dtype=int), 0.5), [])
+
+        # Test runs in the same source chunk are merged.
+        self.assertEqual(get_coalesced_blocks(index, 0., chunk_size=5), [(0, 3), (5, 10), (20, 21)])
+
+    def test_get_read_statistics(self):
+        self.assertIsInstance(get_read_statistics(), ReadStatistics)
+
+    def test_read_coalesced(self):
+        value = np.ma.array(np.arange(200).reshape(10, 20), mask=False)
+        value.mask[3, 4] = True
+        rows = np.array([7, 0, 1, 3, 3, 9])
+        cols = np.array([2, 4, 5, 19])
+        desired = value[np.ix_(rows, cols)]
+
+        reads = []
+
+        def getter(slc):
+            reads.append(slc)
+            return value[slc]
+
+        for waste_threshold in [0., 0.5, 1.]:
+            statistics = ReadStatistics()
+            reads[:] = []
+            actual = read_coalesced(getter, (rows, cols), waste_threshold, statistics=statistics)
+            self.assertNumpyAll(actual, desired)
+            self.assertEqual(statistics.count, len(reads))
+            for slc in reads:
+                for element in slc:
+                    self.assertIsInstance(element, slice)
+            if waste_threshold == 1.:
+                self.assertEqual(reads, [(slice(0, 10), slice(2, 20))])
+                self.assertEqual(statistics.nbytes, value[0:10, 2:20].nbytes)
+
+        # Test with slices and unmasked values.
+        value = value.data
+        actual = read_coalesced(getter, (slice(2, 4), cols), 0.)
+        self.assertNumpyAll(actual, value[2:4][:, cols])
+        self.assertNotIsInstance(actual, np.ma.MaskedArray)
+
+
+class TestReadStatistics(TestBase):
+
+    def test(self):
+        statistics = ReadStatistics()
+        statistics.add(np.zeros(10, dtype=np.float64))
+        statistics.add(np.zeros(2, dtype=np.int32))
+        self.assertEqual(statistics.count, 2)
+        self.assertEqual(statistics.nbytes, 88)
+        statistics.reset()
+        self.assertEqual(statistics.count, 0)
+        self.assertEqual(statistics.nbytes, 0)
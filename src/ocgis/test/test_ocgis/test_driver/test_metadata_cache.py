@@ -0,0 +1,128 @@
+import os
+
+import mock
+
+from ocgis import RequestDataset, Variable, env
+from ocgis.driver.dimension_map import DimensionMap
+from ocgis.driver.metadata_cache import MetadataCache, get_metadata_cache
+from ocgis.driver.nc import DriverNetcdf
+from ocgis.test.base import TestBase
+from ocgis.variable.base import VariableCollection
+from ocgis.variable.crs import Spherical
+from ocgis.vmachine.mpi import OcgDist
+
+
+class Test(TestBase):
+
+    def test_get_metadata_cache(self):
+        self.assertIsNone(get_metadata_cache())
+
+        env.USE_METADATA_CACHE = True
+        env.METADATA_CACHE_SIZE = 5
+        actual = get_metadata_cache()
+        self.assertIsInstance(actual, MetadataCache)
+        self.assertEqual(actual.max_entries, 5)
+        self.assertIsNone(actual.directory)
+
+
+class TestMetadataCache(TestBase):
+
+    def create_file(self, name='foo.nc', size=3):
+        path = self.get_temporary_file_path(name)
+        var = Variable(name='foo', value=list(range(size)), dimensions='dfoo')
+        var.write(path)
+        return path
+
+    def test_get_key(self):
+        path = self.create_file()
+        key = MetadataCache.get_key(path, 'netcdf')
+        self.assertEqual(key, MetadataCache.get_key([path], 'netcdf'))
+        self.assertNotEqual(key, MetadataCache.get_key(path, 'netcdf-cf'))
+
+        # Test changing the file changes the key.
+        self.create_file(size=4)
+        self.assertNotEqual(key, MetadataCache.get_key(path, 'netcdf'))
+
+        # Test non-file sources are not cached.
+        self.assertIsNone(MetadataCache.get_key('http://foo.bar/data.nc', 'netcdf'))
+        self.assertIsNone(MetadataCache.get_key([path, self.get_temporary_file_path('dne.nc')], 'netcdf'))
+
+    def test_get_and_set(self):
+        cache = MetadataCache(2)
+        value = {'variables': {'foo': {'name': 'foo'}}}
+        cache.set('a', 'metadata', value)
+        actual = cache.get('a', 'metadata')
+        self.assertEqual(actual, value)
+
+        # Test copies are returned.
+        actual['variables'].pop('foo')
+        self.assertEqual(cache.get('a', 'metadata'), value)
+
+        # Test least recently used entries are evicted.
+        cache.set('b', 'metadata', value)
+        cache.get('a', 'metadata')
+        cache.set('c', 'metadata', value)
+        self.assertIsNone(cache.get('b', 'metadata'))
+        self.assertIsNotNone(cache.get('a', 'metadata'))
+
+        # Test persisting entries to disk.
+        directory = os.path.join(self.current_dir_output, 'cache')
+        cache = MetadataCache(2, directory=directory)
+        cache.set('a', 'metadata', value)
+        cache.clear()
+        self.assertEqual(cache.get('a', 'metadata'), value)
+        self.assertEqual(MetadataCache(2, directory=directory).get('a', 'metadata'), value)
+
+    def test_system_request_dataset(self):
+        """Test metadata and derived objects are read from the cache."""
+
+        env.USE_METADATA_CACHE = True
+        env.DIR_METADATA_CACHE = os.path.join(self.current_dir_output, 'cache')
+        get_metadata_cache().clear()
+
+        path = self.create_file()
+        rd = RequestDataset(path)
+        desired = rd.metadata
+        self.assertIsInstance(rd.driver.dimension_map_raw, DimensionMap)
+        self.assertIsInstance(rd.driver.dist, OcgDist)
+        self.assertEqual(len(os.listdir(env.DIR_METADATA_CACHE)), 3)
+
+        with mock.patch.object(DriverNetcdf, '_get_metadata_main_') as m:
+            rd = RequestDataset(path)
+            self.assertEqual(rd.metadata, desired)
+            self.assertIsInstance(rd.driver.dist, OcgDist)
+            m.assert_not_called()
+
+            # Test the in-process cache is not required.
+            get_metadata_cache().clear()
+            rd = RequestDataset(path)
+            self.assertEqual(rd.metadata, desired)
+            m.assert_not_called()
+
+        # Test coordinate system options, predicates, and chunk alignment are used to key derived objects.
+        path2 = self.get_temporary_file_path('foobar.nc')
+        vc = VariableCollection(variables=[Variable(name=name, value=[1, 2], dimensions='dfoo')
+                                           for name in ['foo', 'bar']])
+        vc.write(path2)
+        names = []
+        original_set = MetadataCache.set
+
+        def _set_(cache, key, name, value):
+            names.append(name)
+            return original_set(cache, key, name, value)
+
+        with mock.patch.object(MetadataCache, 'set', _set_):
+            for kwargs in [{}, {'crs': Spherical()}, {'crs': None}, {'rotated_pole_priority': True},
+                           {'predicate': lambda x: x != 'bar'}]:
+                rd = RequestDataset(path2, **kwargs)
+                self.assertIsInstance(rd.driver.dimension_map_raw, DimensionMap)
+            for use_chunk_alignment in [True, False]:
+                env.USE_CHUNK_ALIGNMENT = use_chunk_alignment
+                self.assertIsInstance(RequestDataset(path2).driver.dist, OcgDist)
+        self.assertEqual(len(set([n for n in names if n.startswith('dimension_map-')])), 5)
+        self.assertEqual(len(set([n for n in names if n.startswith('dist-')])), 2)
+
+        # Test a modified file is read from source.
+        self.create_file(size=5)
+        rd = RequestDataset(path)
+        self.assertEqual(rd.metadata['dimensions']['dfoo']['size'], 5)
@@ -4,6 +4,7 @@ from copy import deepcopy
 from unittest import SkipTest
 
 import fiona
+import netCDF4 as nc
 import numpy as np
 from mock import mock
 from shapely.geometry.geo import shape, box
@@ -16,7 +17,9 @@ from ocgis.collection.field import Field
 from ocgis.constants import DimensionMapKey, DMK, KeywordArgument, MPIWriteMode
 from ocgis.driver.base import iter_all_group_keys, driver_scope
 from ocgis.driver.dimension_map import DimensionMap
-from ocgis.driver.nc import DriverNetcdf, DriverNetcdfCF, remove_netcdf_attribute, get_crs_variable
+from ocgis.driver.hyperslab import get_read_statistics
+from ocgis.driver.nc import DriverNetcdf, DriverNetcdfCF, remove_netcdf_attribute, get_crs_variable, \
+    get_variable_chunking, update_chunk_cache, get_char_array, write_empty_selection
 from ocgis.exc import OcgWarning, CannotFormatTimeError, \
     NoDataVariablesFound
 from ocgis.ops.core import OcgOperations
@@ -69,6 +72,94 @@ class Test(TestBase):
         sub = tin[2:8]
         self.assertEqual(sub.get_value().tolist(), range(3, 9))
 
+    def test_get_variable_value_coalesced(self):
+        """Test non-contiguous source indices are read from coalesced blocks."""
+
+        path = self.get_temporary_file_path('foo.nc')
+        var = Variable(name='foo', value=np.arange(100).reshape(10, 10), dimensions=['y', 'x'])
+        var.write(path)
+        rows = np.array([0, 1, 2, 5, 9])
+        desired = var.get_value()[rows, 2:4]
+
+        statistics = get_read_statistics()
+        for use_coalesced_reads, waste_threshold, desired_count in [(False, 0.5, 1), (True, 0.4, 2), (True, 0., 3)]:
+            env.USE_COALESCED_READS = use_coalesced_reads
+            env.COALESCED_READ_WASTE_THRESHOLD = waste_threshold
+            sub = RequestDataset(path).get()['foo'][rows, 2:4]
+            statistics.reset()
+            actual = sub.get_value()
+            self.assertEqual(statistics.count, desired_count)
+            self.assertEqual(actual.tolist(), desired.tolist())
+
+    def test_get_char_array(self):
+        actual = get_char_array(np.array(['a', 'bcd', '']), 4)
+        self.assertEqual(actual.shape, (3, 4))
+        self.assertEqual(actual.dtype, np.dtype('S1'))
+        self.assertEqual(actual[1].tolist(), [b'b', b'c', b'd', b''])
+
+        with self.assertRaises(ValueError):
+            get_char_array(['abcde'], 4)
+
+    def test_write_empty_selection(self):
+        path = self.get_temporary_file_path('foo.nc')
+        with self.nc_scope(path, 'w') as ds:
+            ds.createDimension('time', None)
+            ds.createDimension('x', 3)
+            var = ds.createVariable('foo', np.float32, dimensions=('time', 'x'))
+            var[0, :] = [1, 2, 3]
+            vlen = ds.createVariable('ragged', ds.createVLType(np.int32, 'ragged_vltype'), dimensions=('x',))
+            write_empty_selection(var)
+            write_empty_selection(vlen)
+
+        with self.nc_scope(path) as ds:
+            self.assertEqual(ds.variables['foo'][:].tolist(), [[1, 2, 3]])
+
+    def test_get_variable_chunking(self):
+        path = self.get_temporary_file_path('foo.nc')
+        with self.nc_scope(path, 'w') as ds:
+            ds.createDimension('time', 4)
+            ds.createDimension('x', 6)
+            ds.createVariable('chunked', np.float32, dimensions=('time', 'x'), chunksizes=(1, 6))
+            ds.createVariable('contiguous', np.float32, dimensions=('time', 'x'), contiguous=True)
+
+        with self.nc_scope(path) as ds:
+            self.assertEqual(get_variable_chunking(ds.variables['chunked']), (1, 6))
+            self.assertIsNone(get_variable_chunking(ds.variables['contiguous']))
+
+        rd = RequestDataset(path)
+        self.assertEqual(rd.metadata['variables']['chunked']['chunking'], (1, 6))
+        self.assertEqual(len(rd.metadata['variables']['chunked']['chunk_cache']), 3)
+        self.assertIsNone(rd.metadata['variables']['contiguous']['chunking'])
+        self.assertIsNone(rd.metadata['variables']['contiguous']['chunk_cache'])
+
+    def test_update_chunk_cache(self):
+        path = self.get_temporary_file_path('foo.nc')
+        with self.nc_scope(path, 'w') as ds:
+            ds.createDimension('time', 100)
+            ds.createDimension('x', 1000)
+            var = ds.createVariable('foo', np.float64, dimensions=('time', 'x'), chunksizes=(10, 1000))
+            var.set_var_chunk_cache(size=1024)
+
+            # Ten chunks of 80000 bytes are touched.
+            update_chunk_cache(var, (slice(5, 100), np.array([1, 500])), (10, 1000))
+            self.assertEqual(var.get_var_chunk_cache()[0], 800000)
+
+            # Test the cache is not decreased.
+            update_chunk_cache(var, (slice(0, 1), slice(0, 1)), (10, 1000))
+            self.assertEqual(var.get_var_chunk_cache()[0], 800000)
+
+            # Test the cache size limit.
+            env.NETCDF_CHUNK_CACHE_SIZE = 900000
+            var.set_var_chunk_cache(size=1024)
+            update_chunk_cache(var, (slice(None), slice(None)), (10, 1000))
+            self.assertEqual(var.get_var_chunk_cache()[0], 900000)
+
+            # Test tuning may be disabled.
+            env.NETCDF_CHUNK_CACHE_SIZE = 0
+            var.set_var_chunk_cache(size=1024)
+            update_chunk_cache(var, (slice(None), slice(None)), (10, 1000))
+            self.assertEqual(var.get_var_chunk_cache()[0], 1024)
+
     def test_remove_netcdf_attribute(self):
         path = self.get_temporary_file_path('foo.nc')
         var = Variable(name='test', attrs={'remove_me': 10})
@@ -262,6 +353,14 @@ class TestDriverNetcdf(TestBase):
                 groups_desired = list(iter_all_group_keys(desired))
                 self.assertEqual(groups_actual, groups_desired)
 
+    def test_get_dimension_chunk_sizes(self):
+        group_metadata = {'dimensions': {'time': {'size': 10}, 'x': {'size': 5}, 'bnds': {'size': 2}},
+                          'variables': {'time_bnds': {'dimensions': ('time', 'bnds'), 'chunking': (10, 2)},
+                                        'foo': {'dimensions': ('time', 'x'), 'chunking': (1, 5)},
+                                        'x': {'dimensions': ('x',), 'chunking': None}}}
+        actual = DriverNetcdf.get_dimension_chunk_sizes(group_metadata)
+        self.assertEqual(actual, {'time': 1, 'x': 5, 'bnds': 2})
+
     @attr('mpi')
     def test_get_dist_default_distribution(self):
         """Test using default distributions defined by drivers."""
@@ -349,6 +448,15 @@ class TestDriverNetcdf(TestBase):
         desired = [MPIWriteMode.ASYNCHRONOUS]
         self.assertEqual(actual, desired)
 
+        # Test classic netCDF4 files are written in parallel.
+        kwds[KeywordArgument.DATASET_KWARGS][KeywordArgument.FORMAT] = 'NETCDF4_CLASSIC'
+        self.assertEqual(DriverNetcdf._get_write_modes_(m_vm, **kwds), desired)
+
+        # Test netCDF3 files are written one rank at a time.
+        kwds[KeywordArgument.DATASET_KWARGS][KeywordArgument.FORMAT] = 'NETCDF3_CLASSIC'
+        actual = DriverNetcdf._get_write_modes_(m_vm, **kwds)
+        self.assertEqual(actual, [MPIWriteMode.TEMPLATE, MPIWriteMode.FILL])
+
     def test_open(self):
         # Test with a multi-file dataset.
         path1 = self.get_temporary_file_path('foo1.nc')
@@ -390,6 +498,24 @@ class TestDriverNetcdf(TestBase):
         self.assertEqual(sv.get_value().tolist(), [1, 222, 222, 4])
         self.assertNumpyAll(sv.get_mask(), v.get_mask())
 
+    def test_write_variable_strings_and_vltype(self):
+        """Test string and variable-length values are written in bulk."""
+
+        path = self.get_temporary_file_path('foo.nc')
+        names = Variable(name='names', value=np.array(['a', 'bcd', '', 'ef'], dtype=object), dimensions='ngeom')
+        vl_value = np.array([None] * 3, dtype=object)
+        for idx, length in enumerate([1, 3, 2]):
+            vl_value[idx] = np.arange(length, dtype=np.int32)
+        ragged = Variable(name='ragged', value=vl_value, dtype=ObjectType(np.int32), dimensions='nragged')
+        VariableCollection(variables=[names, ragged]).write(path)
+
+        with self.nc_scope(path) as ds:
+            actual = ds.variables['names'][:]
+            self.assertEqual(actual.shape, (4, 3))
+            self.assertEqual(nc.chartostring(actual).tolist(), ['a', 'bcd', '', 'ef'])
+            actual = ds.variables['ragged'][:]
+            self.assertEqual([a.tolist() for a in actual], [[0], [0, 1, 2], [0, 1]])
+
     @attr('mpi')
     def test_write_variable_collection(self):
         if MPI_RANK == 0:
@@ -467,6 +593,40 @@ class TestDriverNetcdf(TestBase):
             # self.ncdump(actual_path, header_only=False)
             self.assertNcEqual(actual_path, path)
 
+    @attr('mpi')
+    def test_write_variable_collection_netcdf4_mpi_more_ranks_than_elements(self):
+        """Test collective writes complete when ranks outnumber elements or a rank has no values to write."""
+
+        if not env.USE_NETCDF4_MPI:
+            raise SkipTest('not env.USE_NETCDF4_MPI')
+        if vm.size < 3:
+            raise SkipTest('vm.size < 3')
+
+        path = self.get_temporary_file_path('out.nc') if vm.rank == 0 else None
+        path = vm.bcast(path)
+
+        dist = OcgDist()
+        dim = dist.create_dimension('values', 2, dist=True)
+        dist.update_dimension_bounds()
+        time = Dimension('time', size=None, size_current=3)
+
+        with vm.scoped_by_emptyable('write', dim):
+            if not vm.is_null:
+                value = np.arange(*dim.bounds_local, dtype=float)
+                data = Variable(name='data', value=value, dimensions=dim)
+                # Only the first rank has a value for this variable.
+                partial = Variable(name='partial', dimensions=dim, dtype=float)
+                if vm.rank == 0:
+                    partial.set_value(value + 10)
+                tvar = Variable(name='time', value=[1., 2., 3.], dimensions=time)
+                VariableCollection(variables=[data, partial, tvar]).write(path)
+
+        if vm.rank == 0:
+            with self.nc_scope(path) as ds:
+                self.assertEqual(ds.variables['data'][:].tolist(), [0., 1.])
+                self.assertEqual(ds.variables['partial'][0], 10.)
+                self.assertEqual(ds.variables['time'][:].tolist(), [1., 2., 3.])
+
     @attr('mpi')
     def test_write_variable_collection_object_arrays(self):
         """Test writing variable length arrays in parallel."""
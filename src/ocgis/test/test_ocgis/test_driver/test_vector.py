@@ -12,7 +12,8 @@ from ocgis import constants
 from ocgis.collection.field import Field
 from ocgis.constants import MPIWriteMode, DimensionName, VariableName, DMK
 from ocgis.driver.base import AbstractDriver, driver_scope
-from ocgis.driver.vector import DriverVector, get_fiona_crs, get_fiona_schema
+from ocgis.driver.vector import DriverVector, get_fiona_crs, get_fiona_schema, get_part_path, merge_part_files, \
+    write_records_to_fiona
 from ocgis.ops.core import OcgOperations
 from ocgis.spatial.geom_cabinet import GeomCabinetIterator, GeomCabinet
 from ocgis.test.base import TestBase, attr, create_exact_field, create_gridxy_global
@@ -411,3 +412,44 @@ class TestDriverVector(TestBase):
                         self.assertEqual(v, field2.crs)
                     else:
                         self.assertNumpyAll(v.get_value(), field2[v.name].get_value())
+
+        # Test part files are removed following the merge.
+        if MPI_RANK == 0:
+            for rank in range(MPI_SIZE):
+                self.assertFalse(os.path.exists(get_part_path(path1, rank)))
+
+
+class Test(TestBase):
+    def test_get_part_path(self):
+        self.assertEqual(get_part_path('/a/b/out.shp', 2), '/a/b/out_part2.shp')
+        self.assertEqual(get_part_path('out.geojson', 0), 'out_part0.geojson')
+
+    def test_merge_part_files(self):
+        schema = {'geometry': 'Point', 'properties': {'UGID': 'int'}}
+        kwargs = dict(driver='ESRI Shapefile', crs=WGS84().value, schema=schema)
+        part_paths = []
+        for idx in range(3):
+            part_path = self.get_temporary_file_path('out_part{}.shp'.format(idx))
+            with fiona.open(part_path, mode='w', **kwargs) as sink:
+                sink.writerecords([{'geometry': {'type': 'Point', 'coordinates': (float(idx), float(ii))},
+                                    'properties': {'UGID': idx * 10 + ii}} for ii in range(idx + 1)])
+            part_paths.append(part_path)
+        path = self.get_temporary_file_path('out.shp')
+
+        merge_part_files(path, part_paths, 'w', batch_size=2, **kwargs)
+
+        with fiona.open(path) as source:
+            actual = [r['properties']['UGID'] for r in source]
+        self.assertEqual(actual, [0, 10, 11, 20, 21, 22])
+        for part_path in part_paths:
+            self.assertFalse(os.path.exists(part_path))
+
+    def test_write_records_to_fiona(self):
+        itr = ((Point(ii, ii), {'UGID': ii}) for ii in range(5))
+        sink = mock.Mock()
+
+        write_records_to_fiona(sink, itr, 'GeoJSON', batch_size=2)
+
+        self.assertEqual(sink.writerecords.call_count, 3)
+        self.assertEqual(len(sink.writerecords.call_args_list[-1][0][0]), 1)
+        sink.write.assert_not_called()
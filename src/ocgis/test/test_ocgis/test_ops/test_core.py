@@ -3,10 +3,12 @@ import datetime
 import itertools
 import os
 import sys
+from copy import deepcopy
 from datetime import datetime as dt
 from unittest import SkipTest
 
 import numpy as np
+from mock import mock
 from shapely.geometry import Point, LineString
 
 import ocgis
@@ -15,6 +17,7 @@ from ocgis import constants
 from ocgis import env
 from ocgis.collection.field import Field
 from ocgis.constants import WrappedState, HeaderName, OutputFormatName, DMK, KeywordArgument
+from ocgis.conv.nc import NcConverter
 from ocgis.exc import DefinitionValidationError
 from ocgis.ops.core import OcgOperations
 from ocgis.ops.parms import definition
@@ -815,6 +818,102 @@ class TestOcgOperationsNoData(TestBase):
         out_field = ret.get_element()
         self.assertIn(field.data_variables[0].name, out_field)
 
+    def test_system_chunking(self):
+        """Test chunked operations produce the same outputs as unchunked operations."""
+
+        if vm.size > 1:
+            raise SkipTest('vm.size > 1')
+
+        grid = create_gridxy_global(resolution=30.0, dist=False)
+        field = create_exact_field(grid, 'foo', ntime=4)
+        path = self.get_temporary_file_path('in.nc')
+        field.write(path)
+
+        for output_format in [constants.OutputFormatName.NETCDF, constants.OutputFormatName.CSV]:
+            ret = []
+            for chunking in [None, {'spatial': 5}]:
+                prefix = 'chunked' if chunking is not None else 'unchunked'
+                prefix = '{}_{}'.format(prefix, output_format)
+                rd = RequestDataset(path)
+                ops = OcgOperations(dataset=rd, calc=[{'func': 'mean', 'name': 'mean'}], calc_grouping=['month'],
+                                    output_format=output_format, prefix=prefix, chunking=chunking)
+                with mock.patch.object(NcConverter, '_write_archetype_', autospec=True,
+                                       side_effect=NcConverter._write_archetype_) as m_write_archetype:
+                    ret.append(ops.execute())
+                if output_format == constants.OutputFormatName.NETCDF and chunking is not None:
+                    # The 6x12 grid is written in six 5x5 chunks.
+                    self.assertEqual(m_write_archetype.call_count, 6)
+
+            if output_format == constants.OutputFormatName.NETCDF:
+                self.assertNcEqual(ret[0], ret[1], ignore_attributes={'global': ['history']})
+                # Every chunk is present in the output, not just the last one written.
+                with self.nc_scope(ret[0]) as desired, self.nc_scope(ret[1]) as actual:
+                    self.assertEqual(actual.variables['mean'].shape, desired.variables['mean'].shape)
+                    self.assertEqual(actual.variables['mean'].shape[-2:], (6, 12))
+                    self.assertFalse(np.ma.is_masked(actual.variables['mean'][:]))
+                    self.assertNumpyAll(actual.variables['mean'][:], desired.variables['mean'][:])
+            else:
+                actual = []
+                for r in ret:
+                    with open(r) as f:
+                        actual.append(sorted([sorted(row.items()) for row in csv.DictReader(f)]))
+                # All time values fall in the same month.
+                self.assertEqual(len(actual[0]), 6 * 12)
+                self.assertEqual(actual[0], actual[1])
+
+        # Test chunking may not be used with in-memory outputs or spatial aggregation.
+        rd = RequestDataset(path)
+        with self.assertRaises(DefinitionValidationError):
+            OcgOperations(dataset=rd, chunking={'spatial': 5})
+        with self.assertRaises(DefinitionValidationError):
+            OcgOperations(dataset=rd, chunking={'spatial': 5}, aggregate=True, output_format='nc')
+
+    def test_system_extract_stations(self):
+        """Test station extraction matches selecting the nearest element for each station."""
+
+        if vm.size > 1:
+            raise SkipTest('vm.size > 1')
+
+        grid = create_gridxy_global(resolution=10.0, dist=False)
+        field = create_exact_field(grid, 'foo', ntime=3)
+        path = self.get_temporary_file_path('in.nc')
+        field.write(path)
+
+        # Two stations share the same grid element.
+        points = [Point(-44., 12.), Point(101., -78.), Point(-44.5, 13.), Point(172., 86.)]
+        geom = [{'geom': p, 'properties': {'UGID': ugid}, 'crs': Spherical()}
+                for ugid, p in enumerate(points, start=10)]
+
+        ops = OcgOperations(dataset=RequestDataset(path), geom=deepcopy(geom), extract_stations=True)
+        actual = ops.execute().get_element()
+        self.assertEqual(actual['foo'].dimension_names, ('time', constants.DimensionName.STATION))
+        self.assertEqual(actual['foo'].shape, (3, 4))
+        self.assertEqual(actual.geom.ugid.get_value().tolist(), [10, 11, 12, 13])
+        self.assertEqual(actual.time.get_value().tolist(), [1., 2., 3.])
+
+        for idx, g in enumerate(geom):
+            ops = OcgOperations(dataset=RequestDataset(path), geom=[deepcopy(g)], select_nearest=True)
+            desired = ops.execute().get_element()
+            self.assertNumpyAll(actual['foo'].get_value()[:, idx], desired['foo'].get_value().reshape(-1))
+            self.assertEqual(actual['x'].get_value()[idx], desired.grid.x.get_value()[0])
+            self.assertEqual(actual['y'].get_value()[idx], desired.grid.y.get_value()[0])
+            self.assertEqual(actual.geom.get_value()[idx], Point(actual['x'].get_value()[idx],
+                                                                 actual['y'].get_value()[idx]))
+
+        # Test writing stations to netCDF and unwrapping station coordinates.
+        ops = OcgOperations(dataset=RequestDataset(path), geom=deepcopy(geom), extract_stations=True,
+                            output_format=constants.OutputFormatName.NETCDF, spatial_wrapping='unwrap')
+        with self.nc_scope(ops.execute()) as ds:
+            self.assertEqual(ds.variables['foo'].dimensions, ('time', constants.DimensionName.STATION))
+            self.assertEqual(ds.variables['x'][:].tolist(), [315., 105., 315., 175.])
+            self.assertEqual(ds.variables['y'][:].tolist(), [15., -75., 15., 85.])
+
+        # Test station extraction requires selection geometries and may not be aggregated.
+        with self.assertRaises(DefinitionValidationError):
+            OcgOperations(dataset=RequestDataset(path), extract_stations=True)
+        with self.assertRaises(DefinitionValidationError):
+            OcgOperations(dataset=RequestDataset(path), geom=deepcopy(geom), extract_stations=True, aggregate=True)
+
     def test_system_dataset_identifiers_on_variables(self):
         """Test dataset identifiers make it to output variables for iteration."""
 
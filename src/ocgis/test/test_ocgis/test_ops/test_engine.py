@@ -1,8 +1,11 @@
 import itertools
 from copy import deepcopy
+from unittest import SkipTest
 
 import numpy as np
+from mock import mock
 from shapely import wkt
+from shapely.geometry import box
 
 import ocgis
 from ocgis import SpatialCollection, Variable
@@ -11,14 +14,36 @@ from ocgis.collection.field import Field
 from ocgis.constants import TagName, DimensionMapKey
 from ocgis.conv.numpy_ import NumpyConverter
 from ocgis.ops.core import OcgOperations
-from ocgis.ops.engine import OperationsEngine
+from ocgis.ops.engine import OperationsEngine, _process_geometry_in_pool_worker_
 from ocgis.spatial.grid import Grid
 from ocgis.test.base import attr, AbstractTestInterface, get_geometry_dictionaries
+from ocgis.util.helpers import initialize_pool_worker, POOL_WORKER_STATE
 from ocgis.util.itester import itr_products_keywords
 from ocgis.util.logging_ocgis import ProgressOcgOperations
 from ocgis.variable.crs import Spherical, WGS84, CoordinateReferenceSystem
 
 
+class Test(AbstractTestInterface):
+
+    def test_process_geometry_in_pool_worker(self):
+        engine = mock.Mock(_progress=ProgressOcgOperations())
+
+        def _process_geometries_(itr, field, alias):
+            for subset_field in itr:
+                engine._progress.mark()
+                yield subset_field
+
+        engine._process_geometries_.side_effect = _process_geometries_
+        self.addCleanup(POOL_WORKER_STATE.clear)
+        initialize_pool_worker({'engine': engine, 'field': None, 'alias': None})
+
+        # Test progress marked in the worker is returned with the collections.
+        for _ in range(2):
+            colls, n_completed = _process_geometry_in_pool_worker_('geom')
+            self.assertEqual(colls, ['geom'])
+            self.assertEqual(n_completed, 1)
+
+
 class TestOperationsEngine(AbstractTestInterface):
     def get_operations(self):
         rd = self.test_data.get_rd('cancm4_tas')
@@ -82,6 +107,34 @@ class TestOperationsEngine(AbstractTestInterface):
         self.assertEqual(container.geom.get_value()[0], geom[1]['geom'])
         self.assertEqual(len(coll.children), 3)
 
+    def test_system_multiple_datasets_with_pool_executor(self):
+        """Test datasets subsetted concurrently are returned in order and match serial processing."""
+
+        if ocgis.vm.size > 1:
+            raise SkipTest('vm.size > 1')
+
+        def _get_fields_():
+            ret = []
+            for ii in range(5):
+                x = Variable('x', np.arange(-110.0, -99.0), dimensions='x')
+                y = Variable('y', np.arange(30.0, 41.0), dimensions='y')
+                data = Variable('data{}'.format(ii), np.arange(121).reshape(11, 11) * (ii + 1),
+                                dimensions=['y', 'x'])
+                field = Field(grid=Grid(x, y), crs=Spherical(), is_data=data, name='field{}'.format(ii))
+                ret.append(field)
+            return ret
+
+        actual = {}
+        for executor in ['serial', 'process']:
+            ops = OcgOperations(dataset=_get_fields_(), geom=[-105.5, 33.5, -102.5, 36.5], executor=executor,
+                                workers=2)
+            ret = ops.execute()
+            actual[executor] = [(sfield.name, sfield.data_variables[0].get_value().tolist())
+                                for sfield in ret.iter_fields()]
+
+        self.assertEqual([a[0] for a in actual['process']], ['field{}'.format(ii) for ii in range(5)])
+        self.assertEqual(actual['process'], actual['serial'])
+
     def test_system_process_geometries(self):
         """Test multiple geometries with coordinate system update."""
 
@@ -111,6 +164,28 @@ class TestOperationsEngine(AbstractTestInterface):
             self.assertAlmostEqual(field.grid.get_value_stacked().mean(),
                                    expected[container.geom.ugid.get_value()[0]])
 
+    def test_system_process_geometries_with_process_executor(self):
+        """Test selection geometries distributed to a local process pool match serial processing."""
+
+        if ocgis.vm.size > 1:
+            raise SkipTest('vm.size > 1')
+
+        x = Variable('x', np.arange(-110.0, -99.0), dimensions='x')
+        y = Variable('y', np.arange(30.0, 41.0), dimensions='y')
+        geom = [{'geom': box(-110.5 + ii, 30.5 + ii, -108.5 + ii, 32.5 + ii), 'properties': {'UGID': ugid}}
+                for ugid, ii in zip([5, 3, 9, 1, 7], range(5))]
+
+        actual = {}
+        for executor in ['serial', 'process']:
+            field = Field(grid=Grid(x.copy(), y.copy()), crs=Spherical())
+            ops = OcgOperations(dataset=field, geom=geom, executor=executor, workers=2)
+            ret = ops.execute()
+            actual[executor] = [(container.geom.ugid.get_value()[0], sfield.grid.get_value_stacked().tolist())
+                                for sfield, container in ret.iter_fields(yield_container=True)]
+
+        self.assertEqual([a[0] for a in actual['process']], [5, 3, 9, 1, 7])
+        self.assertEqual(actual['process'], actual['serial'])
+
     @attr('data', 'esmf')
     def test_system_regridding_bounding_box_wrapped(self):
         """Test subsetting with a wrapped bounding box with the target as a 0-360 global grid."""
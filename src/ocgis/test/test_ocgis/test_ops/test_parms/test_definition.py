@@ -2,7 +2,7 @@ import tempfile
 import types
 
 from ocgis.calc.library.statistics import Mean
-from ocgis.constants import TagName
+from ocgis.constants import TagName, ExecutorName
 from ocgis.conv.numpy_ import NumpyConverter
 from ocgis.ops.parms.base import AbstractParameter
 from ocgis.ops.parms.definition import *
@@ -342,6 +342,24 @@ class TestCalcGrouping(TestBase):
             CalcGrouping([[1, 2, 3], [4, 5, 6], 'fod'])
 
 
+class TestChunking(TestBase):
+    create_dir = False
+
+    def test_init(self):
+        cc = Chunking()
+        self.assertIsNone(cc.value)
+
+        for value in [{'spatial': 10}, {'spatial': [10, 20], 'time': 5}, {'memory': 1000000}]:
+            cc = Chunking(value)
+            self.assertEqual(cc.value, value)
+            self.assertIn('chunking definition', cc._get_meta_())
+
+        bad = [{}, {'foo': 1}, {'spatial': 10, 'memory': 100}, {'spatial': 0}, {'time': -1}, {'spatial': [10, 1.5]}]
+        for value in bad:
+            with self.assertRaises(DefinitionValidationError):
+                Chunking(value)
+
+
 class TestConformUnitsTo(TestBase):
     create_dir = False
 
@@ -494,6 +512,33 @@ class TestDataset(TestBase):
         self.assertIsNone(f2.uid)
 
 
+class TestExecutor(TestBase):
+    create_dir = False
+
+    def test_init(self):
+        ee = Executor()
+        self.assertEqual(ee.value, ExecutorName.SERIAL)
+
+        ee = Executor('process')
+        self.assertEqual(ee.value, ExecutorName.PROCESS)
+
+        with self.assertRaises(DefinitionValidationError):
+            Executor('thread')
+
+
+class TestExtractStations(TestBase):
+    create_dir = False
+
+    def test_init(self):
+        es = ExtractStations()
+        self.assertFalse(es.value)
+        self.assertIn('processed individually', es._get_meta_())
+
+        es = ExtractStations(True)
+        self.assertTrue(es.value)
+        self.assertIn('station dimension', es._get_meta_())
+
+
 class TestGeom(TestBase):
     create_dir = False
 
@@ -870,6 +915,11 @@ class TestRegridOptions(TestBase):
         with self.assertRaises(DefinitionValidationError):
             RegridOptions({'foo': 5})
 
+        ro = RegridOptions({'weights_path': '/a/weights.nc'})
+        self.assertEqual(ro.value['weights_path'], '/a/weights.nc')
+        with self.assertRaises(DefinitionValidationError):
+            RegridOptions({'weights_path': 5})
+
     def test_get_meta(self):
         ro = RegridOptions()
         ro._get_meta_()
@@ -1018,3 +1068,18 @@ class TestTimeSubsetFunction(TestBase):
 
         tsf = TimeSubsetFunction(_func_)
         self.assertEqual(tsf.value, _func_)
+
+
+class TestWorkers(TestBase):
+    create_dir = False
+
+    def test_init(self):
+        ww = Workers()
+        self.assertIsNone(ww.value)
+
+        ww = Workers(4)
+        self.assertEqual(ww.value, 4)
+
+        for bad in [0, -1, 2.5]:
+            with self.assertRaises(DefinitionValidationError):
+                Workers(bad)
@@ -1,6 +1,7 @@
 from copy import deepcopy
 
 import numpy as np
+from mock import mock
 
 from ocgis import OcgOperations
 from ocgis import RequestDataset
@@ -209,6 +210,56 @@ class TestRegrid(TestSimpleBase):
             from ocgis.regrid.base import regrid_field
             regrid_field(source, destination)
 
+    @attr('esmf')
+    def test_regrid_field_weights_path(self):
+        """Test regridding weights are persisted to and loaded from a weight file."""
+        from ocgis.regrid.base import regrid_field, get_regrid_weight_key
+        from ocgis import constants
+
+        source = self.get_ofield()
+        source.set_crs(Spherical())
+        destination = deepcopy(source)
+        weights_path = self.get_temporary_file_path('weights.nc')
+
+        desired = regrid_field(source, destination)
+        for _ in range(2):
+            actual = regrid_field(source, destination, weights_path=weights_path)
+            for variable in desired.data_variables:
+                self.assertNumpyAll(actual[variable.name].get_masked_value(), variable.get_masked_value())
+        with self.nc_scope(weights_path) as ds:
+            key = ds.getncattr(constants.REGRID_WEIGHT_KEY_ATTR)
+            self.assertEqual(ds.getncattr(constants.REGRID_WEIGHT_ENGINE_ATTR), constants.RegridEngine.ESMF)
+
+        # Test the sparse engine applies weights written by ESMF.
+        from ocgis.regrid.sparse import regrid_field_sparse
+        with mock.patch('ocgis.regrid.native.create_rectilinear_weights') as m_create:
+            actual = regrid_field_sparse(source, destination, weights_path=weights_path)
+            m_create.assert_not_called()
+        for variable in desired.data_variables:
+            self.assertNumpyAllClose(actual[variable.name].get_masked_value(), variable.get_masked_value())
+
+        # Test the weight file is regenerated if the mask changes.
+        value_mask = np.zeros(destination.grid.shape, dtype=bool)
+        value_mask[1, 1] = True
+        self.assertNotEqual(get_regrid_weight_key(source.grid, destination.grid, None, value_mask=value_mask),
+                            get_regrid_weight_key(source.grid, destination.grid, None))
+        actual = regrid_field(source, destination, value_mask=value_mask, weights_path=weights_path)
+        self.assertTrue(np.all(actual.data_variables[0].get_mask()[:, 1, 1]))
+        with self.nc_scope(weights_path) as ds:
+            self.assertNotEqual(ds.getncattr(constants.REGRID_WEIGHT_KEY_ATTR), key)
+
+        # Test the weight file is regenerated if the source data mask changes.
+        source = self.get_ofield()
+        source.set_crs(Spherical())
+        for variable in source.data_variables:
+            mask = variable.get_mask(create=True)
+            mask[..., 1, 1] = True
+            variable.set_mask(mask)
+        actual = regrid_field(source, destination, weights_path=weights_path)
+        self.assertTrue(np.all(actual.data_variables[0].get_mask()[:, 1, 1]))
+        with self.nc_scope(weights_path) as ds:
+            self.assertNotEqual(ds.getncattr(constants.REGRID_WEIGHT_KEY_ATTR), key)
+
     @attr('esmf')
     def test_regrid_field_value_mask(self):
         """Test with a value mask on the destination."""
@@ -0,0 +1,87 @@
+import numpy as np
+
+from ocgis import Variable, Grid
+from ocgis.exc import RegriddingError
+from ocgis.regrid.native import create_rectilinear_weights, get_bilinear_weights_1d, get_conservative_weights_1d, \
+    get_is_periodic, get_native_regrid_method, NativeRegridMethod
+from ocgis.test.base import TestBase, create_gridxy_global
+from ocgis.variable.crs import Spherical
+
+
+class Test(TestBase):
+    def get_cell_areas(self, grid):
+        y_bounds = grid.y.bounds.get_value()
+        x_bounds = grid.x.bounds.get_value()
+        dy = np.abs(np.diff(np.sin(np.radians(y_bounds)), axis=1))
+        dx = np.abs(np.diff(x_bounds, axis=1))
+        return (dy * dx.reshape(1, -1)).reshape(-1)
+
+    def test_create_rectilinear_weights(self):
+        src_grid = create_gridxy_global(resolution=10., crs=Spherical(), dist=False)
+        dst_grid = create_gridxy_global(resolution=30., crs=Spherical(), wrapped=False, dist=False)
+        values = np.random.rand(1, src_grid.shape[0] * src_grid.shape[1])
+
+        # Test conservative weights cover destination cells and conserve the area-weighted integral.
+        weights = create_rectilinear_weights(src_grid, dst_grid)
+        self.assertNumpyAllClose(weights.total, np.ones(weights.n_dst))
+        actual = weights.apply(values)
+        self.assertAlmostEqual((actual.data[0] * self.get_cell_areas(dst_grid)).sum(),
+                               (values[0] * self.get_cell_areas(src_grid)).sum())
+
+        # Test bilinear weights reproduce a field varying linearly with latitude.
+        weights = create_rectilinear_weights(src_grid, dst_grid, regrid_method=NativeRegridMethod.BILINEAR)
+        y = np.repeat(src_grid.y.get_value().reshape(-1, 1), src_grid.shape[1], axis=1).reshape(1, -1)
+        actual = weights.apply(y).reshape(dst_grid.shape)
+        self.assertFalse(actual.mask.any())
+        self.assertNumpyAllClose(actual[:, 0].data, dst_grid.y.get_value())
+
+        # Test grids must be rectilinear.
+        x = Variable(name='x', value=np.ones((2, 2)), dimensions=['y', 'x'])
+        y = Variable(name='y', value=np.ones((2, 2)), dimensions=['y', 'x'])
+        with self.assertRaises(RegriddingError):
+            create_rectilinear_weights(Grid(x, y), dst_grid)
+
+    def test_get_bilinear_weights_1d(self):
+        dst_index, src_index, weights = get_bilinear_weights_1d(np.array([3., 2., 1.]),
+                                                                np.array([0., 1., 1.5, 3., 4.]))
+        self.assertEqual(dst_index.tolist(), [1, 2, 2, 3])
+        self.assertEqual(src_index.tolist(), [2, 2, 1, 0])
+        self.assertEqual(weights.tolist(), [1., 0.5, 0.5, 1.])
+
+        # Test periodic coordinates interpolate across the periodic boundary.
+        centers = np.arange(-175., 180., 10.)
+        dst_index, src_index, weights = get_bilinear_weights_1d(centers, np.array([178., 185.]), period=360.)
+        self.assertEqual(dst_index.tolist(), [0, 1, 0])
+        self.assertEqual(centers[src_index].tolist(), [175., -175., -175.])
+        self.assertNumpyAllClose(weights, np.array([0.7, 1., 0.3]))
+
+    def test_get_conservative_weights_1d(self):
+        lower = np.arange(4.)
+        dst_index, src_index, weights = get_conservative_weights_1d(lower, lower + 1, np.array([0., 2.]),
+                                                                    np.array([2., 4.]))
+        self.assertEqual(dst_index.tolist(), [0, 0, 1, 1])
+        self.assertEqual(src_index.tolist(), [0, 1, 2, 3])
+        self.assertEqual(weights.tolist(), [0.5] * 4)
+
+        # Test periodic coordinates overlap across the periodic boundary.
+        lower = np.arange(-180., 180., 10.)
+        dst_index, src_index, weights = get_conservative_weights_1d(lower, lower + 10, np.array([355.]),
+                                                                    np.array([365.]), period=360.)
+        self.assertEqual(sorted(lower[src_index].tolist()), [-10., 0.])
+        self.assertEqual(weights.tolist(), [0.5, 0.5])
+
+    def test_get_is_periodic(self):
+        self.assertTrue(get_is_periodic(np.arange(0.5, 360., 1.), 360.))
+        self.assertFalse(get_is_periodic(np.arange(0.5, 180., 1.), 360.))
+        self.assertFalse(get_is_periodic(np.array([5.]), 360.))
+
+    def test_get_native_regrid_method(self):
+        with_bounds = create_gridxy_global(resolution=30., dist=False)
+        without_bounds = create_gridxy_global(resolution=30., with_bounds=False, dist=False)
+        self.assertEqual(get_native_regrid_method(with_bounds, with_bounds, 'auto'), NativeRegridMethod.CONSERVE)
+        self.assertEqual(get_native_regrid_method(with_bounds, without_bounds, 'auto'), NativeRegridMethod.BILINEAR)
+        self.assertEqual(get_native_regrid_method(with_bounds, with_bounds, None), NativeRegridMethod.BILINEAR)
+        with self.assertRaises(RegriddingError):
+            get_native_regrid_method(with_bounds, without_bounds, NativeRegridMethod.CONSERVE)
+        with self.assertRaises(RegriddingError):
+            get_native_regrid_method(with_bounds, with_bounds, 'patch')
@@ -0,0 +1,139 @@
+import numpy as np
+from mock import mock
+
+from ocgis import constants
+from ocgis import env, Variable
+from ocgis.exc import RegriddingError
+from ocgis.regrid.sparse import SparseWeights, regrid_field_sparse, get_sparse_weights_cache
+from ocgis.test.base import TestBase, create_gridxy_global, create_exact_field
+from ocgis.variable.base import VariableCollection
+from ocgis.variable.dimension import Dimension
+
+
+class Test(TestBase):
+    def write_weight_file(self, row, col, weights, name='weights.nc'):
+        path = self.get_temporary_file_path(name)
+        vc = VariableCollection()
+        dim = Dimension('n_s', len(row))
+        for wname, value, dtype in (('row', row, np.int32), ('col', col, np.int32), ('S', weights, np.float64)):
+            vc.add_variable(Variable(name=wname, value=value, dimensions=dim, dtype=dtype))
+        vc.write(path)
+        return path
+
+    def test_get_sparse_weights_cache(self):
+        path = self.write_weight_file([1, 2], [2, 1], [1., 1.])
+        cache = get_sparse_weights_cache()
+        cache.clear()
+        actual = cache.get(path, n_dst=2, n_src=2)
+        self.assertIs(cache.get(path, n_dst=2, n_src=2), actual)
+        self.assertIsNot(cache.get(path, n_dst=3, n_src=2), actual)
+
+    def test_regrid_field_sparse(self):
+        grid = create_gridxy_global(resolution=30., dist=False)
+        source = create_exact_field(grid, 'foo', ntime=3)
+        destination = create_exact_field(create_gridxy_global(resolution=30., dist=False), 'foo', ntime=1)
+        source['foo'].get_value()[1, 2, 3] = -999.
+        source['foo'].set_mask(source['foo'].get_value() == -999.)
+
+        # Test identity weights reproduce the source values.
+        n = grid.shape[0] * grid.shape[1]
+        path = self.write_weight_file(np.arange(1, n + 1), np.arange(1, n + 1), np.ones(n))
+        for split in [True, False]:
+            actual = regrid_field_sparse(source, destination, weights_path=path, split=split)
+            actual_value = actual['foo'].get_masked_value()
+            desired_value = source['foo'].get_masked_value()
+            self.assertNumpyAll(actual_value.mask, desired_value.mask)
+            self.assertNumpyAll(actual_value.compressed(), desired_value.compressed())
+            self.assertEqual(actual.grid.shape, destination.grid.shape)
+
+        # Test weights must match the grids.
+        path = self.write_weight_file([1], [n + 1], [1.], name='bad.nc')
+        with self.assertRaises(RegriddingError):
+            regrid_field_sparse(source, destination, weights_path=path)
+
+        # Test weights are generated and written if there is no weight file.
+        path = self.get_temporary_file_path('generated.nc')
+        actual = regrid_field_sparse(source, destination, weights_path=path)
+        self.assertNumpyAll(actual['foo'].get_mask(), source['foo'].get_mask())
+        self.assertEqual(SparseWeights.from_file(path).n_src, n)
+        with self.nc_scope(path) as ds:
+            key = getattr(ds, constants.REGRID_WEIGHT_KEY_ATTR)
+
+        # Test weights are reused if the key matches.
+        with mock.patch('ocgis.regrid.native.create_rectilinear_weights') as m_create:
+            regrid_field_sparse(source, destination, weights_path=path)
+            m_create.assert_not_called()
+
+        # Test weights are regenerated if the grids change.
+        destination = create_exact_field(create_gridxy_global(resolution=45., dist=False), 'foo', ntime=1)
+        actual = regrid_field_sparse(source, destination, weights_path=path)
+        self.assertEqual(actual.grid.shape, destination.grid.shape)
+        weights = SparseWeights.from_file(path)
+        self.assertEqual(weights.n_dst, destination.grid.shape[0] * destination.grid.shape[1])
+        with self.nc_scope(path) as ds:
+            self.assertNotEqual(getattr(ds, constants.REGRID_WEIGHT_KEY_ATTR), key)
+            self.assertEqual(getattr(ds, constants.REGRID_WEIGHT_ENGINE_ATTR), constants.RegridEngine.SPARSE)
+
+        # Test weight files written by another regrid engine are not replaced if the key does not match.
+        with self.nc_scope(path, 'a') as ds:
+            ds.setncattr(constants.REGRID_WEIGHT_KEY_ATTR, key)
+            ds.setncattr(constants.REGRID_WEIGHT_ENGINE_ATTR, constants.RegridEngine.ESMF)
+        with self.assertRaises(RegriddingError):
+            regrid_field_sparse(source, destination, weights_path=path)
+        with self.nc_scope(path) as ds:
+            self.assertEqual(getattr(ds, constants.REGRID_WEIGHT_KEY_ATTR), key)
+
+
+class TestSparseWeights(TestBase):
+    def test_apply(self):
+        # Destination element 1 averages source elements 1 and 2. Destination element 3 is unmapped.
+        for use_scipy in [True, False]:
+            if use_scipy and not env.USE_SCIPY:
+                continue
+            env.USE_SCIPY = use_scipy
+            weights = SparseWeights([1, 1, 2], [1, 2, 3], [0.5, 0.5, 1.], n_dst=3, n_src=3)
+            self.assertEqual(weights.total.tolist(), [1., 1., 0.])
+
+            values = np.array([[2., 4., 6.], [2., 4., 6.]])
+            actual = weights.apply(values)
+            self.assertEqual(actual.data[0].tolist(), [3., 6., 0.])
+            self.assertEqual(actual.mask[0].tolist(), [False, False, True])
+
+            # Test masked source elements are excluded with renormalization.
+            mask = np.array([[True, False, False], [False, False, True]])
+            actual = weights.apply(values, mask=mask)
+            self.assertEqual(actual.data.tolist(), [[4., 6., 0.], [3., 0., 0.]])
+            self.assertEqual(actual.mask.tolist(), [[False, False, True], [False, True, True]])
+
+    def test_from_file(self):
+        path = self.get_temporary_file_path('weights.nc')
+        with self.nc_scope(path, 'w') as ds:
+            ds.createDimension('n_s', 2)
+            ds.createDimension('n_a', 4)
+            ds.createDimension('n_b', 3)
+            for name, value, dtype in (('row', [1, 3], 'i4'), ('col', [4, 2], 'i4'), ('S', [1., 1.], 'f8')):
+                ds.createVariable(name, dtype, ('n_s',))[:] = value
+        weights = SparseWeights.from_file(path)
+        self.assertEqual((weights.n_dst, weights.n_src), (3, 4))
+        self.assertEqual(weights.row.tolist(), [0, 2])
+
+        with self.assertRaises(RegriddingError):
+            SparseWeights.from_file(path, n_src=5)
+
+    def test_write(self):
+        path = self.get_temporary_file_path('weights.nc')
+        desired = SparseWeights([1, 3], [4, 2], [0.25, 1.], n_dst=3, n_src=4)
+        desired.write(path, key='foo')
+        with self.nc_scope(path) as ds:
+            self.assertEqual(getattr(ds, constants.REGRID_WEIGHT_KEY_ATTR), 'foo')
+        actual = SparseWeights.from_file(path)
+        self.assertEqual((actual.n_dst, actual.n_src), (3, 4))
+        self.assertEqual(actual.row.tolist(), desired.row.tolist())
+        self.assertEqual(actual.col.tolist(), desired.col.tolist())
+        self.assertEqual(actual.weights.tolist(), desired.weights.tolist())
+
+    def test_init(self):
+        with self.assertRaises(RegriddingError):
+            SparseWeights([0], [1], [1.])
+        weights = SparseWeights([2], [3], [1.])
+        self.assertEqual((weights.n_dst, weights.n_src), (2, 3))
@@ -2,6 +2,7 @@ import os
 import shutil
 
 import fiona
+import numpy as np
 from mock import mock
 from shapely.geometry.multipolygon import MultiPolygon
 from shapely.geometry.polygon import Polygon
@@ -11,7 +12,7 @@ from ocgis import env
 from ocgis.base import get_variable_names
 from ocgis.collection.field import Field
 from ocgis.environment import ogr
-from ocgis.spatial.geom_cabinet import GeomCabinet, GeomCabinetIterator, get_uid_from_properties
+from ocgis.spatial.geom_cabinet import GeomCabinet, GeomCabinetIterator, get_uid_from_properties, get_column_array
 from ocgis.test.base import TestBase
 from ocgis.test.base import attr
 from ocgis.variable.crs import WGS84
@@ -20,6 +21,18 @@ Layer = ogr.Layer
 
 
 class Test(TestBase):
+    def test_get_column_array(self):
+        actual = get_column_array([1, None, 3], ogr.OFTInteger)
+        self.assertNumpyAll(actual, np.ma.array([1, 0, 3], mask=[False, True, False]))
+
+        actual = get_column_array([1.5, 2.5], ogr.OFTReal)
+        self.assertEqual(actual.dtype, float)
+        self.assertFalse(actual.mask.any())
+
+        actual = get_column_array(['a', None], ogr.OFTString)
+        self.assertEqual(actual.dtype, object)
+        self.assertEqual(actual.tolist(), ['a', None])
+
     def test_get_uid_from_properties(self):
         properties = {env.DEFAULT_GEOM_UID: 1, 'name': 'food', 'ID': 3}
         uid, add_uid = get_uid_from_properties(properties, None)
@@ -177,6 +190,32 @@ class TestGeomCabinet(TestBase):
         finally:
             ocgis.env.reset()
 
+    def test_get_columns(self):
+        sc = GeomCabinet()
+        keywords = dict(slc=[None, 3, slice(4, 7), [2, 6, 9, 40]],
+                        load_geoms=[True, False])
+        for k in self.iter_product_keywords(keywords):
+            columns, geoms = sc.get_columns('state_boundaries', slc=k.slc, load_geoms=k.load_geoms)
+            records = list(sc.iter_geoms('state_boundaries', slc=k.slc, load_geoms=k.load_geoms))
+            self.assertEqual(list(columns.keys()), list(records[0]['properties'].keys()))
+            for name, column in columns.items():
+                self.assertEqual(column.tolist(), [r['properties'][name] for r in records])
+            if k.load_geoms:
+                for geom, record in zip(geoms, records):
+                    self.assertTrue(geom.equals(record['geom']))
+            else:
+                self.assertIsNone(geoms)
+
+        # Test selections and an added unique identifier.
+        columns, _ = sc.get_columns('state_boundaries', select_sql_where="STATE_NAME = 'New Hampshire'")
+        self.assertEqual(columns['STATE_NAME'].tolist(), ['New Hampshire'])
+        env.DEFAULT_GEOM_UID = 'ggidd'
+        columns, _ = sc.get_columns(path=self.get_shapefile_path_with_no_ugid(), load_geoms=False)
+        self.assertEqual(columns[env.DEFAULT_GEOM_UID].tolist(), list(range(11)))
+
+        with self.assertRaises(ValueError):
+            sc.get_columns('state_boundaries', select_uid=[1000])
+
     def test_get_features_object(self):
         # Test with a shapefile not having the default unique geometry identifier
         path = self.get_shapefile_path_with_no_ugid()
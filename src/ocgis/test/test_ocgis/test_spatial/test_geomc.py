@@ -1,11 +1,12 @@
 from unittest.case import SkipTest
 
 import numpy as np
+from mock import mock
 from shapely import wkt
 from shapely.geometry import Point, MultiPolygon, box
 from shapely.geometry.polygon import Polygon
 
-from ocgis import Variable, Dimension, vm, Field, GeometryVariable, DimensionMap
+from ocgis import Variable, Dimension, vm, Field, GeometryVariable, DimensionMap, env
 from ocgis.base import AbstractOcgisObject, raise_if_empty
 from ocgis.constants import WrappedState, DMK, GridAbstraction, Topology, DriverKey
 from ocgis.driver.nc_ugrid import DriverNetcdfUGRID
@@ -371,6 +372,20 @@ class TestPolygonGC(FixturePolygonGC, TestBase):
             # gv.parent.append_to_tags(TagName.DATA_VARIABLES, 'ugid')
             # gv.write_vector(out_shp)
 
+    @attr('rtree')
+    def test_get_intersection_spatial_index_cache(self):
+        """Test subsets use the cached spatial index when a spatial index cache is configured."""
+
+        subset_geom = self.fixture_subset_geom()
+        desired = self.fixture().get_intersection(subset_geom).area.tolist()
+
+        env.DIR_SPATIAL_INDEX_CACHE = self.get_temporary_file_path('cache')
+        poly = self.fixture()
+        with mock.patch.object(poly, 'get_spatial_index', wraps=poly.get_spatial_index) as m:
+            actual = poly.get_intersection(subset_geom).area.tolist()
+            m.assert_called_once_with()
+        self.assertEqual(actual, desired)
+
     @attr('mpi')
     def test_get_intersects(self):
         self.add_barrier = False
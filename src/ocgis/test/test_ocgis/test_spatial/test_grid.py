@@ -19,10 +19,10 @@ from ocgis.constants import KeywordArgument, GridAbstraction, DMK, VariableName,
 from ocgis.driver.dimension_map import DimensionMap
 from ocgis.driver.nc import DriverNetcdfCF
 from ocgis.driver.nc_ugrid import DriverNetcdfUGRID
-from ocgis.exc import EmptySubsetError, BoundsAlreadyAvailableError
+from ocgis.exc import EmptySubsetError, BoundsAlreadyAvailableError, GridDeficientError
 from ocgis.spatial.geomc import AbstractGeometryCoordinates, PointGC, PolygonGC
 from ocgis.spatial.grid import Grid, expand_grid, GridGeometryProcessor, GridUnstruct, create_grid_mask_variable, \
-    arr_intersects_bounds
+    arr_intersects_bounds, get_polygon_geometry_array, get_point_geometry_array
 from ocgis.test.base import attr, AbstractTestInterface, create_gridxy_global, TestBase
 from ocgis.test.test_ocgis.test_spatial.test_geomc import FixturePointGC, FixturePolygonGC
 from ocgis.util.helpers import make_poly, iter_array
@@ -51,6 +51,67 @@ class Test(AbstractTestInterface):
         for variable in [vx, vy]:
             self.assertEqual(grid.parent[variable.name].ndim, 2)
 
+    def test_get_point_geometry_array(self):
+        if not env.USE_VECTORIZED_GEOMETRY:
+            raise SkipTest('vectorized geometry creation not available')
+
+        keywords = {'with_2d_variables': [False, True], 'with_mask': [False, True]}
+        for k in self.iter_product_keywords(keywords):
+            grid = self.get_gridxy(with_2d_variables=k.with_2d_variables)
+            if k.with_mask:
+                mask = np.zeros(grid.shape, dtype=bool)
+                mask[1, 2] = True
+            else:
+                mask = None
+
+            actual = []
+            for use_vectorized in [True, False]:
+                env.USE_VECTORIZED_GEOMETRY = use_vectorized
+                fill = np.zeros(grid.shape, dtype=object)
+                actual.append(get_point_geometry_array(grid, fill, mask=mask))
+
+            for vectorized, looped in zip(*[a.flat for a in actual]):
+                if isinstance(looped, BaseGeometry):
+                    self.assertTrue(vectorized.equals(looped))
+                else:
+                    self.assertEqual(vectorized, looped)
+            if k.with_mask:
+                self.assertEqual(actual[0][1, 2], 0)
+            self.assertTrue(actual[0][0, 0].equals(Point(101, 40)))
+
+    def test_get_polygon_geometry_array(self):
+        if not env.USE_VECTORIZED_GEOMETRY:
+            raise SkipTest('vectorized geometry creation not available')
+
+        keywords = {'with_2d_variables': [False, True], 'with_mask': [False, True]}
+        for k in self.iter_product_keywords(keywords):
+            grid = self.get_gridxy(with_2d_variables=k.with_2d_variables, with_xy_bounds=True)
+            if k.with_mask:
+                mask = np.zeros(grid.shape, dtype=bool)
+                mask[1, 2] = True
+            else:
+                mask = None
+
+            actual = []
+            for use_vectorized in [True, False]:
+                env.USE_VECTORIZED_GEOMETRY = use_vectorized
+                fill = np.zeros(grid.shape, dtype=object)
+                actual.append(get_polygon_geometry_array(grid, fill, mask=mask))
+
+            for vectorized, looped in zip(*[a.flat for a in actual]):
+                if isinstance(looped, BaseGeometry):
+                    self.assertTrue(vectorized.equals(looped))
+                else:
+                    self.assertEqual(vectorized, looped)
+            if k.with_mask:
+                self.assertEqual(actual[0][1, 2], 0)
+            self.assertTrue(actual[0][0, 0].equals(box(100.5, 39.5, 101.5, 40.5)))
+
+        # Polygons require bounds.
+        grid = self.get_gridxy()
+        with self.assertRaises(GridDeficientError):
+            get_polygon_geometry_array(grid, np.zeros(grid.shape, dtype=object))
+
 
 class TestGridGeometryProcessor(AbstractTestInterface):
     def test(self):
@@ -79,6 +140,30 @@ class TestGridGeometryProcessor(AbstractTestInterface):
                 else:
                     self.assertIsNone(a[2])
 
+    def test_get_intersects_array(self):
+        keywords = {'with_xy_bounds': [False, True], 'keep_touches': [False, True], 'with_hint_mask': [False, True]}
+
+        for k in self.iter_product_keywords(keywords):
+            grid = self.get_gridxy(with_xy_bounds=k.with_xy_bounds)
+            subset_geometry = box(101.5, 40.5, 103.5, 42.5)
+            if k.with_hint_mask:
+                hint_mask = np.zeros(grid.shape, dtype=bool)
+                hint_mask[2, 2] = True
+            else:
+                hint_mask = None
+
+            gp = GridGeometryProcessor(grid, subset_geometry, hint_mask, keep_touches=k.keep_touches)
+            desired = np.zeros(grid.shape, dtype=bool)
+            for idx, intersects_logical, _ in gp.iter_intersects():
+                desired[idx] = intersects_logical
+
+            gp = GridGeometryProcessor(grid, subset_geometry, hint_mask, keep_touches=k.keep_touches)
+            actual = gp.get_intersects_array()
+            self.assertNumpyAll(actual, desired)
+            self.assertTrue(actual.any())
+            if k.with_hint_mask:
+                self.assertFalse(actual[2, 2])
+
 
 class TestGrid(AbstractTestInterface):
     def assertGridCorners(self, grid):
@@ -950,6 +1035,32 @@ class TestGrid(AbstractTestInterface):
             vm.__init__()
             MPI_COMM.Barrier()
 
+    def test_get_nearest_index(self):
+        from ocgis.spatial.nearest import NearestIndex
+
+        grid = self.get_gridxy()
+        ni = grid.get_nearest_index()
+        self.assertIsInstance(ni, NearestIndex)
+        self.assertFalse(ni.spherical)
+        self.assertEqual(ni.shape, grid.shape)
+        self.assertEqual(ni.query(102.2, 42.9), (3, 1))
+        actual = ni.query([101., 103.4], [40.2, 41.])
+        self.assertEqual(grid.get_value_stacked()[(slice(None),) + actual].tolist(), [[40., 41.], [101., 103.]])
+
+        # Test masked elements are excluded.
+        mask = grid.get_mask(create=True)
+        mask[3, 1] = True
+        grid.set_mask(mask)
+        self.assertEqual(grid.get_nearest_index().query(102.4, 42.9), (3, 2))
+
+        # Test the index is used by nearest selection.
+        grid = self.get_gridxy(crs=Spherical())
+        ni = grid.get_nearest_index()
+        self.assertTrue(ni.spherical)
+        sub = grid.get_nearest(Point(101.9, 41.1), nearest_index=ni)
+        self.assertEqual(sub.shape, (1, 1))
+        self.assertEqual(sub.get_value_stacked().flatten().tolist(), [41., 102.])
+
     def test_get_value_polygons(self):
         """Test ordering of vertices when creating from corners is slightly different."""
 
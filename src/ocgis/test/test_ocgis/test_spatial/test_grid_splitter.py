@@ -7,7 +7,7 @@ from shapely.geometry import box
 
 from ocgis import RequestDataset, Field
 from ocgis.base import get_variable_names
-from ocgis.constants import MPIWriteMode, GridSplitterConstants, VariableName, WrappedState
+from ocgis.constants import MPIWriteMode, GridSplitterConstants, VariableName, WrappedState, ExecutorName
 from ocgis.driver.nc_ugrid import DriverNetcdfUGRID
 from ocgis.spatial.grid import GridUnstruct, Grid
 from ocgis.spatial.grid_splitter import GridSplitter, does_contain
@@ -280,6 +280,11 @@ class TestGridSplitter(AbstractTestInterface):
 
         self.assertWeightFilesEquivalent(global_weights_filename, merged_weight_filename)
 
+        # Test merging with local workers.
+        merged_weight_filename = self.get_temporary_file_path('merged_weights_process.nc')
+        gs.create_merged_weight_file(merged_weight_filename, executor=ExecutorName.PROCESS, workers=2)
+        self.assertWeightFilesEquivalent(global_weights_filename, merged_weight_filename)
+
     @attr('esmf')
     def test_create_merged_weight_file_unstructured(self):
         self.remove_dir = False
@@ -408,3 +413,29 @@ class TestGridSplitter(AbstractTestInterface):
 
         gs = GridSplitter(grid, grid, (100,), iter_dst=iter_dst, dst_grid_resolution=5.0, check_contains=False)
         gs.write_subsets()
+
+    def test_write_subsets_executor(self):
+        src_grid = create_gridxy_global(resolution=30.0, wrapped=False, crs=Spherical(), dist=False)
+        dst_grid = create_gridxy_global(resolution=35.0, wrapped=False, crs=Spherical(), dist=False)
+
+        actual = {}
+        for executor in [ExecutorName.SERIAL, ExecutorName.PROCESS]:
+            wd = os.path.join(self.current_dir_output, executor)
+            os.mkdir(wd)
+            gs = GridSplitter(src_grid, dst_grid, (2, 3), paths={'wd': wd})
+            gs.write_subsets(executor=executor, workers=2)
+
+            index_path = gs.create_full_path_from_template('index_file')
+            with self.nc_scope(index_path) as ds:
+                bounds = {k: v[:].tolist() for k, v in ds.variables.items() if k.endswith('_bounds')}
+            src_path = gs.create_full_path_from_template('src_template', index=6)
+            extent = RequestDataset(src_path).get().grid.extent
+            actual[executor] = (bounds, extent)
+
+        desired = actual[ExecutorName.SERIAL]
+        self.assertTrue(len(desired[0]) > 0)
+        self.assertEqual(actual[ExecutorName.PROCESS], desired)
+
+        # Test only process pools are used for local workers.
+        with self.assertRaises(ValueError):
+            gs.write_subsets(executor='thread')
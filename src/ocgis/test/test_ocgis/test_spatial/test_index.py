@@ -1,15 +1,20 @@
 import itertools
+import os
+import shutil
 
 import numpy as np
+from mock import mock
 from shapely import wkt
 from shapely.geometry.geo import mapping
 from shapely.geometry.point import Point
 
-from ocgis import env
+from ocgis import env, RequestDataset, GeometryVariable
 from ocgis.test.base import TestBase, attr
+from ocgis.variable.crs import Spherical, WGS84
+from ocgis.variable.geom import get_bounds_array
 
 if env.USE_SPATIAL_INDEX:
-    from ocgis.spatial.index import SpatialIndex
+    from ocgis.spatial.index import SpatialIndex, SpatialIndexCache
 
 
 @attr('rtree')
@@ -97,3 +102,107 @@ class TestSpatialIndex(TestBase):
         si.add(ids, geoms)
         intersects_ids = list(si.iter_intersects(polygon, points))
         self.assertEqual(intersects_ids, [67])
+
+
+@attr('rtree')
+class TestSpatialIndexCache(TestBase):
+    def get_source_path(self):
+        path = self.get_temporary_file_path('source.txt')
+        with open(path, 'w') as f:
+            f.write('source')
+        return path
+
+    def get_bounds(self):
+        return np.array([Point(ii, ii).bounds for ii in range(5)])
+
+    def test_create(self):
+        cache = SpatialIndexCache(self.get_temporary_file_path('cache'), 1024 ** 3)
+        si = cache.create('foo', [self.get_source_path()], self.get_bounds())
+        self.assertEqual(set(si._index.intersection((1.5, 1.5, 3.5, 3.5))), set([2, 3]))
+        si.close()
+        self.assertAsSetEqual(os.listdir(cache.directory), ['foo.dat', 'foo.idx', 'foo.json'])
+
+        si = cache.get('foo')
+        self.assertEqual(set(si._index.intersection((1.5, 1.5, 3.5, 3.5))), set([2, 3]))
+        si.close()
+
+    def test_evict(self):
+        cache = SpatialIndexCache(self.get_temporary_file_path('cache'), 0)
+        source = self.get_source_path()
+        for key in ['foo', 'bar']:
+            cache.create(key, [source], self.get_bounds()).close()
+            # The most recently created entry is never evicted.
+            self.assertAsSetEqual(os.listdir(cache.directory), [key + ext for ext in ['.dat', '.idx', '.json']])
+
+    def test_get(self):
+        cache = SpatialIndexCache(self.get_temporary_file_path('cache'), 1024 ** 3)
+        self.assertIsNone(cache.get('foo'))
+
+        # Test a modified source invalidates the cache entry.
+        source = self.get_source_path()
+        cache.create('foo', [source], self.get_bounds()).close()
+        os.utime(source, (0, 0))
+        self.assertIsNone(cache.get('foo'))
+        self.assertEqual(os.listdir(cache.directory), [])
+
+        # Test missing index files invalidate the cache entry. Rtree would otherwise open an empty index.
+        source = self.get_source_path()
+        for ext in ['.dat', '.idx']:
+            cache.create('foo', [source], self.get_bounds()).close()
+            os.remove(os.path.join(cache.directory, 'foo' + ext))
+            self.assertIsNone(cache.get('foo'))
+            self.assertEqual(os.listdir(cache.directory), [])
+
+        # Test an index without the expected number of entries invalidates the cache entry.
+        cache.create('foo', [source], self.get_bounds()).close()
+        for ext in ['.dat', '.idx']:
+            os.remove(os.path.join(cache.directory, 'foo' + ext))
+        SpatialIndex(path=os.path.join(cache.directory, 'foo')).close()
+        self.assertIsNone(cache.get('foo'))
+        self.assertEqual(os.listdir(cache.directory), [])
+
+    def test_get_key(self):
+        gvar = GeometryVariable(name='geom', value=[Point(1, 2), Point(3, 4)], dimensions='ngeom')
+        rd = mock.Mock(uri=self.get_source_path())
+        gvar._request_dataset = rd
+        gvar.dimensions[0]._src_idx = (0, 2)
+
+        bounds = get_bounds_array(gvar.get_value())
+        desired = SpatialIndexCache.get_key([gvar], tag=gvar.name, crs=Spherical(), bounds=bounds)
+        self.assertIsNotNone(desired)
+        self.assertEqual(desired, SpatialIndexCache.get_key([gvar], tag=gvar.name, crs=Spherical(), bounds=bounds))
+
+        # Test the coordinate system and geometry bounds change the key.
+        self.assertNotEqual(desired[0], SpatialIndexCache.get_key([gvar], tag=gvar.name, crs=WGS84(),
+                                                                  bounds=bounds)[0])
+        self.assertNotEqual(desired[0], SpatialIndexCache.get_key([gvar], tag=gvar.name, crs=Spherical(),
+                                                                  bounds=bounds + 360.)[0])
+
+    def test_system_geometry_variable(self):
+        env.DIR_SPATIAL_INDEX_CACHE = self.get_temporary_file_path('cache')
+        src = os.path.split(self.path_state_boundaries)[0]
+        dst = self.get_temporary_file_path('state_boundaries')
+        shutil.copytree(src, dst)
+        path = os.path.join(dst, 'state_boundaries.shp')
+
+        keys = []
+        for _ in range(2):
+            gvar = RequestDataset(path).get().geom
+            si = gvar.get_spatial_index()
+            self.assertGreater(len(list(si.iter_rtree_intersection(gvar.get_value()[0]))), 0)
+            si.close()
+            keys.append(SpatialIndexCache.get_key([gvar], tag=gvar.name))
+        self.assertEqual(keys[0], keys[1])
+        self.assertEqual(len([fn for fn in os.listdir(env.DIR_SPATIAL_INDEX_CACHE) if fn.endswith('.json')]), 1)
+
+        # A slice creates a new cache entry.
+        gvar[0:5].get_spatial_index().close()
+        self.assertEqual(len([fn for fn in os.listdir(env.DIR_SPATIAL_INDEX_CACHE) if fn.endswith('.json')]), 2)
+
+        # Modified coordinates create a new cache entry.
+        gvar = RequestDataset(path).get().geom
+        gvar.unwrap()
+        si = gvar.get_spatial_index()
+        self.assertEqual(len(si), gvar.shape[0])
+        si.close()
+        self.assertEqual(len([fn for fn in os.listdir(env.DIR_SPATIAL_INDEX_CACHE) if fn.endswith('.json')]), 3)
@@ -0,0 +1,134 @@
+import numpy as np
+from shapely.geometry import Point, box
+
+from ocgis import env, GeometryVariable, Variable
+from ocgis.constants import DimensionName
+from ocgis.spatial.nearest import NearestIndex, get_is_spherical, get_coalesced_windows, get_station_field
+from ocgis.test.base import TestBase, create_gridxy_global, create_exact_field
+from ocgis.variable.crs import Spherical, Cartesian, CoordinateReferenceSystem
+
+
+class Test(TestBase):
+
+    def test_get_coalesced_windows(self):
+        rows = np.array([5, 0, 0, 1, 9])
+        cols = np.array([5, 0, 1, 1, 0])
+        actual = get_coalesced_windows(rows, cols, elements_per_station=2)
+        self.assertEqual(len(actual), 3)
+        self.assertEqual(actual[0][:2], (slice(0, 2), slice(0, 2)))
+        self.assertEqual(actual[0][2].tolist(), [1, 2, 3])
+        self.assertEqual(actual[1][:2], (slice(5, 6), slice(5, 6)))
+        self.assertEqual(actual[2][2].tolist(), [4])
+
+        # Test each station is in exactly one window containing its index.
+        members = np.hstack([w[2] for w in actual])
+        self.assertEqual(sorted(members.tolist()), list(range(5)))
+        for row_slice, col_slice, m in actual:
+            self.assertTrue(np.all((rows[m] >= row_slice.start) & (rows[m] < row_slice.stop)))
+            self.assertTrue(np.all((cols[m] >= col_slice.start) & (cols[m] < col_slice.stop)))
+
+        self.assertEqual(get_coalesced_windows(np.array([], dtype=int), np.array([], dtype=int)), [])
+
+    def test_get_is_spherical(self):
+        self.assertTrue(get_is_spherical(Spherical()))
+        self.assertFalse(get_is_spherical(CoordinateReferenceSystem(epsg=2136)))
+        self.assertFalse(get_is_spherical(Cartesian()))
+        self.assertFalse(get_is_spherical(None))
+
+    def test_get_station_field(self):
+        grid = create_gridxy_global(resolution=10.)
+        field = create_exact_field(grid, 'foo', ntime=3)
+        points = [Point(-174., -84.), Point(176., 86.), Point(-166., -86.)]
+        stations = GeometryVariable(name='stations', value=points, dimensions='ngeom', crs=field.crs)
+        stations.set_ugid(Variable(name='UGID', value=[10, 11, 12], dimensions='ngeom'))
+
+        actual = get_station_field(field, stations)
+        self.assertEqual(actual['foo'].shape, (3, 3))
+        self.assertEqual(actual['foo'].dimensions[1].name, DimensionName.STATION)
+        self.assertEqual(len(actual.time), 3)
+        self.assertEqual(actual.geom.ugid.get_value().tolist(), [10, 11, 12])
+        self.assertEqual(actual[grid.x.name].get_value().tolist(), [-175., 175., -165.])
+        self.assertEqual(actual[grid.y.name].get_value().tolist(), [-85., 85., -85.])
+
+        source = field['foo'].get_value()
+        desired = source[:, [0, 17, 0], [0, 35, 1]]
+        self.assertNumpyAll(actual['foo'].get_value(), desired)
+
+
+class TestNearestIndex(TestBase):
+
+    def get_use_scipy(self):
+        ret = [False]
+        if env.USE_SCIPY:
+            ret.append(True)
+        return ret
+
+    def test_init(self):
+        x, y = np.meshgrid([1., 2., 3.], [10., 20.])
+        mask = np.zeros(x.shape, dtype=bool)
+        mask[0, 1] = True
+        ni = NearestIndex(x, y, mask=mask)
+        self.assertEqual(ni.shape, (2, 3))
+        self.assertEqual(ni.indices.tolist(), [0, 2, 3, 4, 5])
+        self.assertEqual(ni.points.shape, (5, 2))
+
+        ni = NearestIndex(x, y, spherical=True)
+        self.assertEqual(ni.points.shape, (6, 3))
+        self.assertNumpyAllClose(np.linalg.norm(ni.points, axis=1), np.ones(6))
+
+        with self.assertRaises(ValueError):
+            NearestIndex(x, y, mask=np.ones(x.shape, dtype=bool))
+        with self.assertRaises(ValueError):
+            NearestIndex(x, y[0])
+
+    def test_query(self):
+        x, y = np.meshgrid([1., 2., 3.], [10., 20.])
+        mask = np.zeros(x.shape, dtype=bool)
+        mask[0, 1] = True
+
+        for use_scipy in self.get_use_scipy():
+            env.USE_SCIPY = use_scipy
+            ni = NearestIndex(x, y, mask=mask)
+
+            actual = ni.query(2.9, 19.)
+            self.assertEqual(actual, (1, 2))
+            self.assertIsInstance(actual[0], int)
+
+            # Test masked elements are not returned.
+            self.assertEqual(ni.query(2.1, 10.), (0, 2))
+
+            # Test batch queries.
+            ni.brute_force_block_size = 7
+            actual = ni.query([1.1, 2.1, 2.9], [11., 19., 12.])
+            self.assertEqual(actual[0].tolist(), [0, 1, 0])
+            self.assertEqual(actual[1].tolist(), [0, 1, 2])
+            target_x = np.array([[1.1, 2.1], [2.9, 1.]])
+            target_y = np.array([[11., 19.], [12., 20.]])
+            actual = ni.query(target_x, target_y)
+            self.assertEqual(actual[0].shape, (2, 2))
+            self.assertEqual(x[actual].tolist(), [[1., 2.], [3., 1.]])
+
+    def test_query_geometries(self):
+        x, y = np.meshgrid([1., 2., 3.], [10., 20.])
+        ni = NearestIndex(x, y)
+        self.assertEqual(ni.query_geometries(box(1.5, 18., 2.5, 21.)), (1, 1))
+        actual = ni.query_geometries([Point(1, 10), Point(3, 20)])
+        self.assertEqual(actual[0].tolist(), [0, 1])
+        self.assertEqual(actual[1].tolist(), [0, 2])
+
+    def test_query_spherical(self):
+        """Test great-circle distances are used for spherical indexes."""
+
+        x, y = np.meshgrid(np.arange(0., 360., 10.), np.arange(-80., 90., 10.))
+
+        for use_scipy in self.get_use_scipy():
+            env.USE_SCIPY = use_scipy
+            ni = NearestIndex(x, y, spherical=True)
+            # Test longitudes are periodic.
+            self.assertEqual(ni.query(-2., 0.), (8, 0))
+            self.assertEqual(ni.query(358., 0.), (8, 0))
+
+            # Test planar indexes do not wrap.
+            ni = NearestIndex(x, y)
+            self.assertEqual(ni.query(-2., 0.), (8, 0))
+            self.assertEqual(ni.query(358., 0.), (8, 35))
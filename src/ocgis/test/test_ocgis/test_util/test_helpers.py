@@ -700,8 +700,58 @@ class Test2(TestBase):
         lhs = [i[0] for i in iter_array(arr)]
         self.assertEqual(lhs, [0, 2])
 
+    def test_iter_ordered_results(self):
+
+        class _Result_(object):
+            def __init__(self, value):
+                self.value = value
+
+            def get(self):
+                return self.value
+
+        class _RecordingPool_(object):
+            """Records submitted elements and computes results immediately."""
+
+            def __init__(self):
+                self.submitted = []
+
+            def apply_async(self, func, args):
+                self.submitted.append(args[0])
+                return _Result_(func(*args))
+
+        pool = _RecordingPool_()
+        itr = iter_ordered_results(pool, lambda x: x * 2, range(10), 3)
+        first = next(itr)
+        # Only the maximum number of pending results are submitted before the first result is consumed.
+        self.assertEqual(pool.submitted, [0, 1, 2])
+        actual = [first] + list(itr)
+        self.assertEqual(actual, [ii * 2 for ii in range(10)])
+        self.assertEqual(pool.submitted, list(range(10)))
+
+    def test_initialize_pool_worker(self):
+        self.addCleanup(POOL_WORKER_STATE.clear)
+        initialize_pool_worker({'a': 1, 'b': 2})
+        self.assertEqual(POOL_WORKER_STATE, {'a': 1, 'b': 2})
+        # Test state from a previous initialization is removed.
+        initialize_pool_worker({'c': 3})
+        self.assertEqual(POOL_WORKER_STATE, {'c': 3})
+
+    def test_pool_scope(self):
+        with pool_scope(2, {'a': 1}) as pool:
+            actual = list(iter_ordered_results(pool, _get_pool_worker_state_value_, ['a', 'a', 'a'], 2))
+        self.assertEqual(actual, [1, 1, 1])
+
+        # Test worker processes are terminated if an exception occurs.
+        with self.assertRaises(KeyError):
+            with pool_scope(2, {'a': 1}) as pool:
+                pool.apply_async(_get_pool_worker_state_value_, ('b',)).get()
+
     def test_format_bool(self):
         mmap = {0: False, 1: True, 't': True, 'True': True, 'f': False, 'False': False}
         for key, value in mmap.items():
             ret = format_bool(key)
             self.assertEqual(ret, value)
+
+
+def _get_pool_worker_state_value_(key):
+    return POOL_WORKER_STATE[key]
@@ -3,10 +3,10 @@ import time
 import numpy as np
 
 import ocgis
-from ocgis import RequestDataset
+from ocgis import RequestDataset, env
 from ocgis import Variable
 from ocgis.calc import tile
-from ocgis.test.base import TestBase, attr
+from ocgis.test.base import TestBase, attr, create_gridxy_global, create_exact_field
 from ocgis.util.large_array import compute, set_variable_spatial_mask
 
 
@@ -197,6 +197,70 @@ class Test(TestBase):
         var.set_mask(vmask)
         self.assertFalse(var.get_mask().any())
 
+    def test_tile_get_chunk_schema(self):
+        grid = create_gridxy_global(resolution=30.0, dist=False)
+        field = create_exact_field(grid, 'foo', ntime=4)
+
+        schema = tile.get_chunk_schema(field, {'spatial': 5})
+        self.assertEqual(len(schema), 4)
+        self.assertEqual(schema[0], {'y': (0, 5), 'x': (0, 5)})
+        self.assertEqual(schema[-1], {'y': (5, 6), 'x': (5, 12)})
+
+        schema = tile.get_chunk_schema(field, {'spatial': [6, 4], 'time': 3})
+        self.assertEqual(len(schema), 6)
+        self.assertEqual(schema[0], {'time': (0, 3), 'y': (0, 6), 'x': (0, 4)})
+        self.assertEqual(schema[-1], {'time': (3, 4), 'y': (0, 6), 'x': (8, 12)})
+
+        # Test a memory budget limits the chunk size.
+        schema = tile.get_chunk_schema(field, {'memory': 4 * 4 * 9})
+        self.assertEqual(schema[0], {'y': (0, 3), 'x': (0, 3)})
+
+        with self.assertRaises(ValueError):
+            tile.get_chunk_schema(field, {'spatial': [1, 2, 3]})
+
+    def test_tile_get_chunk_schema_aligned(self):
+        """Test chunks are aligned to source chunks."""
+
+        path = self.get_temporary_file_path('foo.nc')
+        with self.nc_scope(path, 'w') as ds:
+            ds.createDimension('time', 4)
+            ds.createDimension('x', 12)
+            tvar = ds.createVariable('time', np.float64, dimensions=('time',))
+            tvar.units = 'days since 2000-01-01'
+            tvar.axis = 'T'
+            tvar[:] = np.arange(4)
+            foo = ds.createVariable('foo', np.float32, dimensions=('time', 'x'), chunksizes=(2, 12))
+            foo[:] = 1.
+        field = RequestDataset(path, variable='foo').get()
+
+        self.assertEqual(tile.get_source_chunk_sizes(field), {'time': 2, 'x': 12})
+        schema = tile.get_chunk_schema(field, {'time': 3})
+        self.assertEqual([c['time'] for c in schema], [(0, 2), (2, 4)])
+
+        # Test the first chunk ends on a source chunk boundary.
+        sub = field[{'time': slice(1, 4)}]
+        schema = tile.get_chunk_schema(sub, {'time': 3})
+        self.assertEqual([c['time'] for c in schema], [(0, 1), (1, 3)])
+
+        env.USE_CHUNK_ALIGNMENT = False
+        schema = tile.get_chunk_schema(field, {'time': 3})
+        self.assertEqual([c['time'] for c in schema], [(0, 3), (3, 4)])
+
+    def test_tile_get_field_chunk(self):
+        grid = create_gridxy_global(resolution=30.0, dist=False)
+        field = create_exact_field(grid, 'foo', ntime=2)
+
+        chunks = [tile.get_field_chunk(field, c) for c in tile.get_chunk_schema(field, {'spatial': 4})]
+        actual = chunks[-1]
+        self.assertEqual(actual['foo'].shape, (2, 2, 4))
+        self.assertEqual(actual.dimensions['x'].bounds_local, (8, 12))
+        self.assertEqual(actual.dimensions['x'].bounds_global, (0, 12))
+        self.assertEqual(actual.dimensions['y'].bounds_local, (4, 6))
+        self.assertNumpyAll(actual['foo'].get_value(), field['foo'].get_value()[:, 4:6, 8:12])
+
+        total = sum([c['foo'].get_value().size for c in chunks])
+        self.assertEqual(total, field['foo'].get_value().size)
+
     def test_tile_get_tile_schema(self):
         schema = tile.get_tile_schema(5, 5, 2)
         self.assertEqual(len(schema), 9)
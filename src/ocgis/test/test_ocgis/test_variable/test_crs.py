@@ -3,6 +3,7 @@ import sys
 from copy import deepcopy, copy
 from unittest import SkipTest
 
+import mock
 import netCDF4 as nc
 import numpy as np
 from shapely.geometry import Point, MultiPoint
@@ -21,7 +22,8 @@ from ocgis.util.helpers import make_poly
 from ocgis.util.itester import itr_products_keywords
 from ocgis.variable.base import Variable
 from ocgis.variable.crs import CoordinateReferenceSystem, CFAlbersEqualArea, CFLambertConformal, \
-    CFRotatedPole, WGS84, Spherical, CFSpherical, Tripole, Cartesian, AbstractProj4CRS, create_crs
+    CFRotatedPole, WGS84, Spherical, CFSpherical, Tripole, Cartesian, AbstractProj4CRS, create_crs, \
+    get_coordinate_transformation, transform_coordinates, SpatialReferenceCache, get_spatial_reference_cache
 from ocgis.variable.geom import GeometryVariable
 from ocgis.vmachine.mpi import OcgDist, MPI_RANK, variable_scatter
 
@@ -36,6 +38,100 @@ class Test(TestBase):
         actual = create_crs(value)
         self.assertIsInstance(actual, WGS84)
 
+    def test_get_coordinate_transformation(self):
+        from_crs = WGS84()
+        to_crs = CoordinateReferenceSystem(epsg=2136)
+        actual = get_coordinate_transformation(from_crs, to_crs)
+        self.assertEqual(id(actual), id(get_coordinate_transformation(WGS84(), deepcopy(to_crs))))
+        self.assertNotEqual(id(actual), id(get_coordinate_transformation(to_crs, from_crs)))
+
+    def test_get_spatial_reference_cache(self):
+        actual = get_spatial_reference_cache()
+        self.assertIsInstance(actual, SpatialReferenceCache)
+        self.assertEqual(id(actual), id(get_spatial_reference_cache()))
+        self.assertEqual(actual.max_entries, constants.SPATIAL_REFERENCE_CACHE_SIZE)
+
+    def test_transform_coordinates(self):
+        from_crs = WGS84()
+        to_crs = CoordinateReferenceSystem(epsg=2136)
+        coordinates = np.array([[-100., 40.], [-90., 30.]])
+        actual = transform_coordinates(coordinates, from_crs, to_crs)
+        self.assertEqual(actual.shape, coordinates.shape)
+        desired = transform_coordinates(actual, to_crs, from_crs)
+        self.assertNumpyAllClose(desired, coordinates)
+
+        # Test three-dimensional and empty coordinates.
+        coordinates = np.array([[-100., 40., 10.]])
+        actual = transform_coordinates(coordinates, from_crs, to_crs)
+        self.assertEqual(actual.shape, (1, 3))
+        self.assertEqual(transform_coordinates(np.zeros((0, 2)), from_crs, to_crs).shape, (0, 2))
+
+        # Test coordinates are transformed in blocks.
+        coordinates = np.array([[-100., 40.], [-90., 30.], [-80., 35.]])
+        desired = transform_coordinates(coordinates, from_crs, to_crs)
+        with mock.patch.object(constants, 'COORDINATE_TRANSFORM_BLOCK_SIZE', 2):
+            actual = transform_coordinates(coordinates, from_crs, to_crs)
+        self.assertNumpyAll(actual, desired)
+
+
+class TestSpatialReferenceCache(TestBase):
+
+    def test_get_equal(self):
+        cache = SpatialReferenceCache(2)
+        self.assertTrue(cache.get_equal(('a', 'b'), lambda: True))
+        self.assertTrue(cache.get_equal(('a', 'b'), lambda: False))
+        self.assertFalse(cache.get_equal(('a', 'c'), lambda: False))
+
+        # Test least recently used entries are evicted.
+        cache.get_equal(('a', 'b'), lambda: False)
+        cache.get_equal(('a', 'd'), lambda: False)
+        self.assertTrue(cache.get_equal(('a', 'b'), lambda: False))
+        self.assertTrue(cache.get_equal(('a', 'c'), lambda: True))
+
+        cache.clear()
+        self.assertFalse(cache.get_equal(('a', 'b'), lambda: False))
+
+    def test_get_spatial_reference(self):
+        cache = SpatialReferenceCache(10)
+        proj4 = WGS84().proj4
+        actual = cache.get_spatial_reference(proj4)
+        self.assertEqual(id(actual), id(cache.get_spatial_reference(proj4)))
+        self.assertTrue(actual.IsGeographic())
+        self.assertEqual(cache.get_spatial_reference(2136).IsSame(CoordinateReferenceSystem(epsg=2136).sr), 1)
+
+    def test_get_transformation(self):
+        from threading import Thread
+
+        cache = SpatialReferenceCache(10)
+        proj4 = [WGS84().proj4, CoordinateReferenceSystem(epsg=2136).proj4]
+        actual = cache.get_transformation(*proj4)
+        self.assertEqual(id(actual), id(cache.get_transformation(*proj4)))
+
+        # Test transformations are not shared between threads.
+        other = []
+        thread = Thread(target=lambda: other.append(cache.get_transformation(*proj4)))
+        thread.start()
+        thread.join()
+        self.assertNotEqual(id(actual), id(other[0]))
+
+        cache.clear()
+        self.assertNotEqual(id(actual), id(cache.get_transformation(*proj4)))
+
+    def test_system_coordinate_reference_system(self):
+        """Test coordinate systems use the process-wide cache."""
+
+        crs1 = CoordinateReferenceSystem(epsg=2136)
+        crs2 = CoordinateReferenceSystem(epsg=2136)
+        self.assertEqual(id(crs1.sr), id(crs2.sr))
+
+        get_spatial_reference_cache().clear()
+        self.assertEqual(crs1, crs2)
+        self.assertNotEqual(crs1, WGS84())
+        with mock.patch.object(CoordinateReferenceSystem, '_get_is_equal_') as m:
+            self.assertEqual(crs1, crs2)
+            self.assertNotEqual(crs1, WGS84())
+            m.assert_not_called()
+
 
 class TestCoordinateReferenceSystem(TestBase):
     def test_init(self):
@@ -23,7 +23,7 @@ from ocgis.variable.base import Variable, VariableCollection
 from ocgis.variable.crs import WGS84, Spherical, Cartesian
 from ocgis.variable.dimension import Dimension
 from ocgis.variable.geom import GeometryVariable, GeometryProcessor, get_split_polygon_by_node_threshold, \
-    GeometrySplitter
+    GeometrySplitter, get_intersects_array
 from ocgis.vmachine.mpi import OcgDist, MPI_RANK, variable_scatter, MPI_SIZE, variable_gather, MPI_COMM
 
 
@@ -85,6 +85,28 @@ class TestGeometryProcessor(AbstractTestInterface):
         with self.assertRaises(ValueError):
             list(gp.iter_intersects())
 
+    def test_get_intersects_array(self):
+        desired = {False: [False, False, False, True, False],
+                   True: [False, True, False, True, False]}
+
+        x = [1, 2, 3, 4, 5]
+        y = [6, 7, 8, 9, 10]
+        geometries = np.empty(len(x), dtype=object)
+        for idx in range(len(x)):
+            if idx != 2:
+                geometries[idx] = Point(x[idx], y[idx])
+        subset_geometry = box(2.0, 7.0, 4.5, 9.5)
+
+        use_vectorized = [False]
+        if env.USE_VECTORIZED_GEOMETRY:
+            use_vectorized.append(True)
+
+        for uv, keep_touches in itertools.product(use_vectorized, [False, True]):
+            env.USE_VECTORIZED_GEOMETRY = uv
+            actual = get_intersects_array(geometries, subset_geometry, keep_touches=keep_touches)
+            self.assertEqual(actual.dtype, bool)
+            self.assertEqual(actual.tolist(), desired[keep_touches])
+
 
 class FixturePolygonWithHole(object):
     @property
@@ -612,6 +634,43 @@ class TestGeometryVariable(AbstractTestInterface, FixturePolygonWithHole):
             self.assertEqual(slc, (0,))
             self.assertEqual(res.shape, (1,))
 
+        # Test vectorized and iterative distances select the same element. Ties select the last element.
+        value = [box(0, 0, 1, 1), box(1, 0, 2, 1), box(3, 0, 4, 1), box(1, 0, 2, 1)]
+        pa = GeometryVariable(name='geoms', value=value, mask=[False, False, False, True], dimensions='ngeom')
+        use_vectorized = [False]
+        if env.USE_VECTORIZED_GEOMETRY:
+            use_vectorized.append(True)
+        for uv in use_vectorized:
+            env.USE_VECTORIZED_GEOMETRY = uv
+            _, slc = pa.get_nearest(Point(1, 0.5), return_indices=True)
+            self.assertEqual(slc, (1,))
+
+        # Test using a nearest neighbor index.
+        pa = self.get_geometryvariable()
+        ni = pa.get_nearest_index()
+        res, slc = pa.get_nearest(Point(2.9, 4.1), return_indices=True, nearest_index=ni)
+        self.assertEqual(slc, (1,))
+        self.assertEqual(res.get_value()[0], Point(3, 4))
+
+    def test_get_nearest_index(self):
+        value = [box(0, 0, 1, 1), None, Point(5, 6), box(10, 10, 12, 12)]
+        pa = GeometryVariable(name='geoms', value=value, mask=[False, False, False, True], dimensions='ngeom')
+
+        use_vectorized = [False]
+        if env.USE_VECTORIZED_GEOMETRY:
+            use_vectorized.append(True)
+        for uv in use_vectorized:
+            env.USE_VECTORIZED_GEOMETRY = uv
+            ni = pa.get_nearest_index()
+            self.assertFalse(ni.spherical)
+            self.assertEqual(ni.indices.tolist(), [0, 2])
+            self.assertEqual(ni.points.tolist(), [[0.5, 0.5], [5., 6.]])
+            self.assertEqual(ni.query(11., 11.), (2,))
+
+        pa.crs = WGS84()
+        self.assertTrue(pa.get_nearest_index().spherical)
+        self.assertFalse(pa.get_nearest_index(spherical=False).spherical)
+
     @attr('rtree')
     def test_get_spatial_index(self):
         from ocgis.spatial.index import SpatialIndex
@@ -823,6 +882,35 @@ class TestGeometryVariable(AbstractTestInterface, FixturePolygonWithHole):
         np.testing.assert_almost_equal(pa.get_value()[0], v0, decimal=3)
         np.testing.assert_almost_equal(pa.get_value()[1], v1, decimal=3)
 
+    def test_update_crs_vectorized(self):
+        """Test bulk coordinate transformations match per-geometry transformations."""
+
+        value = np.empty(4, dtype=object)
+        value[0] = self.fixture_polygon_with_hole
+        value[1] = MultiPolygon([box(-100, 40, -95, 45), box(-90, 30, -85, 35)])
+        value[2] = Point(-100, 40, 10)
+        value[3] = Point(-90, 30)
+        mask = [False, True, False, False]
+        to_crs = CoordinateReferenceSystem(epsg=2136)
+
+        use_vectorized = [False]
+        if env.USE_VECTORIZED_GEOMETRY:
+            use_vectorized.append(True)
+
+        actual = {}
+        for uv in use_vectorized:
+            env.USE_VECTORIZED_GEOMETRY = uv
+            gvar = GeometryVariable(name='geoms', value=deepcopy(value), mask=mask, dimensions='geoms', crs=WGS84())
+            gvar.update_crs(to_crs)
+            self.assertEqual(gvar.crs, to_crs)
+            self.assertEqual(gvar.get_mask().tolist(), mask)
+            actual[uv] = gvar.get_value()
+
+        self.assertTrue(actual[False][2].has_z)
+        for uv in use_vectorized[1:]:
+            for idx in range(value.shape[0]):
+                self.assertTrue(actual[uv][idx].equals_exact(actual[False][idx], 1e-6))
+
     def test_update_crs_to_cartesian(self):
         """Test a spherical to cartesian CRS update."""
 
@@ -1,3 +1,4 @@
+import itertools
 from collections import OrderedDict
 from unittest import SkipTest
 
@@ -114,6 +115,42 @@ class TestIterator(TestBase):
         self.assertEqual(as_list[2][var.name], str(var.get_value()[2]))
         self.assertEqual(as_list[0]['modified'], 1000)
 
+    def test_iter_blocks(self):
+        def _formatter_(name, value, mask):
+            return [(name, None if value is None else str(value)), ('MODIFIED', None if value is None else value * 10)]
+
+        def _get_records_(itr, block_size=None):
+            if block_size is None:
+                return [list(r.items()) for r in itr]
+            ret = []
+            for block in itr.iter_blocks(block_size):
+                keys = list(block.keys())
+                for idx in range(len(block[keys[0]])):
+                    ret.append([(k, block[k][idx]) for k in keys])
+            return ret
+
+        def _get_iterator_(melted, allow_masked):
+            value = np.arange(24, dtype=np.float32).reshape(2, 3, 4)
+            mask = np.zeros(value.shape, dtype=bool)
+            mask[0, 1, 2] = True
+            mask[1, :, 3] = True
+            lead = Variable(name='lead', value=value, mask=mask, dimensions=['time', 'y', 'x'],
+                            repeat_record=[('DID', 1)])
+            other = Variable(name='other', value=np.arange(24).reshape(2, 3, 4), dimensions=['time', 'y', 'x'],
+                             repeat_record=[('OTHER_REPEAT', 'a')])
+            time = Variable(name='time', value=[10, 20], mask=[False, True], dimensions='time')
+            time_itr = Iterator(time, formatter=_formatter_, allow_masked=allow_masked, primary_mask=lead)
+            x = Variable(name='x', value=[1., 2., 3., 4.], dimensions='x')
+            melted = [lead, other] if melted else None
+            return Iterator(lead, followers=[other, time_itr, x], melted=melted, repeaters=[('UGID', 5)],
+                            allow_masked=allow_masked)
+
+        for melted, allow_masked, block_size in itertools.product([False, True], [False, True], [1, 5, 24, 100]):
+            desired = _get_records_(_get_iterator_(melted, allow_masked))
+            actual = _get_records_(_get_iterator_(melted, allow_masked), block_size=block_size)
+            self.assertEqual(actual, desired)
+            self.assertEqual([[type(v) for _, v in r] for r in actual], [[type(v) for _, v in r] for r in desired])
+
     def test_iter_melted(self):
         var = self.create_base_variable()
         with self.assertRaises(ValueError):
@@ -18,7 +18,7 @@ from ocgis.util.units import get_units_object, get_are_units_equal, get_are_unit
 from ocgis.variable.temporal import get_datetime_conversion_state, get_datetime_from_months_time_units, \
     get_datetime_from_template_time_units, get_difference_in_months, get_is_interannual, get_num_from_months_time_units, \
     get_origin_datetime_from_months_units, get_sorted_seasons, TemporalVariable, iter_boolean_groups_from_time_regions, \
-    TemporalGroupVariable, get_time_regions, get_datetime_or_netcdftime
+    TemporalGroupVariable, get_time_regions, get_datetime_or_netcdftime, get_datetime_parts
 from ocgis.variable.temporal import get_datetime_or_netcdftime as dt
 
 
@@ -75,6 +75,15 @@ class Test(AbstractTestTemporal):
         self.assertEqual(ret.shape, self.value_template_units_no_decimal.shape)
         self.assertEqual(ret[2], datetime.datetime(2000, 1, 3))
 
+    def test_get_datetime_parts(self):
+        desired = [[1899, 12, 31, 23, 59, 58], [2001, 2, 28, 1, 2, 3]]
+        value = np.array([datetime.datetime(*d) for d in desired], dtype=object)
+        self.assertEqual(get_datetime_parts(value).tolist(), desired)
+
+        # Test with datetime objects that may not be converted to NumPy datetimes.
+        value = np.array([netcdftime.datetime(*d) for d in desired], dtype=object)
+        self.assertEqual(get_datetime_parts(value).tolist(), desired)
+
     def test_get_difference_in_months(self):
         distance = get_difference_in_months(datetime.datetime(1978, 12, 1), datetime.datetime(1979, 3, 1))
         self.assertEqual(distance, 3)
@@ -513,6 +522,20 @@ class TestTemporalVariable(AbstractTestTemporal):
                 desired = [[693232.5, 694326.5]]
             self.assertEqual(actual, desired)
 
+    def test_get_grouping_other_iterative(self):
+        tdim = self.get_temporalvariable()
+        groupings = [['month'], ['year'], ['month', 'year'], ['day', 'month'],
+                     [[12, 1, 2], [3, 4, 5], [6, 7, 8], [9, 10, 11], 'year'], [[12, 1, 2], [6, 7, 8]]]
+        for grouping in groupings:
+            actual = tdim._get_grouping_other_(grouping)
+            desired = tdim._get_grouping_other_iterative_(grouping)
+            self.assertNumpyAll(actual[0], desired[0])
+            self.assertEqual(actual[1].tolist(), desired[1].tolist())
+            self.assertNumpyAll(actual[2], desired[2])
+            self.assertEqual(len(actual[3]), len(desired[3]))
+            for a, d in zip(actual[3], desired[3]):
+                self.assertNumpyAll(a, d)
+
     def test_get_grouping_other(self):
         tdim = self.get_temporalvariable()
         grouping = [[12, 1, 2], [3, 4, 5], [6, 7, 8], [9, 10, 11], 'year']
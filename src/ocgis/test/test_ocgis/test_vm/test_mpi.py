@@ -145,6 +145,14 @@ class Test(AbstractTestInterface):
         res = get_rank_bounds(6, size=5, rank=6)
         self.assertIsNone(res)
 
+    def test_get_rank_bounds_chunk_size(self):
+        actual = [get_rank_bounds(10, 3, rank, chunk_size=3) for rank in range(3)]
+        self.assertEqual(actual, [(0, 6), (6, 9), (9, 10)])
+
+        # Test chunk sizes are ignored with fewer chunks than ranks.
+        actual = [get_rank_bounds(10, 3, rank, chunk_size=5) for rank in range(3)]
+        self.assertEqual(actual, [get_rank_bounds(10, 3, rank) for rank in range(3)])
+
     def test_get_global_to_local_slice(self):
         start_stop = (1, 4)
         bounds_local = (0, 3)
@@ -627,3 +635,12 @@ class TestOcgDist(AbstractTestInterface):
 
         desired = [(0, 3), (3, 5), (5, 7), (7, 9), (9, 11)]
         self.assertEqual(actual, desired)
+
+    def test_update_dimension_bounds_with_chunk_sizes(self):
+        dist = OcgDist(size=3)
+        dist.create_dimension('dim', 20, dist=True, src_idx='auto')
+        dist.set_chunk_sizes({'dim': 4})
+        dist.update_dimension_bounds()
+
+        actual = [dist.get_dimension('dim', rank=rank).bounds_local for rank in range(3)]
+        self.assertEqual(actual, [(0, 8), (8, 16), (16, 20)])
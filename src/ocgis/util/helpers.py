@@ -3,7 +3,8 @@ import itertools
 import os
 import sys
 import tempfile
-from collections import OrderedDict
+from collections import OrderedDict, deque
+from contextlib import contextmanager
 from copy import deepcopy
 from pprint import pprint
 from tempfile import mkdtemp
@@ -795,6 +796,48 @@ def get_tuple(value):
     return ret
 
 
+#: Stores objects shared by tasks executing in the current local pool worker process. See
+#: :func:`~ocgis.util.helpers.initialize_pool_worker`.
+POOL_WORKER_STATE = {}
+
+
+def initialize_pool_worker(state):
+    """
+    Initializer for local process pools. Objects needed by every task are sent to a worker process once when it starts
+    as opposed to once per task.
+
+    :param dict state: Objects to store in :attr:`~ocgis.util.helpers.POOL_WORKER_STATE` for the worker process.
+    """
+
+    POOL_WORKER_STATE.clear()
+    POOL_WORKER_STATE.update(state)
+
+
+@contextmanager
+def pool_scope(workers, state):
+    """
+    Provide a local process pool with ``state`` sent to each worker process when it starts (see
+    :func:`~ocgis.util.helpers.initialize_pool_worker`). Worker processes are terminated if an exception occurs.
+
+    :param int workers: The number of worker processes.
+    :param dict state: Objects to store in :attr:`~ocgis.util.helpers.POOL_WORKER_STATE` for each worker process.
+    :rtype: :class:`multiprocessing.pool.Pool`
+    """
+
+    from multiprocessing import Pool
+
+    pool = Pool(processes=workers, initializer=initialize_pool_worker, initargs=(state,))
+    try:
+        yield pool
+    except BaseException:
+        pool.terminate()
+        raise
+    else:
+        pool.close()
+    finally:
+        pool.join()
+
+
 def is_auto_dtype(dtype):
     try:
         is_auto = dtype == 'auto'
@@ -898,6 +941,27 @@ def iter_array(arr, use_mask=True, return_value=False, mask=None):
         yield ret
 
 
+def iter_ordered_results(pool, func, iterable, max_pending):
+    """
+    Submit ``func`` for each element of ``iterable`` to ``pool`` yielding results in submission order. At most
+    ``max_pending`` results are in flight at any time.
+
+    :param pool: The pool to submit to. See :func:`~ocgis.util.helpers.pool_scope`.
+    :type pool: :class:`multiprocessing.pool.Pool`
+    :param func: The function to call with each element.
+    :param iterable: The elements to submit.
+    :param int max_pending: The maximum number of submitted elements without a consumed result.
+    """
+
+    pending = deque()
+    for element in iterable:
+        pending.append(pool.apply_async(func, (element,)))
+        if len(pending) >= max_pending:
+            yield pending.popleft().get()
+    while len(pending) > 0:
+        yield pending.popleft().get()
+
+
 def locate(pattern, root=os.curdir, followlinks=True):
     """
     Locate all files matching supplied filename pattern in and below supplied root directory.
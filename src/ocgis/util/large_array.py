@@ -20,6 +20,9 @@ def compute(ops, tile_dimension, verbose=False, use_optimizations=True):
     empty destination NetCDF file that is then filled by executing the operations on chunks of the requested
     target dataset(s) and filling the destination NetCDF file.
 
+    .. note:: Prefer the ``chunking`` parameter of :class:`~ocgis.OcgOperations` which supports all file-based output
+     formats and does not require a template file.
+
     :param ops: The target operations to tile. There must be a calculation associated with
      the operations.
     :type ops: :class:`ocgis.OcgOperations`
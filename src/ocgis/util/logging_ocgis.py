@@ -32,6 +32,8 @@ class ProgressOcgOperations(object):
         self.n_geometries = n_geometries
         self.n_calculations = n_calculations
         self.n_completed_operations = 0
+        #: The number of chunks an operation is divided into. Each chunk completes a fraction of an operation.
+        self.n_chunks = 1
 
     def __call__(self, message=None):
         if self.callback is not None:
@@ -50,7 +52,7 @@ class ProgressOcgOperations(object):
         return 100 * (self.n_completed_operations / float(self.n_operations))
 
     def mark(self):
-        self.n_completed_operations += 1
+        self.n_completed_operations += 1.0 / self.n_chunks
 
 
 class OcgisLogging(object):
@@ -1954,6 +1954,9 @@ class VariableCollection(AbstractCollection, AbstractContainer, Attributes):
 
     def iter(self, **kwargs):
         """
+        :keyword int block_size: ``(=None)`` If provided, yield blocks of records as ordered dictionaries mapping record
+         keys to column value lists. Each block contains records for up to ``block_size`` elements of the iteration
+         variable. See :meth:`~ocgis.variable.iterator.Iterator.iter_blocks`.
         :return: Yield record dictionaries for variables in the collection.
         :rtype: dict
         """
@@ -1975,6 +1978,7 @@ class VariableCollection(AbstractCollection, AbstractContainer, Attributes):
         geom = kwargs.pop(KeywordArgument.GEOM, None)
         variable = kwargs.pop(KeywordArgument.VARIABLE, None)
         followers = kwargs.pop(KeywordArgument.FOLLOWERS, None)
+        block_size = kwargs.pop(KeywordArgument.BLOCK_SIZE, None)
 
         if geom is None:
             geom_name = None
@@ -2008,6 +2012,10 @@ class VariableCollection(AbstractCollection, AbstractContainer, Attributes):
         else:
             header_map_keys = list(header_map.keys())
 
+        # Blocks are dictionaries of columns and are renamed the same as individual records.
+        if block_size is not None:
+            itr = itr.iter_blocks(block_size)
+
         for yld in itr:
             if geom_name is None:
                 geom_value = None
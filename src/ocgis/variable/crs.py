@@ -1,6 +1,8 @@
 import abc
 import itertools
 import tempfile
+import threading
+from collections import OrderedDict
 from copy import deepcopy
 
 import numpy as np
@@ -23,6 +25,127 @@ from ocgis.util.helpers import iter_array, get_iter
 SpatialReference = osr.SpatialReference
 
 
+class SpatialReferenceCache(AbstractOcgisObject):
+    """
+    Thread-safe least recently used cache for spatial references, coordinate transformations, and coordinate system
+    comparisons. Spatial references are keyed by PROJ.4 string or EPSG code and are shared between threads. They must
+    not be modified. Coordinate transformations and PROJ.4 projections are not thread-safe and are cached in
+    thread-local storage.
+
+    :param int max_entries: The maximum number of cached entries.
+    """
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def clear(self):
+        """Remove all cached entries."""
+
+        with self._lock:
+            self._entries.clear()
+            # Replacing the thread-local storage removes the entries of all threads.
+            self._local = threading.local()
+
+    def get_equal(self, key, func):
+        """
+        Get a memoized coordinate system comparison.
+
+        :param tuple key: Hashable key uniquely identifying the compared coordinate systems.
+        :param func: Callable with no arguments performing the comparison if it is not cached.
+        :rtype: bool
+        """
+
+        return self._get_('equal', key, func)
+
+    def get_proj(self, proj4):
+        """
+        :param str proj4: The PROJ.4 string.
+        :rtype: :class:`pyproj.Proj`
+        """
+
+        from pyproj import Proj
+        return self._get_thread_local_('proj', proj4, lambda: Proj(proj4))
+
+    def get_spatial_reference(self, definition):
+        """
+        :param definition: The PROJ.4 string or EPSG code.
+        :type definition: str | int
+        :rtype: :class:`osr.SpatialReference`
+        """
+
+        def _create_():
+            ret = SpatialReference()
+            if isinstance(definition, six.string_types):
+                ret.ImportFromProj4(definition)
+            else:
+                ret.ImportFromEPSG(definition)
+            return ret
+
+        return self._get_('spatial_reference', definition, _create_)
+
+    def get_transformation(self, from_proj4, to_proj4):
+        """
+        :param str from_proj4: The source PROJ.4 string.
+        :param str to_proj4: The destination PROJ.4 string.
+        :rtype: :class:`osr.CoordinateTransformation`
+        """
+
+        def _create_():
+            return osr.CoordinateTransformation(self.get_spatial_reference(from_proj4),
+                                                self.get_spatial_reference(to_proj4))
+
+        return self._get_thread_local_('transformation', (from_proj4, to_proj4), _create_)
+
+    def _get_(self, kind, key, func):
+        entry_key = (kind, key)
+        with self._lock:
+            ret = self._entries.pop(entry_key, None)
+            if ret is not None:
+                # Add the entry to the end to mark it as most recently used.
+                self._entries[entry_key] = ret
+
+        if ret is None:
+            # Create outside the lock. Concurrent creation of the same entry is harmless.
+            ret = func()
+            with self._lock:
+                self._entries[entry_key] = ret
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return ret
+
+    def _get_thread_local_(self, kind, key, func):
+        local = self._local
+        entries = getattr(local, 'entries', None)
+        if entries is None:
+            entries = local.entries = OrderedDict()
+
+        entry_key = (kind, key)
+        ret = entries.pop(entry_key, None)
+        if ret is None:
+            ret = func()
+        # Add the entry to the end to mark it as most recently used.
+        entries[entry_key] = ret
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+        return ret
+
+
+#: The process-wide spatial reference cache.
+_SPATIAL_REFERENCE_CACHE = SpatialReferenceCache(constants.SPATIAL_REFERENCE_CACHE_SIZE)
+
+
+def get_spatial_reference_cache():
+    """
+    :return: The process-wide spatial reference cache.
+    :rtype: :class:`~ocgis.variable.crs.SpatialReferenceCache`
+    """
+
+    return _SPATIAL_REFERENCE_CACHE
+
+
 @six.add_metaclass(abc.ABCMeta)
 class AbstractCRS(AbstractInterfaceObject):
     """
@@ -477,8 +600,7 @@ class CoordinateReferenceSystem(AbstractProj4CRS, AbstractInterfaceObject):
             if proj4 is not None:
                 value = from_string(proj4)
             elif epsg is not None:
-                sr = SpatialReference()
-                sr.ImportFromEPSG(epsg)
+                sr = get_spatial_reference_cache().get_spatial_reference(epsg)
                 value = from_string(sr.ExportToProj4())
             else:
                 msg = 'A value dictionary, PROJ.4 string, or EPSG code is required.'
@@ -495,8 +617,7 @@ class CoordinateReferenceSystem(AbstractProj4CRS, AbstractInterfaceObject):
                     except AttributeError:
                         continue
 
-        sr = SpatialReference()
-        sr.ImportFromProj4(to_string(value))
+        sr = get_spatial_reference_cache().get_spatial_reference(to_string(value))
         self.value = from_string(sr.ExportToProj4())
 
         try:
@@ -507,18 +628,9 @@ class CoordinateReferenceSystem(AbstractProj4CRS, AbstractInterfaceObject):
 
     def __eq__(self, other):
         try:
-            if self.sr.IsSame(other.sr) == 1:
-                ret = True
-            else:
-                # Try a value comparison.
-                if self.value == other.value:
-                    ret = True
-                else:
-                    # Try without the "wktext" flag.
-                    new_values = [self.value.copy(), other.value.copy()]
-                    for n in new_values:
-                        n.pop('wktext', None)
-                    ret = new_values[0] == new_values[1]
+            # Comparisons depend only on the coordinate system values and are memoized.
+            key = (repr(sorted(self.value.items())), repr(sorted(other.value.items())))
+            ret = get_spatial_reference_cache().get_equal(key, lambda: self._get_is_equal_(other))
         except AttributeError:
             # likely a nonetype of other object type
             if other is None or not isinstance(other, self.__class__):
@@ -569,9 +681,11 @@ class CoordinateReferenceSystem(AbstractProj4CRS, AbstractInterfaceObject):
 
     @property
     def sr(self):
-        sr = SpatialReference()
-        sr.ImportFromProj4(to_string(self.value))
-        return sr
+        """
+        :return: The cached spatial reference for the coordinate system. It is shared and should not be modified.
+        :rtype: :class:`osr.SpatialReference`
+        """
+        return get_spatial_reference_cache().get_spatial_reference(to_string(self.value))
 
     @property
     def shape(self):
@@ -632,6 +746,21 @@ class CoordinateReferenceSystem(AbstractProj4CRS, AbstractInterfaceObject):
                 ret = self.write_to_rootgrp(*args)
             return ret
 
+    def _get_is_equal_(self, other):
+        if self.sr.IsSame(other.sr) == 1:
+            ret = True
+        else:
+            # Try a value comparison.
+            if self.value == other.value:
+                ret = True
+            else:
+                # Try without the "wktext" flag.
+                new_values = [self.value.copy(), other.value.copy()]
+                for n in new_values:
+                    n.pop('wktext', None)
+                ret = new_values[0] == new_values[1]
+        return ret
+
 
 class CRS(CoordinateReferenceSystem):
     """Here for convenience."""
@@ -1188,6 +1317,22 @@ def create_crs(value, **kwargs):
     return ret
 
 
+def get_coordinate_transformation(from_crs, to_crs):
+    """
+    Get a coordinate transformation between two coordinate systems. Transformations are cached by
+    :class:`~ocgis.variable.crs.SpatialReferenceCache` so repeated transformations between the same coordinate systems
+    in a thread reuse the same object.
+
+    :param from_crs: The source coordinate system.
+    :type from_crs: :class:`~ocgis.variable.crs.CoordinateReferenceSystem`
+    :param to_crs: The destination coordinate system.
+    :type to_crs: :class:`~ocgis.variable.crs.CoordinateReferenceSystem`
+    :rtype: :class:`osr.CoordinateTransformation`
+    """
+
+    return get_spatial_reference_cache().get_transformation(to_string(from_crs.value), to_string(to_crs.value))
+
+
 def get_lonlat_rotated_pole_transform(lon, lat, transform, inverse=False, is_vectorized=False):
     """
     Transform longitude and latitude coordinates to/from their rotated pole representation.
@@ -1252,3 +1397,33 @@ def get_lonlat_rotated_pole_transform(lon, lat, transform, inverse=False, is_vec
     rlat = rlon_rlat[:, 1]
 
     return rlon, rlat
+
+
+def transform_coordinates(coordinates, from_crs, to_crs):
+    """
+    Transform a coordinate array between coordinate systems. Coordinates are transformed in blocks of
+    :attr:`ocgis.constants.COORDINATE_TRANSFORM_BLOCK_SIZE` to limit the size of the intermediate point sequences.
+
+    :param coordinates: Two-dimensional array with shape ``(n, 2)`` or ``(n, 3)``.
+    :type coordinates: :class:`numpy.ndarray`
+    :param from_crs: The source coordinate system.
+    :type from_crs: :class:`~ocgis.variable.crs.CoordinateReferenceSystem`
+    :param to_crs: The destination coordinate system.
+    :type to_crs: :class:`~ocgis.variable.crs.CoordinateReferenceSystem`
+    :return: The transformed coordinates with the same shape as ``coordinates``.
+    :rtype: :class:`numpy.ndarray`
+    """
+
+    if coordinates.shape[0] == 0:
+        ret = coordinates.copy()
+    else:
+        transformation = get_coordinate_transformation(from_crs, to_crs)
+        ndim = coordinates.shape[1]
+        block_size = constants.COORDINATE_TRANSFORM_BLOCK_SIZE
+        ret = np.empty(coordinates.shape, dtype=float)
+        for start in range(0, coordinates.shape[0], block_size):
+            stop = start + block_size
+            transformed = transformation.TransformPoints(coordinates[start:stop].tolist())
+            # Transformed points always include a z-coordinate.
+            ret[start:stop] = np.array(transformed, dtype=float)[:, 0:ndim]
+    return ret
@@ -4,6 +4,7 @@ from copy import deepcopy
 from itertools import product
 
 import numpy as np
+import shapely
 from numpy.core.multiarray import ndarray
 from shapely import wkb
 from shapely.geometry import Point, Polygon, MultiPolygon, mapping, MultiPoint, box
@@ -26,7 +27,7 @@ from ocgis.util.addict import Dict
 from ocgis.util.helpers import iter_array, get_trimmed_array_by_mask, get_swap_chain, find_index, \
     iter_exploded_geometries, get_iter, get_extrapolated_corners_esmf, create_ocgis_corners_from_esmf_corners
 from ocgis.variable.base import get_dimension_lengths, ObjectType
-from ocgis.variable.crs import Cartesian
+from ocgis.variable.crs import Cartesian, transform_coordinates
 from ocgis.variable.dimension import create_distributed_dimension, Dimension
 from ocgis.variable.iterator import Iterator
 
@@ -729,19 +730,36 @@ class GeometryVariable(AbstractSpatialVariable):
                                                         original_mask=original_mask)
         return ret
 
-    def get_nearest(self, target, return_indices=False):
+    def get_nearest(self, target, return_indices=False, nearest_index=None):
         """
         :param target: The Shapely geometry to use for proximity.
         :type target: :class:`shapely.geometry.base.BaseGeometry`
         :param bool return_indices: If ``True``, also return the indices used for slicing the geometry variable.
+        :param nearest_index: If provided, use this index to find the element with the nearest centroid. Otherwise, the
+         element with the smallest distance to the target's centroid is selected.
+        :type nearest_index: :class:`~ocgis.spatial.nearest.NearestIndex`
         :return: shallow copy of the geometry variable and optionally slices
         :rtype: :class:`~ocgis.GeometryVariable` | ``(<geometry variable>, <slice>)``
         """
         target = target.centroid
-        distances = {}
-        for select_nearest_index, geom in iter_array(self.get_value(), return_value=True, mask=self.get_mask()):
-            distances[target.distance(geom)] = select_nearest_index
-        select_nearest_index = distances[min(distances.keys())]
+        if nearest_index is not None:
+            select_nearest_index = nearest_index.query_geometries(target)
+        elif env.USE_VECTORIZED_GEOMETRY:
+            value = self.get_value().reshape(-1)
+            mask = self.get_mask()
+            if mask is None:
+                candidates = np.arange(value.size)
+            else:
+                candidates = np.flatnonzero(np.invert(mask.reshape(-1)))
+            distances = shapely.distance(target, value[candidates])
+            # Ties are resolved using the last element to match the iterative approach.
+            select_nearest_index = candidates[np.flatnonzero(distances == distances.min())[-1]]
+            select_nearest_index = tuple([int(ii) for ii in np.unravel_index(select_nearest_index, self.shape)])
+        else:
+            distances = {}
+            for select_nearest_index, geom in iter_array(self.get_value(), return_value=True, mask=self.get_mask()):
+                distances[target.distance(geom)] = select_nearest_index
+            select_nearest_index = distances[min(distances.keys())]
         ret = self[select_nearest_index]
 
         if return_indices:
@@ -749,6 +767,44 @@ class GeometryVariable(AbstractSpatialVariable):
 
         return ret
 
+    def get_nearest_index(self, spherical=None):
+        """
+        Create a nearest neighbor index from the geometry centroids. Build the index once and reuse it for repeated
+        nearest neighbor queries.
+
+        :param bool spherical: If ``True``, use great-circle distances. If ``None``, use great-circle distances for
+         geographic coordinate systems.
+        :rtype: :class:`~ocgis.spatial.nearest.NearestIndex`
+        """
+        from ocgis.spatial.nearest import NearestIndex, get_is_spherical
+
+        if spherical is None:
+            spherical = get_is_spherical(self.crs)
+
+        value = self.get_value().reshape(-1)
+        mask = self.get_mask()
+        if mask is None:
+            mask = np.zeros(value.size, dtype=bool)
+        else:
+            mask = mask.reshape(-1).copy()
+        mask[[geom is None for geom in value]] = True
+        select = np.invert(mask)
+
+        x = np.zeros(value.size)
+        y = np.zeros(value.size)
+        if env.USE_VECTORIZED_GEOMETRY:
+            centroids = shapely.centroid(value[select])
+            x[select] = shapely.get_x(centroids)
+            y[select] = shapely.get_y(centroids)
+        else:
+            for idx in np.flatnonzero(select):
+                centroid = value[idx].centroid
+                x[idx] = centroid.x
+                y[idx] = centroid.y
+
+        return NearestIndex(x.reshape(self.shape), y.reshape(self.shape), mask=mask.reshape(self.shape),
+                            spherical=spherical)
+
     def get_report(self):
         if self.crs is None:
             projection = 'NA (no coordinate system)'
@@ -764,22 +820,48 @@ class GeometryVariable(AbstractSpatialVariable):
 
         return lines
 
-    def get_spatial_index(self, target=None):
+    def get_spatial_index(self, target=None, original_mask=None, cache_sources=None):
         """
+        If :attr:`ocgis.env.DIR_SPATIAL_INDEX_CACHE` is set and ``target`` is not provided, the spatial index is loaded
+        from or persisted to the spatial index cache when the geometries are sourced from file.
+
         :param target: If this is a boolean array, use this as the add target. Otherwise, use the compressed masked
          values.
         :type target: :class:`numpy.ndarray`
+        :param original_mask: If provided and ``target`` is ``None``, index the values not masked by this mask instead
+         of the variable's mask.
+        :type original_mask: :class:`numpy.ndarray`
+        :param cache_sources: The source variables used to key the spatial index cache. If ``None``, use the geometry
+         variable.
+        :type cache_sources: sequence of :class:`~ocgis.Variable`
         :return: spatial index for the geometry variable
         :rtype: :class:`rtree.index.Index`
         """
 
         # "rtree" is an optional dependency.
-        from ocgis.spatial.index import SpatialIndex
-        # Fill the spatial index with unmasked values only.
-        si = SpatialIndex()
+        from ocgis.spatial.index import SpatialIndex, get_spatial_index_cache
+
         # Use compressed masked values if target is not available.
         if target is None:
-            target = self.get_masked_value().compressed()
+            if original_mask is None:
+                original_mask = self.get_mask()
+            target = np.ma.array(self.get_value(), mask=original_mask).compressed()
+
+            cache = get_spatial_index_cache()
+            if cache is not None and target.size > 0:
+                if cache_sources is None:
+                    cache_sources = [self]
+                bounds = get_bounds_array(target)
+                cache_key = cache.get_key(cache_sources, mask=original_mask, tag=self.name, crs=self.crs,
+                                          bounds=bounds)
+                if cache_key is not None:
+                    si = cache.get(cache_key[0])
+                    if si is None:
+                        si = cache.create(cache_key[0], cache_key[1], bounds)
+                    return si
+
+        # Fill the spatial index with unmasked values only.
+        si = SpatialIndex()
         # Add the geometries to the index.
         r_add = si.add
         for idx, geom in iter_array(target, return_value=True):
@@ -1059,15 +1141,18 @@ class GeometryVariable(AbstractSpatialVariable):
         elif self.crs != to_crs:
             # Be sure and project masked geometries to maintain underlying geometries.
             r_value = self.get_value().reshape(-1)
-            r_loads = wkb.loads
-            r_create = ogr.CreateGeometryFromWkb
-            to_sr = to_crs.sr
-            from_sr = self.crs.sr
-            for idx, geom in enumerate(r_value.flat):
-                ogr_geom = r_create(geom.wkb)
-                ogr_geom.AssignSpatialReference(from_sr)
-                ogr_geom.TransformTo(to_sr)
-                r_value[idx] = r_loads(ogr_geom.ExportToWkb())
+            if env.USE_VECTORIZED_GEOMETRY:
+                update_geometry_coordinates_crs(r_value, self.crs, to_crs)
+            else:
+                r_loads = wkb.loads
+                r_create = ogr.CreateGeometryFromWkb
+                to_sr = to_crs.sr
+                from_sr = self.crs.sr
+                for idx, geom in enumerate(r_value.flat):
+                    ogr_geom = r_create(geom.wkb)
+                    ogr_geom.AssignSpatialReference(from_sr)
+                    ogr_geom.TransformTo(to_sr)
+                    r_value[idx] = r_loads(ogr_geom.ExportToWkb())
         # Even if coordinate systems are measured equivalent, for consistency the new crs is the destination CRS.
         self.crs = to_crs
 
@@ -1337,21 +1422,86 @@ def geometryvariable_get_mask_from_intersects(gvar, geometry, use_spatial_index=
     geometry_target = np.ma.array(gvar.get_value(), mask=original_mask).compressed()
 
     if use_spatial_index:
-        si = gvar.get_spatial_index(target=geometry_target)
+        si = gvar.get_spatial_index(original_mask=original_mask)
         # Return the indices of the geometries intersecting the target geometry, and update the mask accordingly.
-        for idx in si.iter_intersects(geometry, geometry_target, keep_touches=keep_touches):
-            ref_fill_mask[global_index[idx]] = False
+        try:
+            for idx in si.iter_intersects(geometry, geometry_target, keep_touches=keep_touches):
+                ref_fill_mask[global_index[idx]] = False
+        finally:
+            # Release the index files of cached indexes.
+            si.close()
     else:
-        # Prepare the polygon for faster spatial operations.
-        prepared = prep(geometry)
-        # We are not keeping touches at this point. Remember the mask is an inverse.
-        for idx, geom in iter_array(geometry_target, return_value=True):
-            bool_value = False
-            if prepared.intersects(geom):
-                if not keep_touches and geometry.touches(geom):
-                    bool_value = True
-            else:
-                bool_value = True
-            ref_fill_mask[global_index[idx]] = bool_value
+        # Remember the mask is an inverse.
+        intersects = get_intersects_array(geometry_target, geometry, keep_touches=keep_touches)
+        ref_fill_mask[global_index] = np.invert(intersects)
 
     return fill
+
+
+def get_bounds_array(geometries):
+    """
+    :param geometries: One-dimensional object array of Shapely geometries.
+    :type geometries: :class:`numpy.ndarray`
+    :return: Two-dimensional array of geometry bounds with rows ``(minx, miny, maxx, maxy)``.
+    :rtype: :class:`numpy.ndarray`
+    """
+
+    if env.USE_VECTORIZED_GEOMETRY:
+        ret = shapely.bounds(geometries)
+    else:
+        ret = np.array([geom.bounds for geom in geometries], dtype=float).reshape(-1, 4)
+    return ret
+
+
+def get_intersects_array(geometries, subset_geometry, keep_touches=False):
+    """
+    Evaluate the intersects predicate for an array of geometries in a single call. This is the bulk equivalent of
+    :meth:`~ocgis.variable.geom.GeometryProcessor.iter_intersects`.
+
+    :param geometries: Object array of Shapely geometries. ``None`` elements never intersect.
+    :type geometries: :class:`numpy.ndarray`
+    :param subset_geometry: The geometry used to test for intersection.
+    :type subset_geometry: :class:`shapely.geometry.base.BaseGeometry`
+    :param bool keep_touches: If ``True``, keep geometries that only touch the subset geometry.
+    :return: boolean array with the same shape as ``geometries`` with intersecting elements set to ``True``
+    :rtype: :class:`numpy.ndarray`
+    """
+
+    if env.USE_VECTORIZED_GEOMETRY:
+        # Predicates are evaluated against the prepared geometry when it is the first argument.
+        shapely.prepare(subset_geometry)
+        ret = shapely.intersects(subset_geometry, geometries)
+        if not keep_touches:
+            # Only the intersecting geometries may touch.
+            ret[ret] = np.invert(shapely.touches(subset_geometry, geometries[ret]))
+    else:
+        ret = np.zeros(geometries.shape, dtype=bool)
+        prepared = prep(subset_geometry)
+        for idx, geom in iter_array(geometries, return_value=True, use_mask=False):
+            if geom is not None and prepared.intersects(geom):
+                ret[idx] = keep_touches or not subset_geometry.touches(geom)
+    return ret
+
+
+def update_geometry_coordinates_crs(geometries, from_crs, to_crs):
+    """
+    Transform geometry coordinates between coordinate systems in-place. Coordinates for all geometries are transformed
+    with one call for two-dimensional geometries and one call for three-dimensional geometries.
+
+    :param geometries: One-dimensional object array of geometries. The array is updated in-place.
+    :type geometries: :class:`numpy.ndarray`
+    :param from_crs: The source coordinate system.
+    :type from_crs: :class:`~ocgis.variable.crs.CoordinateReferenceSystem`
+    :param to_crs: The destination coordinate system.
+    :type to_crs: :class:`~ocgis.variable.crs.CoordinateReferenceSystem`
+    """
+
+    has_z = shapely.has_z(geometries)
+    for include_z in (False, True):
+        select = has_z == include_z
+        if not select.any():
+            continue
+        sub = geometries[select]
+        coordinates = shapely.get_coordinates(sub, include_z=include_z)
+        coordinates = transform_coordinates(coordinates, from_crs, to_crs)
+        geometries[select] = shapely.set_coordinates(sub, coordinates)
@@ -199,6 +199,61 @@ class Iterator(AbstractOcgisObject):
     def get_repeaters(self, headers_only=False, found=None):
         return get_repeaters(self, headers_only=headers_only, found=found)
 
+    def iter_blocks(self, block_size):
+        """
+        Yield blocks of records as columns. Records, their order, and their masked value handling are the same as
+        iterating the object. Values are formatted once for each element of an iterator's value array and gathered
+        for the block's records using array indexing.
+
+        :param int block_size: The number of lead variable elements in each block. Melted blocks contain
+         ``block_size * len(melted)`` records.
+        :returns: An ordered dictionary mapping record keys to column value lists. Empty blocks are not yielded.
+        :rtype: :class:`collections.OrderedDict`
+        """
+
+        iterators = self.iterators
+        shape = self.shape
+        total = int(np.prod(shape))
+        tables = [get_element_table(itr) for itr in iterators]
+        melted = self.melted
+
+        for start in range(0, total, block_size):
+            flat = np.arange(start, min(start + block_size, total))
+            multi = np.unravel_index(flat, shape)
+
+            # Flat element indices of each iterator's value array for the block's records.
+            element_indices = []
+            for itr in iterators:
+                if itr.slice_remap is None:
+                    sub = multi
+                else:
+                    sub = tuple([multi[ii] for ii in itr.slice_remap])
+                if len(sub) == 0:
+                    element_indices.append(np.zeros(flat.shape[0], dtype=int))
+                else:
+                    element_indices.append(np.ravel_multi_index(sub, np.shape(itr.value)))
+
+            if not self.allow_masked:
+                skip = np.zeros(flat.shape[0], dtype=bool)
+                for (_, itr_skip), eidx in zip(tables, element_indices):
+                    if itr_skip is not None:
+                        skip = np.logical_or(skip, itr_skip[eidx])
+                if skip.any():
+                    element_indices = [eidx[np.invert(skip)] for eidx in element_indices]
+            nrecords = element_indices[0].shape[0]
+            if nrecords == 0:
+                continue
+
+            columns = OrderedDict()
+            for (table, _), eidx in zip(tables, element_indices):
+                for key, column in table:
+                    columns[key] = column(eidx)
+
+            if melted is not None and len(iterators) > 1:
+                columns = get_melted_columns(columns, melted, self.melted_repeaters, nrecords)
+
+            yield columns
+
 
 def get_record(idx, value, mask):
     asscalar = np.asscalar
@@ -217,6 +272,133 @@ def get_record(idx, value, mask):
     return ret_value, ret_mask
 
 
+def get_element_table(iterator):
+    """
+    Format the elements of an iterator's value array.
+
+    :param iterator: The target iterator.
+    :type iterator: :class:`~ocgis.variable.iterator.Iterator`
+    :returns: A tuple. The first element is a sequence of ``(<key>, <function>)`` tuples. Each function returns a
+     column value list when called with an array of flat element indices. The second element is a boolean array
+     indicating elements skipped by record iteration or ``None`` if no elements are skipped.
+    :rtype: tuple
+    """
+
+    from ocgis.driver.base import AbstractDriver
+
+    name = iterator.variable.name
+    value = np.asarray(iterator.value).reshape(-1)
+    if iterator.mask is None:
+        mask = np.zeros(value.shape[0], dtype=bool)
+    else:
+        mask = np.asarray(iterator.mask).reshape(-1)
+
+    if not iterator.allow_masked and iterator.primary_mask == name and mask.any():
+        skip = mask
+    else:
+        skip = None
+
+    table = []
+    if iterator.repeaters is not None:
+        for key, repeated in iterator.repeaters:
+            table.append((key, _get_constant_column_(repeated)))
+
+    formatter = iterator.formatter
+    # The default driver formatter returns values unchanged.
+    if formatter is AbstractDriver.iterator_formatter:
+        formatter = None
+
+    if formatter is None:
+        clobber = mask if iterator.clobber_masked and mask.any() else None
+        table.append((name, _get_value_column_(value, clobber)))
+    else:
+        formatted = OrderedDict()
+        elements = value.tolist()
+        for idx, element in enumerate(elements):
+            element_mask = bool(mask[idx])
+            if element_mask and iterator.clobber_masked:
+                element = None
+            for key, formatted_value in formatter(name, element, element_mask):
+                if key not in formatted:
+                    formatted[key] = np.empty(value.shape[0], dtype=object)
+                formatted[key][idx] = formatted_value
+        for key, formatted_value in formatted.items():
+            table.append((key, _get_value_column_(formatted_value, None)))
+
+    return table, skip
+
+
+def get_melted_columns(columns, melted, melted_repeaters, nrecords):
+    """
+    Convert record columns to melted record columns. Each record is repeated for every melted variable in the same
+    order as record iteration.
+
+    :param columns: Record columns from :meth:`~ocgis.variable.iterator.Iterator.iter_blocks`.
+    :type columns: :class:`collections.OrderedDict`
+    :param sequence melted: The melted variable names.
+    :param dict melted_repeaters: Maps melted variable names to their repeaters. May be ``None``.
+    :param int nrecords: The number of records in the columns.
+    :rtype: :class:`collections.OrderedDict`
+    """
+
+    nmelted = len(melted)
+    melted_values = [columns.pop(m) for m in melted]
+
+    ret = OrderedDict()
+    for key, column in columns.items():
+        ret[key] = [v for v in column for _ in range(nmelted)]
+
+    # Melted repeaters persist in the record for subsequent melted variables.
+    states = []
+    new_keys = [[] for _ in range(nmelted)]
+    current = OrderedDict()
+    for midx, m in enumerate(melted):
+        if melted_repeaters is not None:
+            for key, repeated in melted_repeaters.get(m, []):
+                if key not in current and key not in columns:
+                    new_keys[midx].append(key)
+                current[key] = repeated
+        states.append(current.copy())
+
+    def _update_repeated_(key):
+        original = columns.get(key, [None] * nrecords)
+        column = []
+        for ridx in range(nrecords):
+            for state in states:
+                column.append(state[key] if key in state else original[ridx])
+        ret[key] = column
+
+    for key in current:
+        if key in columns:
+            _update_repeated_(key)
+    for midx in range(nmelted):
+        for key in new_keys[midx]:
+            _update_repeated_(key)
+        if midx == 0:
+            ret[HeaderName.VARIABLE] = list(melted) * nrecords
+            ret[HeaderName.VALUE] = [melted_values[vidx][ridx] for ridx in range(nrecords) for vidx in range(nmelted)]
+
+    return ret
+
+
+def _get_constant_column_(value):
+    def _column_(element_indices):
+        return [value] * element_indices.shape[0]
+
+    return _column_
+
+
+def _get_value_column_(value, clobber):
+    def _column_(element_indices):
+        ret = value[element_indices].tolist()
+        if clobber is not None:
+            for idx in np.flatnonzero(clobber[element_indices]):
+                ret[idx] = None
+        return ret
+
+    return _column_
+
+
 def get_followers(followers, found=None):
     if found is None:
         found = []
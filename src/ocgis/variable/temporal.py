@@ -460,7 +460,103 @@ class TemporalVariable(SourcedVariable):
 
     def _get_grouping_other_(self, grouping):
         """
-        Applied to groups other than 'all'.
+        Applied to groups other than 'all'. Group membership is computed with integer array operations on the date parts.
+        """
+
+        # Reference the value and bounds datetime object arrays. Bounds are not used for the grouping mechanism but
+        # determine the bounds of the new temporal groups.
+        value_datetime = np.ma.getdata(self.value_datetime).reshape(-1)
+        value_numtime = np.ma.getdata(self.value_numtime).reshape(-1)
+        if self.has_bounds:
+            bounds_datetime = np.ma.getdata(self.bounds.value_datetime)
+            bounds_numtime = np.ma.getdata(self.bounds.value_numtime)
+        else:
+            bounds_datetime = np.hstack([value_datetime.reshape(-1, 1)] * 2)
+            bounds_numtime = np.hstack([value_numtime.reshape(-1, 1)] * 2)
+
+        # Extract the date parts.
+        parts = get_datetime_parts(value_datetime)
+
+        # Grouping is different for date part combinations v. seasonal aggregation.
+        if all([isinstance(ii, six.string_types) for ii in grouping]):
+            # Date part columns in storage order. Unique combinations are sorted lexicographically by these columns.
+            idx_cmp = sorted([self._date_parts.index(group) for group in grouping])
+            unique_parts, group_ids = np.unique(parts[:, idx_cmp], axis=0, return_inverse=True)
+            group_ids = group_ids.reshape(-1)
+
+            select = np.empty((unique_parts.shape[0], len(self._date_parts)), dtype=object)
+            select[:, idx_cmp] = unique_parts
+            dgroups = deque([group_ids == idx for idx in range(select.shape[0])])
+            # Time indices for each group in ascending order.
+            order = np.argsort(group_ids, kind='mergesort')
+            splits = np.searchsorted(group_ids[order], np.arange(1, select.shape[0]))
+            group_members = np.split(order, splits)
+            new_value = np.empty((len(dgroups),), dtype=[(dp, object) for dp in self._date_parts])
+            for idx in range(select.shape[0]):
+                new_value[idx] = tuple(select[idx])
+        # This is for seasonal aggregations.
+        else:
+            # We need to remove the year string from the grouping and do not want to modify the original list.
+            grouping = list(deepcopy(grouping))
+            # Search for a year flag, which will break the temporal groups by years.
+            if 'year' in grouping:
+                has_year = True
+                grouping.remove('year')
+                years = np.unique(parts[:, 0])
+            else:
+                has_year = False
+                years = [None]
+
+            # Sort the seasons to ensure they are in ascending order.
+            grouping = get_sorted_seasons(grouping, method='min')
+            season_members = [np.isin(parts[:, 1], season) for season in grouping]
+
+            dgroups = deque()
+            grouping_season = deque()
+            for year in years:
+                if has_year:
+                    year_members = parts[:, 0] == year
+                for season, season_member in zip(grouping, season_members):
+                    if has_year:
+                        subgroup = np.logical_and(season_member, year_members)
+                    else:
+                        subgroup = season_member.copy()
+                    dgroups.append(subgroup)
+                    grouping_season.append([season, year])
+            grouping = grouping_season
+            group_members = [np.nonzero(dgrp)[0] for dgrp in dgroups]
+
+            new_value = np.empty((len(dgroups),), dtype=[('months', object), ('year', int)])
+            for idx, (season, year) in enumerate(grouping):
+                if year is None:
+                    # There is no year associated with the seasonal aggregation.
+                    new_value[idx]['months'] = season
+                else:
+                    new_value[idx] = (season, year)
+
+        # The group bounds are the minimum and maximum of the value and bounds data. Compare using the numeric time.
+        new_bounds = np.empty((len(dgroups), 2), dtype=object)
+        lower_column = np.argmin(bounds_numtime, axis=1)
+        upper_column = np.argmax(bounds_numtime, axis=1)
+        lower_numtime = np.min(bounds_numtime, axis=1)
+        upper_numtime = np.max(bounds_numtime, axis=1)
+        for idx, members in enumerate(group_members):
+            lower = members[np.argmin(lower_numtime[members])]
+            upper = members[np.argmax(upper_numtime[members])]
+            new_bounds[idx, :] = [bounds_datetime[lower, lower_column[lower]],
+                                  bounds_datetime[upper, upper_column[upper]]]
+
+        new_bounds = np.atleast_2d(new_bounds).reshape(-1, 2)
+        date_parts = np.atleast_1d(new_value)
+        # This is the representative center time for the temporal group.
+        repr_dt = self._get_grouping_representative_datetime_(grouping, new_bounds, date_parts)
+
+        return new_bounds, date_parts, repr_dt, dgroups
+
+    def _get_grouping_other_iterative_(self, grouping):
+        """
+        Applied to groups other than 'all'. This is the original element-wise implementation retained for comparison
+        with :meth:`~TemporalVariable._get_grouping_other_`.
         """
 
         # map date parts to index positions in date part storage array and flip
@@ -838,6 +934,36 @@ def get_datetime_from_template_time_units(vec):
     return fill
 
 
+def get_datetime_parts(value_datetime):
+    """
+    Extract the date parts from an array of datetime-like objects.
+
+    :param value_datetime: One-dimensional array of datetime-like objects.
+    :type value_datetime: :class:`numpy.ndarray`
+    :return: integer array with shape ``(<time count>, 6)`` with columns year, month, day, hour, minute, and second
+    :rtype: :class:`numpy.ndarray`
+    """
+
+    try:
+        # Standard datetime objects are converted to NumPy datetimes allowing the parts to be computed on the array.
+        if not all([type(dt) == datetime.datetime for dt in value_datetime]):
+            raise TypeError
+        dt64 = np.array(value_datetime, dtype='datetime64[s]')
+    except (TypeError, ValueError):
+        ret = np.array([[dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second] for dt in value_datetime],
+                       dtype=int).reshape(-1, 6)
+    else:
+        ret = np.empty((dt64.shape[0], 6), dtype=int)
+        units = ['Y', 'M', 'D', 'h', 'm', 's']
+        truncated = [dt64.astype('datetime64[{}]'.format(u)) for u in units]
+        ret[:, 0] = truncated[0].astype(int) + 1970
+        ret[:, 1] = (truncated[1] - truncated[0]).astype(int) + 1
+        ret[:, 2] = (truncated[2] - truncated[1]).astype(int) + 1
+        for idx in range(3, 6):
+            ret[:, idx] = (truncated[idx] - truncated[idx - 1]).astype(int)
+    return ret
+
+
 def get_datetime_or_netcdftime(*args, **kwargs):
     if env.PREFER_NETCDFTIME:
         try:
@@ -106,6 +106,8 @@ class OcgDist(AbstractOcgisObject):
             self.mapping[rank] = create_template_rank_dict()
 
         self.has_updated_dimensions = False
+        # Maps group keys to source chunk sizes of the group's dimensions.
+        self._chunk_sizes = {}
 
     def add_dimension(self, dim, group=None, force=False):
         from ocgis import Dimension
@@ -238,6 +240,18 @@ class OcgDist(AbstractOcgisObject):
     def get_group(self, group=None, rank=MPI_RANK):
         return self._create_or_get_group_(group, rank=rank)
 
+    def set_chunk_sizes(self, chunk_sizes, group=None):
+        """
+        Set source chunk sizes for a group's dimensions. Local bounds of distributed dimensions are aligned to chunk
+        boundaries if there is at least one chunk per rank.
+
+        :param dict chunk_sizes: Maps dimension source names to their source chunk sizes.
+        :param group: The group containing the dimensions.
+        :type group: str | sequence
+        """
+
+        self._chunk_sizes[self._get_group_key_(group)] = dict(chunk_sizes)
+
     def iter_groups(self, rank=MPI_RANK):
         from ocgis.driver.base import iter_all_group_keys
         mapping = self.mapping[rank]
@@ -262,7 +276,7 @@ class OcgDist(AbstractOcgisObject):
             ranks = [rank]
 
         for rank in ranks:
-            for _, group_data in self.iter_groups(rank=rank):
+            for group_key, group_data in self.iter_groups(rank=rank):
                 dimdict = group_data['dimensions']
 
                 # If there are no distributed dimensions, there is no work to be dome with MPI bounds.
@@ -294,7 +308,9 @@ class OcgDist(AbstractOcgisObject):
                 # Fix the global bounds.
                 distributed_dimension.bounds_global = (0, len(distributed_dimension))
                 # Use this to calculate the local bounds for a dimension.
-                bounds_local = get_rank_bounds(len(distributed_dimension), the_size, rank)
+                chunk_size = self._chunk_sizes.get(self._get_group_key_(group_key), {}).get(
+                    distributed_dimension.source_name)
+                bounds_local = get_rank_bounds(len(distributed_dimension), the_size, rank, chunk_size=chunk_size)
                 if bounds_local is not None:
                     from ocgis.variable.dimension import slice_source_index
                     start, stop = bounds_local
@@ -307,6 +323,15 @@ class OcgDist(AbstractOcgisObject):
 
         self.has_updated_dimensions = True
 
+    @staticmethod
+    def _get_group_key_(group):
+        if group is None or isinstance(group, six.string_types):
+            group = [group]
+        group = list(group)
+        if group[0] is not None:
+            group.insert(0, None)
+        return tuple(group)
+
     def _create_or_get_group_(self, group, rank=MPI_RANK):
         # Allow None and single string group selection.
         if group is None or isinstance(group, six.string_types):
@@ -407,12 +432,14 @@ def dict_get_or_create(ddict, key, default):
     return ret
 
 
-def get_rank_bounds(nelements, size, rank, esplit=None):
+def get_rank_bounds(nelements, size, rank, esplit=None, chunk_size=None):
     """
     :param nelements: The number of elements in the sequence to split.
     :param size: Processor count. If ``None`` use MPI size.
     :param rank: The process's rank. If ``None`` use the MPI rank.
     :param esplit: The split size. If ``None``, compute this internally.
+    :param chunk_size: If provided, split along boundaries of chunks with this size. Ignored if there are fewer chunks
+     than ranks or ``esplit`` is provided.
     :return: A tuple of lower and upper bounds using Python slicing rules. Returns ``None`` if no bounds are available
      for the rank. Also returns ``None`` in the case of zero length.
     :rtype: tuple or None
@@ -430,6 +457,15 @@ def get_rank_bounds(nelements, size, rank, esplit=None):
     if rank >= size:
         return
 
+    # Split whole chunks across ranks so no source chunk is read by more than one rank.
+    if chunk_size is not None and chunk_size > 1 and esplit is None:
+        nchunks = int(np.ceil(float(nelements) / chunk_size))
+        if nchunks >= size:
+            ret = get_rank_bounds(nchunks, size, rank)
+            if ret is not None:
+                ret = (ret[0] * chunk_size, min(ret[1] * chunk_size, nelements))
+            return ret
+
     # Case with more length than size. Do not take this route of a default split is provided.
     if nelements > size and esplit is None:
         nelements = int(nelements)